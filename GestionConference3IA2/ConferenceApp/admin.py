@@ -1,5 +1,24 @@
+import codecs
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from django import forms
 from django.contrib import admin
-from .models import Conference, Submission
+from django.contrib.admin import helpers
+from django.contrib.auth import get_permission_codename
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpResponse
+from django.shortcuts import render
+from django.urls import path
+from django.utils import timezone
+from GestionConference3IA2.admin_tools import (
+    CachedAllValuesFieldListFilter, CachedBooleanFieldListFilter, CachedChoicesFieldListFilter,
+    EstimatedCountPaginator, OptimisticAdminMixin,
+)
+from GestionConference3IA2.concurrency import VersionedModelForm, bump_version
+from .autocomplete import conference_index
+from .models import Conference, Review, Submission, SubmissionStatusEvent
+from .reconciliation import LEDGER_COLUMNS, reconcile_ledger
+from .signals import invalidate_analytics
 
 # Personnalisation générale de l'admin Django
 admin.site.site_title = "Gestion Conférence 25/26"
@@ -11,15 +30,59 @@ admin.site.index_title = "Django App Conférence"
 # ---------------------------
 class SubmissionInline(admin.TabularInline):
     model = Submission
+    form = VersionedModelForm  # version lue à l'ouverture (conflits d'édition)
     extra = 1  # une ligne vide par défaut
     readonly_fields = ("submission_date",)  # champ non modifiable
 
 
+# ---------------------------
+# Action : décider les N meilleures soumissions (classement des évaluations)
+# ---------------------------
+class DecideTopForm(forms.Form):
+    n = forms.IntegerField(label="Nombre de soumissions à accepter par conférence", min_value=0)
+    reject_others = forms.BooleanField(label="Refuser les autres soumissions évaluées", required=False)
+
+
+@admin.action(description="Décider les N meilleures soumissions", permissions=["decide"])
+def decide_top_submissions(modeladmin, request, queryset):
+    from .ranking import decide_top, get_rankings
+
+    conferences = list(queryset.order_by("name"))
+    form = DecideTopForm(request.POST if "apply" in request.POST else None)
+    if form.is_valid():
+        accepted = rejected = 0
+        for conference in conferences:
+            report = decide_top(conference.pk, form.cleaned_data["n"], form.cleaned_data["reject_others"])
+            accepted += report.accepted
+            rejected += report.rejected
+        modeladmin.message_user(request, f"{accepted} soumission(s) acceptée(s), {rejected} refusée(s).")
+        return None
+
+    # Page intermédiaire : aperçu du classement puis choix de N
+    rankings = get_rankings([conference.pk for conference in conferences])
+    titles = dict(
+        Submission.objects.filter(conference__in=conferences).values_list("submission_id", "title")
+    )
+    context = {
+        **modeladmin.admin_site.each_context(request),
+        "opts": modeladmin.model._meta,
+        "title": "Décider les N meilleures soumissions",
+        "form": form,
+        "queryset": conferences,
+        "sections": [
+            (conference, [{**row, "title": titles.get(row["submission_id"], "")} for row in rankings[conference.pk][:20]])
+            for conference in conferences
+        ],
+        "action_checkbox_name": helpers.ACTION_CHECKBOX_NAME,
+    }
+    return render(request, "admin/ConferenceApp/conference/decide_top.html", context)
+
+
 # ---------------------------
 # Admin du modèle Conference
 # ---------------------------
 @admin.register(Conference)
-class AdminConferenceModel(admin.ModelAdmin):
+class AdminConferenceModel(OptimisticAdminMixin, admin.ModelAdmin):
 
     # Colonnes affichées dans la liste
     list_display = ("name", "theme", "start_date", "end_date", "a")
@@ -27,19 +90,30 @@ class AdminConferenceModel(admin.ModelAdmin):
     # Tri par date
     ordering = ("start_date",)
 
-    # Filtres latéraux
-    list_filter = ("theme",)
+    # Filtres latéraux (compteurs mis en cache, index (theme, start_date))
+    list_filter = (("theme", CachedChoicesFieldListFilter),)
+
+    # Pas de COUNT(*) complet à chaque page (voir admin_tools)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     # Recherche
     search_fields = ("description", "name")
 
+    def get_search_results(self, request, queryset, search_term):
+        # Autocomplétion de l'admin (champ conference des soumissions) : index en mémoire
+        if search_term and request.resolver_match.url_name == "autocomplete":
+            pks = [pk for pk, _ in conference_index.search(search_term)]
+            return queryset.filter(pk__in=pks), False
+        return super().get_search_results(request, queryset, search_term)
+
     # Navigation temporelle
     date_hierarchy = "start_date"
 
     # Organisation du formulaire
     fieldsets = (
         ("Information générales", {
-            "fields": ("conference_id", "name", "theme", "description")
+            "fields": ("conference_id", "name", "theme", "description", "expected_version")
         }),
         ("Informations logistiques", {
             "fields": ("location", "start_date", "end_date")
@@ -59,6 +133,13 @@ class AdminConferenceModel(admin.ModelAdmin):
     # Inline pour afficher les Submissions liées
     inlines = [SubmissionInline]
 
+    actions = [decide_top_submissions]
+
+    def has_decide_permission(self, request):
+        # L'action modifie le statut des soumissions, pas la conférence
+        opts = Submission._meta
+        return request.user.has_perm(f"{opts.app_label}.{get_permission_codename('change', opts)}")
+
 
 # ---------------------------
 # Actions personnalisées
@@ -66,24 +147,55 @@ class AdminConferenceModel(admin.ModelAdmin):
 
 @admin.action(description="Marquer comme payées")
 def mark_as_payed(modeladmin, req, queryset):
-    queryset.update(payed=True)
+    queryset.update(payed=True, **bump_version())
+    invalidate_analytics()
 
 @admin.action(description="Marquer comme acceptées")
 def mark_as_accepted(modeladmin, req, queryset):
-    queryset.update(status="accepted")
+    # update() contournerait la machine à états, l'historique et les notifications
+    queryset.change_status("accepted")
+
+
+# ---------------------------
+# Inline : évaluations dans Submission
+# ---------------------------
+class ReviewInline(admin.TabularInline):
+    model = Review
+    extra = 0
+    raw_id_fields = ("reviewer",)
+    fields = ("reviewer", "score", "confidence", "comment")
+
+
+# ---------------------------
+# Formulaire d'upload de l'export comptable
+# ---------------------------
+class LedgerUploadForm(forms.Form):
+    ledger_file = forms.FileField(label="Export comptable (CSV)")
+    dry_run = forms.BooleanField(label="Vérifier sans marquer les paiements", required=False)
 
 
 # ---------------------------
 # Admin du modèle Submission
 # ---------------------------
 @admin.register(Submission)
-class SubmissionAdmin(admin.ModelAdmin):
+class SubmissionAdmin(OptimisticAdminMixin, admin.ModelAdmin):
+    change_list_template = "admin/ConferenceApp/submission/change_list.html"
 
     list_display = ("title", "status", "payed", "submission_date")
 
+    # Filtres latéraux (compteurs mis en cache, index sur status / payed)
+    list_filter = (("status", CachedChoicesFieldListFilter), ("payed", CachedBooleanFieldListFilter))
+
+    # Navigation par date (compteurs précalculés, voir DateBucket)
+    date_hierarchy = "submission_date"
+
+    # Pas de COUNT(*) complet à chaque page (voir admin_tools)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     fieldsets = (
         ("Information générales", {
-            "fields": ("title", "abstract", "keywords")
+            "fields": ("title", "abstract", "keywords", "expected_version")
         }),
         ("Document", {
             "fields": ("paper", "user", "conference")
@@ -93,5 +205,172 @@ class SubmissionAdmin(admin.ModelAdmin):
         })
     )
 
+    # Listes d'autocomplétion au lieu d'un <select> avec tous les utilisateurs / conférences
+    autocomplete_fields = ("user", "conference")
+
     # Ajout des actions
     actions = [mark_as_payed, mark_as_accepted]
+
+    inlines = [ReviewInline]
+
+    def save_model(self, request, obj, form, change):
+        # Origine enregistrée dans l'historique des statuts
+        obj._status_source = "admin"
+        super().save_model(request, obj, form, change)
+
+    def get_urls(self):
+        urls = [
+            path("reconcile/", self.admin_site.admin_view(self.reconcile),
+                 name="ConferenceApp_submission_reconcile"),
+            path("analytics/", self.admin_site.admin_view(self.analytics),
+                 name="ConferenceApp_submission_analytics"),
+            path("analytics/export/", self.admin_site.admin_view(self.analytics_export),
+                 name="ConferenceApp_submission_analytics_export"),
+        ]
+        return urls + super().get_urls()
+
+    def changelist_view(self, request, extra_context=None):
+        # Le bouton "Rapprocher" n'est affiché qu'aux utilisateurs qui peuvent marquer les paiements
+        extra_context = {"has_change_permission": self.has_change_permission(request), **(extra_context or {})}
+        return super().changelist_view(request, extra_context)
+
+    def reconcile(self, request):
+        # Le rapprochement marque des soumissions comme payées
+        if not self.has_change_permission(request):
+            raise PermissionDenied
+        report = None
+        if request.method == "POST":
+            form = LedgerUploadForm(request.POST, request.FILES)
+            if form.is_valid():
+                # Lecture en flux de l'upload
+                lines = codecs.iterdecode(form.cleaned_data["ledger_file"], "utf-8")
+                report = reconcile_ledger(lines, dry_run=form.cleaned_data["dry_run"])
+        else:
+            form = LedgerUploadForm()
+
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "form": form,
+            "columns": LEDGER_COLUMNS,
+            "report": report,
+            # Les 500 premiers problèmes (le rapport complet : manage.py reconcile_payments --report)
+            "problems": list(islice(report.rows(), 500)) if report else [],
+            "title": "Rapprocher les paiements",
+        }
+        return render(request, "admin/ConferenceApp/submission/reconcile.html", context)
+
+    def analytics(self, request):
+        # Import local : NumPy n'est chargé qu'à l'ouverture du rapport
+        from .analytics import DIMENSIONS, METRICS, get_report
+
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        report = get_report(refresh="refresh" in request.GET)
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "report": report,
+            "metrics": METRICS,
+            "sections": [
+                (dimension, label, report["dimensions"][dimension]) for dimension, label in DIMENSIONS.items()
+            ],
+            "title": "Statistiques des soumissions",
+        }
+        return render(request, "admin/ConferenceApp/submission/analytics.html", context)
+
+    def analytics_export(self, request):
+        from .analytics import DIMENSIONS, get_report, write_csv
+
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        dimension = request.GET.get("dimension")
+        if dimension is not None and dimension not in DIMENSIONS:
+            raise Http404("Dimension inconnue")
+        response = HttpResponse(content_type="text/csv; charset=utf-8")
+        response["Content-Disposition"] = f'attachment; filename="statistiques_{dimension or "soumissions"}.csv"'
+        write_csv(get_report(), response, [dimension] if dimension else None)
+        return response
+
+
+# ---------------------------
+# Formulaire du rapport sur l'historique des statuts
+# ---------------------------
+class StatusReportForm(forms.Form):
+    conference = forms.ModelChoiceField(queryset=Conference.objects.order_by("name"), required=False)
+    start = forms.DateField(label="Du", widget=forms.DateInput(attrs={"type": "date"}))
+    end = forms.DateField(label="Au (exclu)", widget=forms.DateInput(attrs={"type": "date"}))
+
+
+# ---------------------------
+# Admin de l'historique des statuts (lecture seule)
+# ---------------------------
+@admin.register(SubmissionStatusEvent)
+class SubmissionStatusEventAdmin(admin.ModelAdmin):
+    change_list_template = "admin/ConferenceApp/submissionstatusevent/change_list.html"
+    list_display = ("submission_id", "conference_id", "from_status", "to_status", "source", "timestamp")
+    list_filter = ("to_status", "source")
+    date_hierarchy = "timestamp"
+    # Pas de COUNT(*) complet de la table à chaque affichage
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        urls = [
+            path("report/", self.admin_site.admin_view(self.report),
+                 name="ConferenceApp_submissionstatusevent_report"),
+        ]
+        return urls + super().get_urls()
+
+    def report(self, request):
+        today = date.today()
+        form = StatusReportForm(request.GET or {"start": today - timedelta(days=7), "end": today + timedelta(days=1)})
+        counts, median = {}, None
+        if form.is_valid():
+            # Bornes à minuit (heure locale) pour rester sur l'index (..., timestamp)
+            start, end = (
+                timezone.make_aware(datetime.combine(form.cleaned_data[key], time.min))
+                for key in ("start", "end")
+            )
+            events = SubmissionStatusEvent.objects.between(
+                start=start,
+                end=end,
+                conference=form.cleaned_data["conference"],
+            )
+            counts = events.counts_by_status()
+            median = events.median_decision_time()
+
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "form": form,
+            "counts": counts,
+            "median": median,
+            "title": "Rapport des changements de statut",
+        }
+        return render(request, "admin/ConferenceApp/submissionstatusevent/report.html", context)
+
+
+# ---------------------------
+# Admin des évaluations
+# ---------------------------
+@admin.register(Review)
+class ReviewAdmin(admin.ModelAdmin):
+    list_display = ("submission_id", "reviewer_name", "score", "confidence", "update_at")
+    # Valeurs proposées (SELECT DISTINCT) et compteurs en cache
+    list_filter = (("score", CachedAllValuesFieldListFilter), ("confidence", CachedAllValuesFieldListFilter))
+    raw_id_fields = ("submission", "reviewer")
+    list_select_related = ("reviewer__user",)
+
+    @admin.display(description="Évaluateur")
+    def reviewer_name(self, obj):
+        return f"{obj.reviewer.user} ({obj.reviewer.commitee_role})"
@@ -0,0 +1,253 @@
+"""
+Statistiques des soumissions pour les chairs : taux d'acceptation, taux de
+paiement, soumissions par jour et délai de décision, par thème, conférence,
+affiliation et nationalité de l'auteur.
+
+Les colonnes sont lues en masse (values_list(...).iterator()) dans des
+tableaux NumPy, et chaque statistique groupée est un calcul vectorisé
+(bincount, tri, ufunc.at) : aucune boucle Python par soumission.
+NumPy n'est importé que par ce module (admin, commande analytics_report).
+"""
+
+import csv
+import time
+from itertools import islice
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import CharField, ExpressionWrapper, F, Field
+from django.db.models.functions import Cast
+from UserApp.models import User
+from .models import Conference, Submission, SubmissionStatusEvent
+from .signals import ANALYTICS_VERSION_KEY
+from .status import DECISIONS, STATUS_CODES
+
+
+# ============================
+# Paramètres (surchargeables dans settings.ANALYTICS)
+# ============================
+DEFAULTS = {
+    "CHUNK_SIZE": 50000,       # lignes lues par aller-retour avec la base
+    "CACHE_TIMEOUT": 3600,     # borne la durée de vie d'un résultat (la version l'invalide plus tôt)
+}
+
+DIMENSIONS = {
+    "theme": "Thème",
+    "conference": "Conférence",
+    "affiliation": "Affiliation",
+    "nationality": "Nationalité",
+}
+
+METRICS = [
+    ("submissions", "Soumissions"),
+    ("decided", "Décidées"),
+    ("acceptance_rate", "Taux d'acceptation"),
+    ("payed_rate", "Taux de paiement"),
+    ("per_day", "Soumissions / jour"),
+    ("decision_median_days", "Délai médian (jours)"),
+    ("decision_mean_days", "Délai moyen (jours)"),
+]
+
+RESULT_KEY = "analytics:result:{version}"
+
+# Statuts codés en petits entiers (mêmes codes que l'historique)
+STATUS_NAMES = np.array(sorted(STATUS_CODES))
+STATUS_VALUES = np.array([STATUS_CODES[name] for name in STATUS_NAMES])
+
+
+def analytics_setting(name):
+    return getattr(settings, "ANALYTICS", {}).get(name, DEFAULTS[name])
+
+
+def data_version():
+    # Incrémentée par invalidate_analytics() (signaux, actions de masse)
+    return cache.get_or_set(ANALYTICS_VERSION_KEY, 1, None)
+
+
+# ============================
+# LECTURE DES COLONNES
+# ============================
+def _columns(rows, dtypes, chunk_size):
+    """
+    Transpose le flux de tuples par lots (zip(*lot) est fait en C) et
+    renvoie une liste de tableaux NumPy, un par colonne.
+    """
+    parts = [[] for _ in dtypes]
+    while True:
+        batch = list(islice(rows, chunk_size))
+        if not batch:
+            break
+        for part, column, dtype in zip(parts, zip(*batch), dtypes):
+            part.append(np.array(column, dtype=dtype))
+    return [np.concatenate(part) if part else np.array([], dtype=dtype) for part, dtype in zip(parts, dtypes)]
+
+
+def _raw(name):
+    # Field() générique : la valeur renvoyée par le pilote n'est pas convertie
+    return ExpressionWrapper(F(name), output_field=Field())
+
+
+def _encode(values):
+    """ Codes entiers 0..k-1 et libellés d'une colonne catégorielle. """
+    labels, codes = np.unique(values, return_inverse=True)
+    return codes.ravel(), labels
+
+
+def load(chunk_size=None):
+    chunk_size = chunk_size or analytics_setting("CHUNK_SIZE")
+
+    conference_ids, conference_names, themes = _columns(
+        Conference.objects.order_by("pk").values_list("pk", "name", "theme").iterator(chunk_size=chunk_size),
+        [np.int64, object, str], chunk_size,
+    )
+    user_ids, affiliations, nationalities = _columns(
+        User.objects.order_by().values_list("pk", "affiliation", "nationality").iterator(chunk_size=chunk_size),
+        [str, str, str], chunk_size,
+    )
+    # Dates lues sous forme de texte ISO et booléen brut du pilote : aucun convertisseur
+    # Django appliqué ligne par ligne, NumPy analyse les colonnes entières en C
+    sub_conference, sub_user, status, payed, day = _columns(
+        Submission.objects.order_by().values_list(
+            "conference_id", "user_id", "status", _raw("payed"), Cast("submission_date", CharField()),
+        ).iterator(chunk_size=chunk_size),
+        [np.int64, str, str, bool, "datetime64[D]"], chunk_size,
+    )
+    # Délai soumission -> décision : les deux horodatages, soustraits par NumPy
+    decision_conference, decision_user, decided_at, submitted_at = _columns(
+        SubmissionStatusEvent.objects.filter(to_status__in=[STATUS_CODES[s] for s in DECISIONS])
+        .order_by()
+        .values_list(
+            "conference_id", "submission__user_id",
+            Cast("timestamp", CharField()), Cast("submission__created_at", CharField()),
+        ).iterator(chunk_size=chunk_size),
+        [np.int64, str, "datetime64[us]", "datetime64[us]"], chunk_size,
+    )
+
+    # Tables de correspondance (id -> ligne) par recherche dichotomique vectorisée
+    order = np.argsort(user_ids)
+    user_ids, affiliations, nationalities = user_ids[order], affiliations[order], nationalities[order]
+    theme_codes, theme_labels = _encode(themes)
+    affiliation_codes, affiliation_labels = _encode(affiliations)
+    nationality_codes, nationality_labels = _encode(nationalities)
+    status_codes = STATUS_VALUES[np.searchsorted(STATUS_NAMES, status)] if len(status) else status.astype(int)
+
+    def by_key(conference_col, user_col):
+        conference_row = np.searchsorted(conference_ids, conference_col)
+        user_row = np.searchsorted(user_ids, user_col)
+        return {
+            "theme": theme_codes[conference_row] if len(conference_ids) else conference_row,
+            "conference": conference_row,
+            "affiliation": affiliation_codes[user_row] if len(user_ids) else user_row,
+            "nationality": nationality_codes[user_row] if len(user_ids) else user_row,
+        }
+
+    labels = {
+        "theme": [dict(Conference.THEME).get(code, code) for code in theme_labels],
+        "conference": [f"{name} (#{pk})" for pk, name in zip(conference_ids, conference_names)],
+        "affiliation": list(affiliation_labels),
+        "nationality": list(nationality_labels),
+    }
+    return {
+        "labels": labels,
+        "submissions": by_key(sub_conference, sub_user),
+        "decisions": by_key(decision_conference, decision_user),
+        "status": status_codes,
+        "payed": payed,
+        "day": day,
+        "duration_days": (decided_at - submitted_at) / np.timedelta64(1, "D"),
+    }
+
+
+# ============================
+# STATISTIQUES GROUPÉES (vectorisées)
+# ============================
+def _grouped_median(codes, values, size):
+    """ Médiane par groupe : tri par (groupe, valeur), puis élément du milieu de chaque groupe. """
+    medians = np.full(size, np.nan)
+    if not len(values):
+        return medians
+    order = np.lexsort((values, codes))
+    counts = np.bincount(codes, minlength=size)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    present = counts > 0
+    middle = starts[present] + (counts[present] - 1) // 2
+    medians[present] = values[order][middle]
+    return medians
+
+
+def _per_dimension(data, dimension):
+    size = len(data["labels"][dimension])
+    codes = data["submissions"][dimension]
+    status = data["status"]
+
+    count = np.bincount(codes, minlength=size)
+    decided = np.bincount(codes, weights=np.isin(status, [STATUS_CODES[s] for s in DECISIONS]), minlength=size)
+    accepted = np.bincount(codes, weights=status == STATUS_CODES["accepted"], minlength=size)
+    payed = np.bincount(codes, weights=data["payed"], minlength=size)
+
+    # Soumissions par jour sur la période couverte par chaque groupe
+    days = data["day"].astype(np.int64)
+    first = np.full(size, np.iinfo(np.int64).max)
+    last = np.full(size, np.iinfo(np.int64).min)
+    np.minimum.at(first, codes, days)
+    np.maximum.at(last, codes, days)
+    span = np.where(count > 0, last - first + 1, 1)
+
+    decision_codes = data["decisions"][dimension]
+    durations = data["duration_days"]
+    decision_count = np.bincount(decision_codes, minlength=size)
+    decision_total = np.bincount(decision_codes, weights=durations, minlength=size)
+    median = _grouped_median(decision_codes, durations, size)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        columns = {
+            "submissions": count,
+            "decided": decided.astype(np.int64),
+            "acceptance_rate": np.where(decided > 0, accepted / decided, np.nan),
+            "payed_rate": np.where(count > 0, payed / count, np.nan),
+            "per_day": np.where(count > 0, count / span, np.nan),
+            "decision_median_days": median,
+            "decision_mean_days": np.where(decision_count > 0, decision_total / decision_count, np.nan),
+        }
+
+    # Lignes triées par nombre de soumissions décroissant, groupes vides exclus
+    order = np.argsort(-count, kind="stable")
+    rows = []
+    for i in order[count[order] > 0]:
+        row = {"label": str(data["labels"][dimension][i])}
+        for name, _ in METRICS:
+            value = columns[name][i]
+            row[name] = None if np.isnan(value) else round(float(value), 4) if value.dtype.kind == "f" else int(value)
+        rows.append(row)
+    return rows
+
+
+def compute(chunk_size=None):
+    start = time.perf_counter()
+    data = load(chunk_size)
+    loaded = time.perf_counter()
+    report = {dimension: _per_dimension(data, dimension) for dimension in DIMENSIONS}
+    return {
+        "dimensions": report,
+        "submissions": int(len(data["status"])),
+        "load_s": round(loaded - start, 3),
+        "compute_s": round(time.perf_counter() - loaded, 3),
+    }
+
+
+def get_report(refresh=False):
+    """ Rapport en cache, recalculé quand la version des données change. """
+    key = RESULT_KEY.format(version=data_version())
+    report = None if refresh else cache.get(key)
+    if report is None:
+        report = compute()
+        cache.set(key, report, analytics_setting("CACHE_TIMEOUT"))
+    return report
+
+
+def write_csv(report, out, dimensions=None):
+    writer = csv.writer(out)
+    writer.writerow(["dimension", "groupe", *(name for name, _ in METRICS)])
+    for dimension in dimensions or DIMENSIONS:
+        for row in report["dimensions"][dimension]:
+            writer.writerow([dimension, row["label"], *("" if row[name] is None else row[name] for name, _ in METRICS)])
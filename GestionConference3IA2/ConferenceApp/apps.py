@@ -7,3 +7,7 @@ class ConferenceappConfig(AppConfig):
 
     # Le nom de l'application (doit correspondre au nom du dossier)
     name = 'ConferenceApp'
+
+    def ready(self):
+        # Branche les signaux (invalidation de cache, etc.)
+        from . import signals  # noqa: F401
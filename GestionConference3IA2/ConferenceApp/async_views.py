@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404
+from django.shortcuts import render
+from UserApp.permissions import CommitteePermissions
+from archiveApp.models import ArchivedConference
+from .models import Conference
+
+
+# Clés de cache partagées avec les signaux d'invalidation (voir signals.py)
+CONFERENCE_LIST_CACHE_KEY = "conferences:liste"
+CONFERENCE_DETAIL_CACHE_KEY = "conferences:detail:{pk}"
+
+
+def _cache_timeout():
+    return getattr(settings, "ASYNC_VIEWS_CACHE_TIMEOUT", 30)
+
+
+# ============================================================
+#   LISTE DES CONFÉRENCES (version asynchrone, servie par ASGI)
+# ============================================================
+async def conference_list_async(request):
+    """
+    Même rendu que ConferenceList, mais sans passer par le pool de threads
+    de sync_to_async : la requête est faite avec l'ORM asynchrone (aiterator)
+    et le résultat est gardé quelques secondes dans le cache.
+    """
+    liste = await cache.aget(CONFERENCE_LIST_CACHE_KEY)
+    if liste is None:
+        liste = [c async for c in Conference.objects.all().aiterator()]
+        await cache.aset(CONFERENCE_LIST_CACHE_KEY, liste, _cache_timeout())
+
+    # request.user est paresseux et synchrone : on le résout ici avec auser()
+    # et on le passe explicitement au template (il remplace celui du context processor),
+    # de même pour les droits du comité.
+    user = await request.auser()
+    committee_perms = await CommitteePermissions(user).aload()
+    return render(
+        request,
+        "conferences/liste.html",
+        {"liste": liste, "user": user, "committee_perms": committee_perms},
+    )
+
+
+# ============================================================
+#   DÉTAIL D'UNE CONFÉRENCE (version asynchrone)
+# ============================================================
+async def conference_details_async(request, pk):
+    key = CONFERENCE_DETAIL_CACHE_KEY.format(pk=pk)
+    conference = await cache.aget(key)
+    if conference is None:
+        try:
+            conference = await Conference.objects.aget(pk=pk)
+        except Conference.DoesNotExist:
+            try:
+                conference = await ArchivedConference.objects.aget(pk=pk)
+            except ArchivedConference.DoesNotExist:
+                raise Http404("Conférence introuvable.")
+        await cache.aset(key, conference, _cache_timeout())
+
+    user = await request.auser()
+    return render(
+        request,
+        "conferences/details.html",
+        {"conference": conference, "object": conference, "user": user},
+    )
@@ -0,0 +1,24 @@
+from django.db.models import Q
+from GestionConference3IA2.prefix_index import PrefixIndex
+from .models import Conference
+
+
+def conference_texts(name):
+    # Nom complet + chaque fin de nom à partir d'un mot : "learning" trouve "Deep learning 2026"
+    words = name.split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+def _load():
+    for pk, name in Conference.objects.values_list("pk", "name").iterator(chunk_size=5000):
+        yield pk, name, conference_texts(name)
+
+
+def _fallback(query, limit):
+    # Même règle que l'index : le nom, ou un de ses mots, commence par la saisie
+    query = " ".join(query.split())
+    matches = Conference.objects.filter(Q(name__istartswith=query) | Q(name__icontains=f" {query}"))
+    return list(matches.order_by("name").values_list("pk", "name")[:limit])
+
+
+conference_index = PrefixIndex(_load, _fallback, Conference.objects.count)
@@ -1,10 +1,44 @@
 from django import forms
+from django.urls import reverse_lazy
+from GestionConference3IA2.concurrency import VersionedModelForm
 from .models import Conference, Submission
 
+
+# ============================
+# Widget : liste déroulante remplie par autocomplétion
+# ============================
+class AutocompleteSelect(forms.Select):
+    """
+    N'affiche que l'option sélectionnée (pas un <option> par ligne de la table) ;
+    les autres sont chargées depuis `url` (?q=...) par autocomplete.js.
+    """
+
+    class Media:
+        js = ("ConferenceApp/autocomplete.js",)
+
+    def __init__(self, url, attrs=None):
+        super().__init__(attrs)
+        self.url = url
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        attrs["data-autocomplete-url"] = str(self.url)
+        return attrs
+
+    def optgroups(self, name, value, attrs=None):
+        selected = [v for v in value if v]
+        options = [self.create_option(name, "", "---------", not selected, 0)]
+        if selected:
+            # Une seule requête, limitée aux valeurs sélectionnées
+            for index, obj in enumerate(self.choices.queryset.filter(pk__in=selected), start=1):
+                option_value, label = self.choices.choice(obj)
+                options.append(self.create_option(name, option_value, label, True, index))
+        return [(None, options, 0)]
+
 # ============================
 # Formulaire de Conference
 # ============================
-class ConferenceForm(forms.ModelForm):
+class ConferenceForm(VersionedModelForm):
     class Meta:
         model = Conference
         
@@ -39,7 +73,7 @@ class ConferenceForm(forms.ModelForm):
 # ============================
 # Formulaire de Submission
 # ============================
-class SubmissionForm(forms.ModelForm):
+class SubmissionForm(VersionedModelForm):
     class Meta:
         model = Submission
         
@@ -50,4 +84,6 @@ class SubmissionForm(forms.ModelForm):
         widgets = {
             'abstract': forms.Textarea(attrs={'rows': 5}),
             'keywords': forms.TextInput(attrs={'placeholder': "ex: IA, deep learning, data"}),
+            # Autocomplétion au lieu d'un <select> avec toutes les conférences
+            'conference': AutocompleteSelect(url=reverse_lazy("conference_autocomplete")),
         }
@@ -0,0 +1,89 @@
+import random
+import sys
+import time
+from datetime import timedelta
+from itertools import islice
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from GestionConference3IA2.benchmark import disk_test_database
+from ConferenceApp.analytics import DIMENSIONS, METRICS, compute, get_report, write_csv
+from ConferenceApp.models import Submission, SubmissionStatusEvent
+from ConferenceApp.status import DECISIONS, SOURCE_CODES, STATUS_CODES
+
+
+class Command(BaseCommand):
+    help = (
+        "Statistiques des soumissions (taux d'acceptation, de paiement, soumissions par jour, "
+        "délai de décision) par thème, conférence, affiliation et nationalité. "
+        "--bench N : mesure le calcul sur N soumissions générées dans une base de test sur disque."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dimension", choices=list(DIMENSIONS), help="une seule dimension")
+        parser.add_argument("--csv", help="écrit le rapport en CSV dans ce fichier ('-' : sortie standard)")
+        parser.add_argument("--refresh", action="store_true", help="ignore le résultat en cache")
+        parser.add_argument("--top", type=int, default=10, help="lignes affichées par dimension")
+        parser.add_argument("--bench", type=int, metavar="N", help="nombre de soumissions générées")
+
+    def handle(self, *args, **options):
+        if options["bench"]:
+            if connection.vendor != "sqlite":
+                raise CommandError("Le mode --bench vise SQLite (une base de test est créée sur disque).")
+            with disk_test_database("bench_analytics"):
+                self._seed(options["bench"])
+                report = compute()
+                self._print(report, options)
+            return
+
+        report = get_report(refresh=options["refresh"])
+        if options["csv"] == "-":
+            write_csv(report, sys.stdout, [options["dimension"]] if options["dimension"] else None)
+            return
+        if options["csv"]:
+            with open(options["csv"], "w", newline="", encoding="utf-8") as out:
+                write_csv(report, out, [options["dimension"]] if options["dimension"] else None)
+        self._print(report, options)
+
+    def _seed(self, submissions):
+        start = time.perf_counter()
+        call_command(
+            "generate_fixtures", submissions=submissions, conferences=max(10, submissions // 500),
+            users=min(60000, max(100, submissions // 10)), sessions=0, committee_size=0,
+            batch_size=5000, verbosity=0,
+        )
+        # Une décision par soumission acceptée / refusée, 1 à 60 jours après le dépôt
+        rng = random.Random(0)
+        decided = Submission.objects.filter(status__in=DECISIONS).order_by().values_list(
+            "submission_id", "conference_id", "status", "created_at",
+        ).iterator(chunk_size=50000)
+        events = 0
+        while batch := list(islice(decided, 50000)):
+            with transaction.atomic():
+                SubmissionStatusEvent.objects.bulk_create([
+                    SubmissionStatusEvent(
+                        submission_id=sid, conference_id=conference_id, from_status=STATUS_CODES["under review"],
+                        to_status=STATUS_CODES[status], source=SOURCE_CODES["bulk"],
+                        timestamp=created_at + timedelta(days=rng.uniform(1, 60)),
+                    )
+                    for sid, conference_id, status, created_at in batch
+                ], batch_size=5000)
+            events += len(batch)
+        self.stdout.write(
+            f"Jeu de données : {submissions} soumissions, {events} décisions "
+            f"({time.perf_counter() - start:.1f} s)"
+        )
+
+    def _print(self, report, options):
+        self.stdout.write(
+            f"{report['submissions']} soumissions : lecture {report['load_s']} s, calcul {report['compute_s']} s"
+        )
+        for dimension in [options["dimension"]] if options["dimension"] else DIMENSIONS:
+            rows = report["dimensions"][dimension]
+            self.stdout.write(f"\n{DIMENSIONS[dimension]} ({len(rows)} groupes)")
+            self.stdout.write("  ".join(f"{label[:14]:>14}" for _, label in [("label", "Groupe"), *METRICS]))
+            for row in rows[:options["top"]]:
+                self.stdout.write("  ".join(
+                    f"{'—' if row[name] is None else str(row[name])[:14]:>14}"
+                    for name in ["label", *(name for name, _ in METRICS)]
+                ))
@@ -0,0 +1,84 @@
+import json
+import shutil
+import subprocess
+import sys
+import time
+from django.core.management.base import BaseCommand, CommandError
+from GestionConference3IA2.benchmark import run_http_load
+
+
+# Chemins comparés : (nom, chemin synchrone servi en WSGI, chemin asynchrone servi en ASGI)
+ROUTES = [
+    ("conference_list", "/conferences/liste/", "/conferences/async/liste/"),
+    ("conference_detail", "/conferences/{conference}/", "/conferences/async/{conference}/"),
+    ("session_list", "/api/sessions/", "/api/async/sessions/"),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare le débit (rps) et la latence p99 des vues synchrones servies en WSGI "
+        "avec leurs équivalents asynchrones servis en ASGI."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wsgi-base", default="http://127.0.0.1:8000")
+        parser.add_argument("--asgi-base", default="http://127.0.0.1:8001")
+        parser.add_argument("--concurrency", type=int, default=500)
+        parser.add_argument("--requests", type=int, default=5000)
+        parser.add_argument("--conference", type=int, default=1, help="pk utilisé pour les pages de détail")
+        parser.add_argument("--token", default="", help="access token JWT pour les routes /api/")
+        parser.add_argument(
+            "--spawn", action="store_true",
+            help="Démarre gunicorn (WSGI) et uvicorn (ASGI) sur les ports des URLs de base",
+        )
+
+    def handle(self, *args, **options):
+        servers = self._spawn(options) if options["spawn"] else []
+        try:
+            results = {}
+            for name, sync_path, async_path in ROUTES:
+                headers = {}
+                if sync_path.startswith("/api/"):
+                    if not options["token"]:
+                        self.stderr.write(f"{name} ignorée : --token requis pour l'API")
+                        continue
+                    headers["Authorization"] = f"Bearer {options['token']}"
+                results[name] = {
+                    "wsgi": self._measure(options["wsgi_base"], sync_path, headers, options),
+                    "asgi": self._measure(options["asgi_base"], async_path, headers, options),
+                }
+                self.stdout.write(
+                    f"{name:<20} WSGI {results[name]['wsgi']['rps']:>8} rps p99 {results[name]['wsgi']['p99_ms']:>8} ms | "
+                    f"ASGI {results[name]['asgi']['rps']:>8} rps p99 {results[name]['asgi']['p99_ms']:>8} ms"
+                )
+            self.stdout.write(json.dumps(results, indent=2))
+        finally:
+            for proc in servers:
+                proc.terminate()
+                proc.wait()
+
+    def _measure(self, base, path, headers, options):
+        url = base.rstrip("/") + path.format(conference=options["conference"])
+        return run_http_load(url, options["concurrency"], options["requests"], headers)
+
+    def _spawn(self, options):
+        if not shutil.which("gunicorn") or not shutil.which("uvicorn"):
+            raise CommandError("--spawn nécessite gunicorn et uvicorn dans le PATH.")
+        wsgi_port = options["wsgi_base"].rsplit(":", 1)[-1].strip("/")
+        asgi_port = options["asgi_base"].rsplit(":", 1)[-1].strip("/")
+        servers = [
+            subprocess.Popen(
+                ["gunicorn", "GestionConference3IA2.wsgi", "-b", f"127.0.0.1:{wsgi_port}",
+                 "-w", "4", "--threads", "8"],
+                stdout=subprocess.DEVNULL, stderr=sys.stderr,
+            ),
+            subprocess.Popen(
+                ["uvicorn", "GestionConference3IA2.asgi:application", "--port", asgi_port,
+                 "--workers", "4", "--log-level", "warning"],
+                stdout=subprocess.DEVNULL, stderr=sys.stderr,
+            ),
+        ]
+        # Laisse le temps aux serveurs de démarrer
+        time.sleep(3)
+        return servers
@@ -0,0 +1,102 @@
+import logging
+import os
+import resource
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import date
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.db import connection
+from django.test import Client, override_settings
+from django.urls import reverse
+from GestionConference3IA2.benchmark import disk_test_database, run_http_load
+from ConferenceApp.models import Conference, Submission
+from UserApp.models import User
+
+
+class _Server(ThreadedWSGIServer):
+    # 100 clients se connectent en même temps : file d'attente plus longue que 5
+    request_queue_size = 256
+
+
+class Command(BaseCommand):
+    help = (
+        "Télécharge un article de N Mo avec plusieurs niveaux de concurrence (vue download_paper "
+        "servie par un serveur WSGI threadé dans ce processus) et affiche la mémoire Python de "
+        "pointe pour chaque niveau : quelques blocs par connexion, indépendamment de la taille du fichier."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size-mb", type=int, default=50)
+        parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("Le benchmark vise SQLite (une base de test est créée sur disque).")
+        logging.getLogger("django.server").setLevel(logging.WARNING)
+        size = options["size_mb"] * 1024 * 1024
+
+        with disk_test_database("bench_downloads"), tempfile.TemporaryDirectory() as media_root, \
+                override_settings(MEDIA_ROOT=media_root, ALLOWED_HOSTS=["*"]):
+            os.makedirs(os.path.join(media_root, "papers"))
+            with open(os.path.join(media_root, "papers", "bench.pdf"), "wb") as f:
+                for _ in range(size // (1024 * 1024)):
+                    f.write(os.urandom(1024 * 1024))
+            url, cookie = self._seed()
+
+            server = _Server(("127.0.0.1", 0), WSGIRequestHandler)
+            server.set_app(WSGIHandler())
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            base = f"http://127.0.0.1:{server.server_address[1]}"
+            try:
+                self._measure(base + url, cookie, size, options["concurrency"])
+            finally:
+                server.shutdown()
+                server.server_close()
+
+    def _seed(self):
+        user = User.objects.create_user(
+            username="bench_author", email="bench_author@esprit.tn", password="Bench-Pass-2025",
+            first_name="Bench", last_name="Author",
+        )
+        conference = Conference.objects.create(
+            name="Bench", theme="IA", location="Tunis", description="Conférence générée pour les benchmarks",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        submission = Submission.objects.create(
+            title="Article", abstract="Résumé", keywords="IA", paper="papers/bench.pdf",
+            user=user, conference=conference,
+        )
+        # Cookie de session de l'auteur (la vue exige une connexion)
+        client = Client()
+        client.force_login(user)
+        cookie = f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+        return reverse("download_paper", args=[submission.pk]), cookie
+
+    def _measure(self, url, cookie, size, levels):
+        # La pointe inclut les tampons des clients asyncio du même processus (~128 Ko chacun)
+        self.stdout.write(f"Fichier : {size // (1024 * 1024)} Mo")
+        tracemalloc.start()
+        try:
+            for concurrency in levels:
+                baseline = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                start = time.perf_counter()
+                result = run_http_load(url, concurrency, concurrency, {"Cookie": cookie})
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                sent = result["requests"] * size
+                self.stdout.write(
+                    f"{concurrency:>4} clients : {result['requests']} téléchargements, {result['errors']} erreurs, "
+                    f"{sent / elapsed / 1024 ** 2:8.0f} Mo/s, mémoire Python de pointe +{peak / 1024 ** 2:.1f} Mo"
+                )
+        finally:
+            tracemalloc.stop()
+        # ru_maxrss est en Ko sous Linux
+        self.stdout.write(
+            f"RSS maximal du processus (serveur + clients) : {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} Mo"
+        )
@@ -0,0 +1,139 @@
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections, transaction
+from GestionConference3IA2.benchmark import disk_test_database, summarize
+from GestionConference3IA2.concurrency import ConflictError
+from ConferenceApp.models import Conference
+
+
+# ============================
+# STRATÉGIES D'ÉDITION COMPARÉES
+# ============================
+# Chaque édition lit la conférence, "réfléchit" (formulaire ouvert), puis
+# incrémente le compteur stocké dans `location` : le total final dit
+# combien d'éditions ont été perdues.
+def _edit_naive(pk, think):
+    # Comportement d'avant : le dernier qui enregistre écrase les autres
+    conference = Conference.objects.get(pk=pk)
+    time.sleep(think)
+    Conference.objects.filter(pk=pk).update(location=str(int(conference.location) + 1))
+    return 0
+
+
+def _edit_optimistic(pk, think):
+    retries = 0
+    while True:
+        conference = Conference.objects.get(pk=pk)
+        time.sleep(think)
+        conference.location = str(int(conference.location) + 1)
+        try:
+            conference.save(update_fields=["location"])
+            return retries
+        except ConflictError:
+            # L'utilisateur relit la nouvelle version et refait sa modification
+            retries += 1
+
+
+def _edit_pessimistic(pk, think):
+    # Verrou tenu pendant toute l'édition (sur SQLite : BEGIN IMMEDIATE verrouille la base)
+    with transaction.atomic():
+        conference = Conference.objects.select_for_update().get(pk=pk)
+        time.sleep(think)
+        conference.location = str(int(conference.location) + 1)
+        conference.save(update_fields=["location"])
+    return 0
+
+
+STRATEGIES = {
+    "naive": _edit_naive,
+    "optimistic": _edit_optimistic,
+    "select_for_update": _edit_pessimistic,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Éditions concurrentes des mêmes conférences (base SQLite de test sur disque) : "
+        "compare l'écrasement simple, le compare-and-swap sur la version et select_for_update "
+        "(débit, latence, rejeux, éditions perdues)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=16, help="éditeurs en parallèle")
+        parser.add_argument("--edits", type=int, default=25, help="éditions par éditeur")
+        parser.add_argument("--rows", type=int, default=4, help="conférences éditées (moins = plus de contention)")
+        parser.add_argument("--think-ms", type=float, default=5, help="temps entre la lecture et l'enregistrement")
+        parser.add_argument("--only", nargs="*", choices=list(STRATEGIES))
+        parser.add_argument("--json", action="store_true", help="sortie JSON uniquement")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("Ce benchmark vise SQLite (une base de test est créée sur disque).")
+        results = {}
+        with disk_test_database("bench_edit_contention"):
+            for name in options["only"] or STRATEGIES:
+                results[name] = self._run(STRATEGIES[name], options)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results))
+            return
+        self.stdout.write(
+            f"{options['workers']} éditeurs x {options['edits']} éditions sur {options['rows']} conférence(s), "
+            f"{options['think_ms']} ms de réflexion"
+        )
+        self.stdout.write(f"\n{'stratégie':<18} {'édit./s':>9} {'p50':>10} {'p95':>10} {'rejeux':>8} "
+                          f"{'perdues':>8} {'erreurs':>8}")
+        for name, r in results.items():
+            s = r["latency"]
+            self.stdout.write(
+                f"{name:<18} {s['rps']:>9} {s['p50_ms']:>7} ms {s['p95_ms']:>7} ms {r['retries']:>8} "
+                f"{r['lost_updates']:>8} {s['errors']:>8}"
+            )
+
+    def _run(self, edit, options):
+        Conference.objects.all().delete()
+        pks = [
+            Conference.objects.create(
+                name=f"Bench {i}", theme="IA", location="0", description="bench",
+                start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+            ).pk
+            for i in range(options["rows"])
+        ]
+        think = options["think_ms"] / 1000
+        latencies, errors, retries = [], [], []
+        lock = threading.Lock()
+
+        def worker(n):
+            rng = random.Random(n)
+            try:
+                for _ in range(options["edits"]):
+                    start = time.perf_counter()
+                    try:
+                        retried = edit(rng.choice(pks), think)
+                    except OperationalError as exc:
+                        with lock:
+                            errors.append(repr(exc))
+                        continue
+                    with lock:
+                        latencies.append(time.perf_counter() - start)
+                        retries.append(retried)
+            finally:
+                connections.close_all()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["workers"]) as pool:
+            list(pool.map(worker, range(options["workers"])))
+        elapsed = time.perf_counter() - start
+
+        applied = sum(int(location) for location in Conference.objects.values_list("location", flat=True))
+        return {
+            "latency": summarize(latencies, elapsed, len(errors)),
+            "retries": sum(retries),
+            "lost_updates": len(latencies) - applied,
+            "first_error": errors[0] if errors else None,
+        }
@@ -0,0 +1,325 @@
+import json
+import statistics
+import tempfile
+import time
+import tracemalloc
+from contextlib import ExitStack
+from datetime import date
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from rest_framework_simplejwt.tokens import RefreshToken
+from GestionConference3IA2.benchmark import disk_test_database, percentile, seed_dataset
+from ConferenceApp.models import Conference, Submission
+from SessionApp.models import Session
+from UserApp.models import OrganizingCommittee, User
+
+
+BENCH_PASSWORD = "Bench-Owner-2025"
+
+
+# ============================
+# ROUTES MESURÉES
+# ============================
+# Chaque route : (nom, méthode, url(ctx), data(ctx, i) ou None, authentification)
+# authentification : "session" (client connecté), "jwt" (en-tête Bearer) ou None
+def _pdf(ctx, i):
+    return SimpleUploadedFile(f"bench_{i}.pdf", b"%PDF-1.4 bench", content_type="application/pdf")
+
+
+def _conference_form(ctx, i):
+    return {
+        "name": f"Bench {i}", "theme": "IA", "location": "Tunis", "description": "bench",
+        "start_date": "2026-05-01", "end_date": "2026-05-03",
+    }
+
+
+ROUTES = [
+    ("conference_list_anonymous", "get", lambda c: "/conferences/liste/", None, None),
+    ("conference_list", "get", lambda c: "/conferences/liste/", None, "session"),
+    ("conference_list_async", "get", lambda c: "/conferences/async/liste/", None, "session"),
+    ("conference_detail", "get", lambda c: f"/conferences/{c['conference']}/", None, None),
+    ("conference_program", "get", lambda c: f"/conferences/{c['conference']}/program.json", None, None),
+    ("conference_autocomplete", "get", lambda c: "/conferences/autocomplete/?q=Conf", None, None),
+    ("conference_add_form", "get", lambda c: "/conferences/add/", None, "session"),
+    ("conference_add", "post", lambda c: "/conferences/add/", _conference_form, "session"),
+    ("conference_update_form", "get", lambda c: f"/conferences/edit/{c['conference']}/", None, "session"),
+    ("conference_update", "post", lambda c: f"/conferences/edit/{c['conference']}/", lambda c, i: {
+        **_conference_form(c, i), "expected_version": c["conference_version"],
+    }, "session"),
+    ("conference_delete", "post", lambda c: f"/conferences/delete/{c['to_delete']}/", None, "session"),
+    ("submission_list", "get", lambda c: "/conferences/submissions/", None, "session"),
+    ("submission_detail", "get", lambda c: f"/conferences/submissions/{c['submission']}/", None, "session"),
+    ("submission_add", "post", lambda c: "/conferences/submissions/add/", lambda c, i: {
+        "title": f"Bench {i}", "abstract": "bench", "keywords": "bench",
+        "conference": c["conference"], "paper": _pdf(c, i),
+    }, "session"),
+    ("submission_update_form", "get", lambda c: f"/conferences/submissions/update/{c['submission']}/", None, "session"),
+    ("submission_update", "post", lambda c: f"/conferences/submissions/update/{c['submission']}/", lambda c, i: {
+        "title": f"Bench {i}", "abstract": "bench", "keywords": "bench", "expected_version": c["submission_version"],
+    }, "session"),
+    ("login_form", "get", lambda c: "/user/login", None, None),
+    ("login", "post", lambda c: "/user/login", lambda c, i: {
+        "username": c["username"], "password": BENCH_PASSWORD,
+    }, None),
+    ("logout", "get", lambda c: "/user/logout/", None, "session"),
+    ("register_form", "get", lambda c: "/user/register/", None, None),
+    ("register", "post", lambda c: "/user/register/", lambda c, i: {
+        "username": f"bench_register_{i}", "first_name": "Bench", "last_name": "Register",
+        "email": f"bench_register_{i}@esprit.tn", "affiliation": "ESPRIT", "nationality": "TN",
+        "password1": "Register-Pass-2025", "password2": "Register-Pass-2025",
+    }, None),
+    ("api_sessions_list", "get", lambda c: "/api/sessions/", None, "jwt"),
+    ("api_sessions_detail", "get", lambda c: f"/api/sessions/{c['session']}/", None, "jwt"),
+    ("api_sessions_list_async", "get", lambda c: "/api/async/sessions/", None, "jwt"),
+    ("api_conferences_list", "get", lambda c: "/api/conferences/?include=sessions,stats", None, "jwt"),
+    ("api_token_obtain", "post", lambda c: "/security/api/token/", lambda c, i: {
+        "username": c["username"], "password": BENCH_PASSWORD,
+    }, None),
+    ("api_token_refresh", "post", lambda c: "/security/api/token/refresh/", lambda c, i: {"refresh": c["refresh"]}, None),
+    ("api_token_verify", "post", lambda c: "/security/api/token/verify/", lambda c, i: {"token": c["access"]}, None),
+    ("api_token_revoke", "post", lambda c: "/security/api/token/revoke/", lambda c, i: {"refresh": c["refresh"]}, None),
+]
+
+# Routes coûteuses par nature (hachage PBKDF2) : moins d'itérations
+SLOW_ROUTES = {"login", "register", "api_token_obtain"}
+
+
+# Préparation hors mesure, avant chaque appel : prepare(ctx, client, i)
+def _conference_version(ctx, client, i):
+    ctx["conference_version"] = Conference.objects.values_list("version", flat=True).get(pk=ctx["conference"])
+
+
+def _submission_version(ctx, client, i):
+    ctx["submission_version"] = Submission.objects.values_list("version", flat=True).get(pk=ctx["submission"])
+
+
+def _conference_to_delete(ctx, client, i):
+    conference = Conference.objects.create(
+        name=f"À supprimer {i}", theme="IA", location="Tunis", description="bench",
+        start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+    )
+    OrganizingCommittee.objects.create(
+        user=ctx["user"], conference=conference, join_date=date(2026, 1, 1), commitee_role="chair",
+    )
+    ctx["to_delete"] = conference.pk
+
+
+def _login_again(ctx, client, i):
+    # L'appel précédent a supprimé la session
+    client.force_login(ctx["user"])
+
+
+def _new_refresh(ctx, client, i):
+    # Rotation / révocation : un refresh token ne sert qu'une fois
+    ctx["refresh"] = str(RefreshToken.for_user(ctx["user"]))
+
+
+PREPARE = {
+    "conference_update": _conference_version,
+    "conference_delete": _conference_to_delete,
+    "submission_update": _submission_version,
+    "logout": _login_again,
+    "api_token_refresh": _new_refresh,
+    "api_token_revoke": _new_refresh,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark reproductible de toutes les routes : crée une base de test sur disque "
+        "(lue aussi par l'alias replica), la remplit, mesure latences (p50/p95/p99), "
+        "requêtes SQL (dont celles du replica) et mémoire max (--overhead : surcoût de "
+        "l'instrumentation SQL, activée puis désactivée en alternance), "
+        "puis écrit un JSON de référence ou le compare à une référence existante. "
+        "Non couverts : /admin/, le flux SSE /api/stream/sessions/ (connexion sans fin), "
+        "le téléchargement des articles (bench_downloads), les inscriptions aux sessions "
+        "(bench_registrations), les écritures de l'API sessions (POST/PUT/PATCH/DELETE) "
+        "et user_autocomplete (staff)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=30)
+        parser.add_argument("--slow-iterations", type=int, default=3)
+        parser.add_argument("--conferences", type=int, default=1000)
+        parser.add_argument("--users", type=int, default=2000)
+        parser.add_argument("--output", default="bench_baseline.json")
+        parser.add_argument("--compare", help="JSON de référence : échoue si une route régresse")
+        parser.add_argument("--threshold", type=float, default=0.25,
+                            help="régression tolérée sur p95 (0.25 = +25%%)")
+        parser.add_argument("--min-delta-ms", type=float, default=2.0,
+                            help="écart absolu minimal (ms) pour compter une régression de latence")
+        parser.add_argument("--only", nargs="*", help="noms des routes à mesurer")
+        parser.add_argument("--overhead", action="store_true",
+                            help="mesure aussi le surcoût de QueryInstrumentationMiddleware (objectif < 2%%)")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("Le benchmark vise SQLite (une base de test est créée sur disque).")
+        setup_test_environment()
+        try:
+            with disk_test_database("bench_routes"), tempfile.TemporaryDirectory() as media_root, \
+                    override_settings(MEDIA_ROOT=media_root):
+                ctx = self._seed(options)
+                results = self._run(ctx, options)
+        finally:
+            teardown_test_environment()
+
+        with open(options["output"], "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        self.stdout.write(f"Résultats écrits dans {options['output']}")
+
+        if options["compare"]:
+            self._compare(results, options)
+
+    # ----------------------------
+    # Données
+    # ----------------------------
+    def _seed(self, options):
+        self.stdout.write("Création du jeu de données...")
+        conference_ids = seed_dataset(conferences=options["conferences"], users=options["users"])
+        owner = User.objects.create_user(
+            username="bench_owner", email="bench_owner@esprit.tn", password=BENCH_PASSWORD,
+            first_name="Bench", last_name="Owner", role="commitee",
+        )
+        OrganizingCommittee.objects.create(
+            user=owner, conference_id=conference_ids[0], join_date=date(2026, 1, 1), commitee_role="chair",
+        )
+        submission = Submission.objects.create(
+            title="Bench", abstract="bench", keywords="bench", paper="papers/bench.pdf",
+            status="submitted", user=owner, conference_id=conference_ids[0],
+        )
+        token = Client().post("/security/api/token/", {"username": owner.username, "password": BENCH_PASSWORD})
+        return {
+            "username": owner.username,
+            "user": owner,
+            "conference": conference_ids[0],
+            "submission": submission.pk,
+            "session": Session.objects.filter(conference_id=conference_ids[0]).values_list("pk", flat=True).first(),
+            "access": token.json()["access"],
+            "refresh": token.json()["refresh"],
+        }
+
+    # ----------------------------
+    # Mesures
+    # ----------------------------
+    def _run(self, ctx, options):
+        results = {}
+        for name, method, url, data, auth in ROUTES:
+            if options["only"] and name not in options["only"]:
+                continue
+            client = Client()
+            headers = {}
+            if auth == "session":
+                client.force_login(ctx["user"])
+            elif auth == "jwt":
+                headers["HTTP_AUTHORIZATION"] = f"Bearer {ctx['access']}"
+            iterations = options["slow_iterations"] if name in SLOW_ROUTES else options["iterations"]
+
+            def prepare(i):
+                if name in PREPARE:
+                    PREPARE[name](ctx, client, i)
+                kwargs = dict(headers)
+                if data is not None:
+                    kwargs["data"] = data(ctx, i)
+                return url(ctx), kwargs
+
+            def send(request):
+                path, kwargs = request
+                return getattr(client, method)(path, **kwargs)
+
+            # Échauffement (caches, templates compilés)
+            response = send(prepare(0))
+            if response.status_code >= 400:
+                raise CommandError(f"{name} : statut HTTP {response.status_code}")
+
+            latencies, queries, replica_queries = [], [], []
+            for i in range(1, iterations + 1):
+                request = prepare(i)
+                with ExitStack() as stack:
+                    # Lectures des GET sur "replica", le reste sur "default" : on compte les deux
+                    captured = {
+                        alias: stack.enter_context(CaptureQueriesContext(connections[alias]))
+                        for alias in ("default", "replica")
+                    }
+                    start = time.perf_counter()
+                    send(request)
+                    latencies.append(time.perf_counter() - start)
+                queries.append(sum(len(c.captured_queries) for c in captured.values()))
+                replica_queries.append(len(captured["replica"].captured_queries))
+
+            # Mémoire mesurée à part : tracemalloc ralentit l'exécution
+            request = prepare(iterations + 1)
+            tracemalloc.start()
+            send(request)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            results[name] = {
+                "iterations": iterations,
+                "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+                "queries": int(statistics.median(queries)),
+                "replica_queries": int(statistics.median(replica_queries)),
+                "peak_memory_kb": round(peak / 1024, 1),
+            }
+            if options["overhead"] and name not in SLOW_ROUTES:
+                results[name].update(self._instrumentation_overhead(prepare, send, iterations))
+            r = results[name]
+            self.stdout.write(
+                f"{name:<28} p50 {r['p50_ms']:>9} ms  p95 {r['p95_ms']:>9} ms  "
+                f"{r['queries']:>4} requêtes  {r['peak_memory_kb']:>9} Ko"
+                + (f"  instrumentation {r['instrumentation_overhead_pct']:+.2f} %"
+                   if "instrumentation_overhead_pct" in r else "")
+            )
+
+        measured = [r for r in results.values() if "instrumentation_overhead_pct" in r]
+        if measured:
+            on = sum(r["p50_with_instrumentation_ms"] for r in measured)
+            off = sum(r["p50_without_instrumentation_ms"] for r in measured)
+            self.stdout.write(f"Surcoût de l'instrumentation SQL (somme des p50) : {(on - off) / off * 100:+.2f} %")
+        return results
+
+    def _instrumentation_overhead(self, prepare, send, iterations):
+        # Alternance activé / désactivé : les deux séries subissent le même bruit (GC, cache disque)
+        enabled, disabled = [], []
+        instrumentation = getattr(settings, "SQL_INSTRUMENTATION", {})
+        for i in range(1, iterations + 1):
+            for latencies, active in ((enabled, True), (disabled, False)):
+                request = prepare(i)
+                with override_settings(SQL_INSTRUMENTATION={**instrumentation, "ENABLED": active}):
+                    start = time.perf_counter()
+                    send(request)
+                    latencies.append(time.perf_counter() - start)
+        on, off = statistics.median(enabled), statistics.median(disabled)
+        return {
+            "p50_with_instrumentation_ms": round(on * 1000, 3),
+            "p50_without_instrumentation_ms": round(off * 1000, 3),
+            "instrumentation_overhead_pct": round((on - off) / off * 100, 2),
+        }
+
+    # ----------------------------
+    # Comparaison avec la référence
+    # ----------------------------
+    def _compare(self, results, options):
+        with open(options["compare"], encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        regressions = []
+        for name, current in results.items():
+            old = baseline.get(name)
+            if old is None:
+                continue
+            limit = old["p95_ms"] * (1 + options["threshold"])
+            if current["p95_ms"] > limit and current["p95_ms"] - old["p95_ms"] > options["min_delta_ms"]:
+                regressions.append(f"{name} : p95 {old['p95_ms']} -> {current['p95_ms']} ms")
+            if current["queries"] > old["queries"]:
+                regressions.append(f"{name} : requêtes SQL {old['queries']} -> {current['queries']}")
+
+        if regressions:
+            raise CommandError("Régressions détectées :\n" + "\n".join(regressions))
+        self.stdout.write(self.style.SUCCESS("Aucune régression par rapport à la référence."))
@@ -0,0 +1,92 @@
+import json
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+# Deux configurations comparées : celle par défaut de Django et celle de settings.SQLITE_PRAGMAS
+CONFIGS = {
+    "default": {"pragmas": {}, "begin": "BEGIN", "timeout": 5},
+    "tuned": {"pragmas": None, "begin": "BEGIN IMMEDIATE", "timeout": 20},
+}
+
+
+def _writer(path, config, seconds, queue):
+    """
+    Un écrivain (un processus, comme un worker gunicorn) : transactions
+    "lecture puis écriture" comme l'ajout d'une soumission, en boucle.
+    """
+    conn = sqlite3.connect(path, timeout=config["timeout"], isolation_level=None)
+    for name, value in config["pragmas"].items():
+        conn.execute(f"PRAGMA {name}={value}")
+    done = errors = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        try:
+            conn.execute(config["begin"])
+            conn.execute("SELECT COUNT(*) FROM submission WHERE conference_id = ?", (done % 50,)).fetchone()
+            conn.execute(
+                "INSERT INTO submission (conference_id, title, abstract) VALUES (?, ?, ?)",
+                (done % 50, f"bench {os.getpid()} {done}", "x" * 500),
+            )
+            conn.execute("COMMIT")
+            done += 1
+        except sqlite3.OperationalError:
+            # "database is locked" : la transaction est perdue
+            errors += 1
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+    conn.close()
+    queue.put((done, errors))
+
+
+class Command(BaseCommand):
+    help = (
+        "Mesure le débit d'écriture et les erreurs 'database is locked' avec N écrivains "
+        "concurrents, configuration SQLite par défaut contre settings.SQLITE_PRAGMAS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--writers", type=int, default=32)
+        parser.add_argument("--seconds", type=float, default=10)
+
+    def handle(self, *args, **options):
+        CONFIGS["tuned"]["pragmas"] = settings.SQLITE_PRAGMAS
+        results = {}
+        for name, config in CONFIGS.items():
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "bench.sqlite3")
+                conn = sqlite3.connect(path)
+                conn.execute(
+                    "CREATE TABLE submission (id INTEGER PRIMARY KEY, conference_id INTEGER, "
+                    "title TEXT, abstract TEXT)"
+                )
+                conn.execute("CREATE INDEX submission_conference ON submission (conference_id)")
+                conn.commit()
+                conn.close()
+
+                queue = multiprocessing.Queue()
+                procs = [
+                    multiprocessing.Process(target=_writer, args=(path, config, options["seconds"], queue))
+                    for _ in range(options["writers"])
+                ]
+                for p in procs:
+                    p.start()
+                totals = [queue.get() for _ in procs]
+                for p in procs:
+                    p.join()
+
+            done = sum(t[0] for t in totals)
+            errors = sum(t[1] for t in totals)
+            results[name] = {
+                "writers": options["writers"],
+                "commits": done,
+                "commits_per_s": round(done / options["seconds"], 1),
+                "lock_errors": errors,
+            }
+            self.stdout.write(f"{name:<8} {results[name]['commits_per_s']:>10} commits/s  {errors:>6} erreurs de verrou")
+        self.stdout.write(json.dumps(results, indent=2))
@@ -0,0 +1,125 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Max
+from GestionConference3IA2 import fixtures
+from ConferenceApp.models import Conference, Submission
+from SessionApp.models import Session
+from UserApp.importer import free_user_ids
+from UserApp.models import OrganizingCommittee, User
+
+
+def _init_worker():
+    import django
+    django.setup()
+
+
+def _run_job(job):
+    # Exécuté dans un processus du pool : job = (nom de la fonction, arguments)
+    name, args = job
+    return name, getattr(fixtures, name)(*args)
+
+
+class Command(BaseCommand):
+    help = (
+        "Génère un jeu de données synthétique déterministe (graine --seed) : conférences, "
+        "utilisateurs, soumissions, sessions et comités, écrits par bulk_create en gros lots."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--conferences", type=int, default=10000)
+        parser.add_argument("--users", type=int, default=50000)
+        parser.add_argument("--submissions", type=int, default=500000)
+        parser.add_argument("--sessions", type=int, default=100000)
+        parser.add_argument("--committee-size", type=int, default=5, help="membres du comité par conférence")
+        parser.add_argument("--batch-size", type=int, default=5000, help="lignes par INSERT")
+        parser.add_argument("--processes", type=int, default=1, help="processus de génération (1 = séquentiel)")
+        parser.add_argument("--flush", action="store_true", help="vide les tables avant de générer")
+
+    def handle(self, *args, **options):
+        seed, batch_size = options["seed"], options["batch_size"]
+        if options["submissions"] > 16 ** 6:
+            raise CommandError("Au plus 16 777 216 soumissions par graine (format SUBxxxxxxxx).")
+
+        if options["flush"]:
+            for model in (Session, Submission, OrganizingCommittee, Conference):
+                model.objects.all().delete()
+            User.objects.filter(is_superuser=False).delete()
+
+        self._check_not_generated(seed, options["submissions"])
+
+        # Identifiants des utilisateurs : le format USERXXXX n'en autorise que 65 536
+        user_ids = free_user_ids(fixtures.rng_for(seed, "user_id", 0))[:options["users"]]
+        if len(user_ids) < options["users"]:
+            raise CommandError(
+                f"Seulement {len(user_ids)} user_id libres (format USERXXXX) : "
+                f"impossible de créer {options['users']} utilisateurs."
+            )
+        user_ids.sort()
+
+        started = time.perf_counter()
+        first_conference = (Conference.objects.aggregate(m=Max("conference_id"))["m"] or 0) + 1
+        conference_ids = list(range(first_conference, first_conference + options["conferences"]))
+        password = fixtures.hashed_password()
+
+        # Étape 1 : tables référencées (conférences, utilisateurs)
+        self._execute(options, [
+            ("write_conferences", (seed, n, a, b, first_conference, batch_size))
+            for n, a, b in fixtures.chunks(options["conferences"])
+        ] + [
+            ("write_users", (seed, n, a, b, user_ids, password, batch_size))
+            for n, a, b in fixtures.chunks(options["users"])
+        ])
+
+        # Étape 2 : tables qui pointent vers les précédentes
+        conferences = list(
+            Conference.objects.filter(conference_id__in=conference_ids)
+            .values_list("conference_id", "start_date", "end_date")
+        )
+        self._execute(options, [
+            ("write_submissions", (seed, n, a, b, user_ids, conference_ids, batch_size))
+            for n, a, b in fixtures.chunks(options["submissions"])
+        ] + [
+            ("write_sessions", (seed, n, a, b, conferences, batch_size))
+            for n, a, b in fixtures.chunks(options["sessions"])
+        ] + [
+            ("write_committees", (seed, n, a, b, conference_ids, user_ids, options["committee_size"], batch_size))
+            for n, a, b in fixtures.chunks(options["conferences"], size=5000)
+        ])
+
+        # bulk_create n'envoie pas de signaux : compteurs de l'admin et statistiques à recalculer
+        call_command("refresh_admin_stats", stdout=self.stdout)
+
+        self.stdout.write(self.style.SUCCESS(f"Données générées en {time.perf_counter() - started:.1f} s"))
+
+    def _check_not_generated(self, seed, submissions):
+        # Usernames gen<graine>_<i> et soumissions SUB<graine % 256><i> : une 2e exécution
+        # sans --flush échouerait au milieu sur une contrainte d'unicité
+        prefix = f"SUB{seed % 256:02X}"
+        if User.objects.filter(username__startswith=f"gen{seed}_").exists() or (
+            submissions and Submission.objects.filter(
+                submission_id__range=(f"{prefix}000000", f"{prefix}{submissions - 1:06X}")
+            ).exists()
+        ):
+            raise CommandError(
+                f"Des données de la graine {seed} (ou d'une graine de même reste modulo 256) existent déjà : "
+                "relancez avec --flush ou choisissez une autre --seed."
+            )
+
+    def _execute(self, options, jobs):
+        totals = {}
+        if options["processes"] > 1:
+            # Les connexions ne doivent pas être partagées avec les processus fils
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=options["processes"], initializer=_init_worker) as pool:
+                for name, count in pool.map(_run_job, jobs):
+                    totals[name] = totals.get(name, 0) + count
+        else:
+            for job in jobs:
+                name, count = _run_job(job)
+                totals[name] = totals.get(name, 0) + count
+        for name, count in totals.items():
+            self.stdout.write(f"{name.replace('write_', ''):<12} {count} lignes")
@@ -0,0 +1,39 @@
+import csv
+import time
+from django.core.management.base import BaseCommand
+from ConferenceApp.reconciliation import LEDGER_COLUMNS, reconcile_ledger
+
+
+class Command(BaseCommand):
+    help = (
+        "Rapproche un export comptable (colonnes : " + ", ".join(LEDGER_COLUMNS) + ") "
+        "des soumissions et marque les soumissions payées."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("ledger_file")
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument("--dry-run", action="store_true", help="rapproche sans rien écrire")
+        parser.add_argument("--report", help="CSV où écrire les lignes non rapprochées ou ambiguës")
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        with open(options["ledger_file"], newline="", encoding="utf-8") as f:
+            report = reconcile_ledger(f, chunk_size=options["chunk_size"], dry_run=options["dry_run"])
+        elapsed = time.perf_counter() - start
+
+        if options["report"]:
+            with open(options["report"], "w", newline="", encoding="utf-8") as out:
+                writer = csv.writer(out)
+                writer.writerow(["line", "problem", "detail"])
+                writer.writerows(report.rows())
+        else:
+            for line, problem, detail in report.rows():
+                self.stderr.write(f"ligne {line} ({problem}) : {detail}")
+
+        verb = "à marquer" if options["dry_run"] else "marquées"
+        self.stdout.write(self.style.SUCCESS(
+            f"{report.lines} lignes en {elapsed:.1f} s : {report.matched} soumissions {verb} payées "
+            f"(dont {report.fuzzy} par email + titre), {report.already_payed} déjà payées, "
+            f"{len(report.unmatched)} non rapprochées, {len(report.ambiguous)} ambiguës"
+        ))
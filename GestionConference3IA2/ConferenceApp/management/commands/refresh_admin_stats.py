@@ -0,0 +1,28 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection
+from ConferenceApp.models import DATE_BUCKET_SERIES, DateBucket
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcule les compteurs par jour de l'admin (DateBucket) et les statistiques "
+        "de la base (ANALYZE) utilisées pour estimer le nombre de lignes. À lancer après "
+        "un import en masse (bulk_create, generate_fixtures...) ou périodiquement."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--skip-analyze", action="store_true")
+
+    def handle(self, *args, **options):
+        for series, (model, field) in DATE_BUCKET_SERIES.items():
+            start = time.perf_counter()
+            DateBucket.rebuild(series, model.objects.all(), field)
+            days = DateBucket.objects.filter(series=series).count()
+            self.stdout.write(f"{series} : {days} jours en {time.perf_counter() - start:.2f} s")
+
+        if not options["skip_analyze"]:
+            start = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+            self.stdout.write(f"ANALYZE en {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,43 @@
+import time
+from django.core.management.base import BaseCommand
+from ConferenceApp.models import PendingSnapshot
+from ConferenceApp.snapshots import RenderReport, enqueue_all, process_queue, snapshot_root
+
+
+class Command(BaseCommand):
+    help = (
+        "Worker des snapshots statiques : regénère les pages publiques (liste, détail, "
+        "programme JSON) signalées par les changements de Conference / Session, en parallèle. "
+        "--all : remet toutes les pages dans la file (premier déploiement, après un import en masse)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="regénère toutes les pages")
+        parser.add_argument("--workers", type=int, default=None, help="threads de rendu")
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--interval", type=float, default=2.0, help="attente (s) quand la file est vide")
+        parser.add_argument("--once", action="store_true", help="vide la file puis s'arrête")
+
+    def handle(self, *args, **options):
+        if options["all"]:
+            self.stdout.write(f"{enqueue_all()} pages ajoutées à la file")
+        report = RenderReport()
+        try:
+            while True:
+                claimed = process_queue(report, options["workers"], options["batch_size"])
+                if claimed:
+                    self.stdout.write(
+                        f"lot de {claimed} pages ; total : {report.written} écrites, {report.removed} supprimées, "
+                        f"{report.failed} en échec en {report.elapsed_s:.2f} s"
+                    )
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(
+            f"{report.written} pages écrites dans {snapshot_root()}, {report.removed} supprimées, "
+            f"{report.failed} en échec ; {PendingSnapshot.objects.count()} en attente"
+        )
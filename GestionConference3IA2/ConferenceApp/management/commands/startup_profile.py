@@ -0,0 +1,126 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# Script exécuté dans un interpréteur neuf (python -X importtime) : mesure
+# django.setup() application par application, puis la première requête.
+PROFILE_SCRIPT = r"""
+import json, os, sys, time
+t0 = time.perf_counter()
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "GestionConference3IA2.settings")
+from django.apps.config import AppConfig
+
+apps_timing = {}
+original_create = AppConfig.create.__func__
+
+def create(cls, entry):
+    config = original_create(cls, entry)
+    timing = apps_timing.setdefault(config.label, {"import_models_ms": 0.0, "ready_ms": 0.0})
+    for method, key in (("import_models", "import_models_ms"), ("ready", "ready_ms")):
+        def timed(*args, _fn=getattr(config, method), _key=key, **kwargs):
+            start = time.perf_counter()
+            try:
+                return _fn(*args, **kwargs)
+            finally:
+                timing[_key] += (time.perf_counter() - start) * 1000
+        setattr(config, method, timed)
+    return config
+
+AppConfig.create = classmethod(create)
+
+t_setup = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+setup_ms = (time.perf_counter() - t_setup) * 1000
+HEAVY = ("rest_framework.views", "rest_framework_simplejwt.authentication", "ConferenceApp.admin", "UserApp.admin")
+loaded_after_setup = sorted(m for m in HEAVY if m in sys.modules)
+
+from django.test import Client
+from django.test.utils import setup_test_environment
+setup_test_environment()
+client = Client()
+requests = {}
+for url in sys.argv[1:]:
+    start = time.perf_counter()
+    status = client.get(url).status_code
+    requests[url] = {"status": status, "ms": round((time.perf_counter() - start) * 1000, 2)}
+
+print(json.dumps({
+    "setup_ms": round(setup_ms, 2),
+    "apps": {label: {k: round(v, 2) for k, v in t.items()} for label, t in apps_timing.items()},
+    "requests": requests,
+    "total_ms": round((time.perf_counter() - t0) * 1000, 2),
+    "loaded_after_setup": loaded_after_setup,
+}))
+"""
+
+
+def parse_importtime(stderr, depth):
+    """
+    Agrège la sortie de -X importtime par paquet (les `depth` premiers
+    composants du nom de module), en temps propre (self) cumulé.
+    """
+    totals = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        package = ".".join(name.strip().split(".")[:depth])
+        totals[package] += int(self_us)
+    return totals
+
+
+class Command(BaseCommand):
+    help = (
+        "Profile le démarrage à froid : temps d'import par paquet, import_models/ready "
+        "par application et durée des premières requêtes, dans un interpréteur neuf."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "urls", nargs="*", default=["/conferences/liste/", "/api/sessions/", "/admin/login/"],
+            help="URLs demandées après le démarrage (la première mesure le time-to-first-request)",
+        )
+        parser.add_argument("--top", type=int, default=20)
+        parser.add_argument("--depth", type=int, default=1, help="profondeur du regroupement des modules")
+        parser.add_argument("--json", action="store_true", help="sortie JSON uniquement")
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get(
+            "DJANGO_SETTINGS_MODULE", "GestionConference3IA2.settings"))
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", PROFILE_SCRIPT, *options["urls"]],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise CommandError(proc.stderr[-2000:])
+
+        report = json.loads(proc.stdout.strip().splitlines()[-1])
+        imports = parse_importtime(proc.stderr, options["depth"])
+        report["imports_ms"] = {
+            name: round(us / 1000, 2)
+            for name, us in sorted(imports.items(), key=lambda item: item[1], reverse=True)[:options["top"]]
+        }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(f"django.setup() : {report['setup_ms']} ms   (total : {report['total_ms']} ms)")
+        self.stdout.write("\nImports (temps propre cumulé par paquet) :")
+        for name, ms in report["imports_ms"].items():
+            self.stdout.write(f"  {name:<40} {ms:>9} ms")
+        self.stdout.write("\nApplications (import_models / ready) :")
+        for label, timing in report["apps"].items():
+            self.stdout.write(f"  {label:<20} {timing['import_models_ms']:>9} ms {timing['ready_ms']:>9} ms")
+        self.stdout.write("\nPremières requêtes :")
+        for url, r in report["requests"].items():
+            self.stdout.write(f"  {url:<30} {r['status']}  {r['ms']:>9} ms")
+        self.stdout.write(
+            f"\nModules lourds chargés par django.setup() : {', '.join(report['loaded_after_setup']) or 'aucun'}"
+        )
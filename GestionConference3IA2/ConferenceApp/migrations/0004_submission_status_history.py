@@ -0,0 +1,80 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+STATUS_CODES = {"submitted": 1, "under review": 2, "accepted": 3, "rejected": 4}
+BACKFILL = 5
+
+
+def backfill_history(apps, schema_editor):
+    """
+    Anciennes soumissions sans statut -> "submitted", puis un événement
+    (création -> statut actuel) par soumission, daté de sa dernière mise à jour.
+    """
+    Submission = apps.get_model("ConferenceApp", "Submission")
+    SubmissionStatusEvent = apps.get_model("ConferenceApp", "SubmissionStatusEvent")
+    Submission.objects.filter(status="").update(status="submitted")
+
+    batch = []
+    rows = Submission.objects.values_list("submission_id", "conference_id", "status", "update_at")
+    for submission_id, conference_id, status, update_at in rows.iterator(chunk_size=5000):
+        batch.append(SubmissionStatusEvent(
+            submission_id=submission_id, conference_id=conference_id,
+            to_status=STATUS_CODES[status], source=BACKFILL, timestamp=update_at,
+        ))
+        if len(batch) >= 5000:
+            SubmissionStatusEvent.objects.bulk_create(batch)
+            batch = []
+    SubmissionStatusEvent.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ConferenceApp", "0003_alter_conference_description"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="submission",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("submitted", "submitted"),
+                    ("under review", "under review"),
+                    ("accepted", "accepted"),
+                    ("rejected", "rejected"),
+                ],
+                default="submitted",
+                max_length=50,
+            ),
+        ),
+        migrations.CreateModel(
+            name="SubmissionStatusEvent",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("from_status", models.PositiveSmallIntegerField(
+                    choices=[(1, "submitted"), (2, "under review"), (3, "accepted"), (4, "rejected")], null=True)),
+                ("to_status", models.PositiveSmallIntegerField(
+                    choices=[(1, "submitted"), (2, "under review"), (3, "accepted"), (4, "rejected")])),
+                ("source", models.PositiveSmallIntegerField(
+                    choices=[(1, "save"), (2, "form"), (3, "admin"), (4, "bulk"), (5, "backfill")], default=1)),
+                ("timestamp", models.DateTimeField(default=django.utils.timezone.now)),
+                ("conference", models.ForeignKey(
+                    db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING,
+                    related_name="status_events", to="ConferenceApp.conference")),
+                ("submission", models.ForeignKey(
+                    db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING,
+                    related_name="status_events", to="ConferenceApp.submission")),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["conference", "to_status", "timestamp"], name="status_event_conf_idx"),
+                    models.Index(fields=["to_status", "timestamp"], name="status_event_status_idx"),
+                    models.Index(fields=["submission", "timestamp"], name="status_event_sub_idx"),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_history, migrations.RunPython.noop),
+    ]
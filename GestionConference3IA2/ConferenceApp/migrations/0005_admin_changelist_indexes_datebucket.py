@@ -0,0 +1,61 @@
+from django.db import migrations, models
+
+
+def fill_buckets(apps, schema_editor):
+    """ Compteurs par jour des lignes existantes. """
+    DateBucket = apps.get_model("ConferenceApp", "DateBucket")
+    series = {
+        "conference.start_date": (apps.get_model("ConferenceApp", "Conference"), "start_date"),
+        "submission.submission_date": (apps.get_model("ConferenceApp", "Submission"), "submission_date"),
+    }
+    for name, (model, field) in series.items():
+        rows = model.objects.order_by().values_list(field).annotate(n=models.Count("pk"))
+        DateBucket.objects.bulk_create(
+            [DateBucket(series=name, day=day, count=n) for day, n in rows if day is not None],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ConferenceApp", "0004_submission_status_history"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DateBucket",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("series", models.CharField(max_length=100)),
+                ("day", models.DateField()),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(fields=("series", "day"), name="date_bucket_unique"),
+                ],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="conference",
+            index=models.Index(fields=["start_date"], name="conference_start_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="conference",
+            index=models.Index(fields=["theme", "start_date"], name="conference_theme_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(fields=["status", "submission_id"], name="submission_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(fields=["payed", "submission_id"], name="submission_payed_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(fields=["submission_date"], name="submission_date_idx"),
+        ),
+        migrations.RunPython(fill_buckets, migrations.RunPython.noop),
+    ]
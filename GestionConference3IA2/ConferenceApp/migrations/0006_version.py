@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ConferenceApp', '0005_admin_changelist_indexes_datebucket'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conference',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='submission',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
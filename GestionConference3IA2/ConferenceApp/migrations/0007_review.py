@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-19 15:00
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ConferenceApp', '0006_version'),
+        ('UserApp', '0002_alter_user_email_alter_user_first_name_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Review',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(10)])),
+                ('confidence', models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('comment', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('update_at', models.DateTimeField(auto_now=True)),
+                ('reviewer', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='UserApp.organizingcommittee')),
+                ('submission', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='ConferenceApp.submission')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['reviewer'], name='review_reviewer_idx')],
+                'constraints': [models.UniqueConstraint(fields=('submission', 'reviewer'), name='review_one_per_reviewer'), models.CheckConstraint(condition=models.Q(('score__gte', 1), ('score__lte', 10)), name='review_score_range'), models.CheckConstraint(condition=models.Q(('confidence__gte', 1), ('confidence__lte', 5)), name='review_confidence_range')],
+            },
+        ),
+    ]
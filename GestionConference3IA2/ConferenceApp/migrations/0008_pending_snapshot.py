@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-19 15:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ConferenceApp', '0007_review'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('page', models.CharField(max_length=100, unique=True)),
+                ('queued_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['queued_at'], name='pending_snapshot_queued_idx')],
+            },
+        ),
+    ]
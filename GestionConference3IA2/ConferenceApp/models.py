@@ -1,7 +1,13 @@
-from django.db import models
-from django.core.validators import MaxLengthValidator
+from django.db import models, transaction
+from django.core.validators import MaxLengthValidator, MaxValueValidator, MinValueValidator
 from django.core.exceptions import ValidationError
+from django.db.models import Count, DurationField, ExpressionWrapper, F, OuterRef, Subquery
+from django.utils import timezone
 import uuid
+from GestionConference3IA2.concurrency import VersionedModel, bump_version
+from .status import (
+    DECISIONS, SOURCE_CODES, SOURCES, STATUS_CODES, allowed_sources, check_transition, status_changed,
+)
 
 # -------------------------------------------------------------------
 # Fonction qui génère un identifiant unique pour les soumissions.
@@ -14,7 +20,7 @@ def generate_submission_id():
 # ===================================================================
 #   MODEL : CONFERENCE
 # ===================================================================
-class Conference(models.Model):
+class Conference(VersionedModel):
     # Identifiant automatique pour chaque conférence
     conference_id = models.AutoField(primary_key=True)
 
@@ -47,6 +53,22 @@ class Conference(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     update_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Listes de l'admin : tri par date, filtre par thème
+            models.Index(fields=["start_date"], name="conference_start_date_idx"),
+            models.Index(fields=["theme", "start_date"], name="conference_theme_idx"),
+        ]
+
+    # Date de début lue en base (mise à jour des DateBucket si elle change)
+    _loaded_start_date = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_start_date = instance.__dict__.get("start_date")
+        return instance
+
     # Représentation dans l'admin et Django shell
     def __str__(self):
         return f"Conférence : {self.name}"
@@ -63,7 +85,34 @@ class Conference(models.Model):
 # ===================================================================
 #   MODEL : SUBMISSION
 # ===================================================================
-class Submission(models.Model):
+class SubmissionQuerySet(models.QuerySet):
+
+    def change_status(self, new_status, source="bulk"):
+        """
+        Remplace `queryset.update(status=...)` : seules les soumissions pour
+        lesquelles la transition est permise changent, l'historique est écrit en
+        un bulk_create et le signal status_changed est envoyé (queryset.update()
+        ne déclenche aucun signal). Renvoie le nombre de soumissions modifiées.
+        """
+        with transaction.atomic():
+            rows = list(
+                self.filter(status__in=allowed_sources(new_status))
+                .values_list("submission_id", "user_id", "title", "status", "conference_id")
+            )
+            ids = [row[0] for row in rows]
+            Submission.objects.filter(submission_id__in=ids).update(
+                status=new_status, update_at=timezone.now(), **bump_version()
+            )
+            SubmissionStatusEvent.record([
+                (sid, conference_id, old, new_status) for sid, _, _, old, conference_id in rows
+            ], source)
+            status_changed.send(sender=Submission, changes=[
+                (sid, user_id, title, old, new_status) for sid, user_id, title, old, _ in rows
+            ])
+        return len(ids)
+
+
+class Submission(VersionedModel):
 
     # Identifiant unique NON modifiable par l'utilisateur
     submission_id = models.CharField(
@@ -88,7 +137,7 @@ class Submission(models.Model):
         ("accepted", "accepted"),
         ("rejected", "rejected"),
     ]
-    status = models.CharField(max_length=50, choices=STATUS)
+    status = models.CharField(max_length=50, choices=STATUS, default="submitted")
 
     # Est-ce que l'auteur a payé les frais ?
     payed = models.BooleanField(default=False)
@@ -112,11 +161,49 @@ class Submission(models.Model):
         related_name="submissions"  # Permet conference.submissions.all()
     )
 
+    class Meta:
+        indexes = [
+            # Filtres de l'admin (tri par défaut : -pk)
+            models.Index(fields=["status", "submission_id"], name="submission_status_idx"),
+            models.Index(fields=["payed", "submission_id"], name="submission_payed_idx"),
+            models.Index(fields=["submission_date"], name="submission_date_idx"),
+        ]
+
+    # Statut lu en base (None pour une soumission pas encore enregistrée)
+    _loaded_status = None
+
+    objects = SubmissionQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # __dict__ : le champ peut être différé (.only())
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
+
+    # -------------------------------------------------------------------
+    # VALIDATION : transitions de statut permises (formulaires et admin)
+    # -------------------------------------------------------------------
+    def clean(self):
+        super().clean()
+        try:
+            check_transition(self._loaded_status, self.status)
+        except ValidationError as e:
+            raise ValidationError({"status": e.messages})
+
     # -------------------------------------------------------------------
     # save() personnalisé pour générer automatiquement un ID unique
     # avant d'enregistrer dans la base de données
     # -------------------------------------------------------------------
     def save(self, *args, **kwargs):
+        old_status = self._loaded_status
+        status = self.__dict__.get("status")
+        changed = status is not None and status != old_status and (self._state.adding or old_status is not None)
+        if kwargs.get("update_fields") is not None and "status" not in kwargs["update_fields"]:
+            changed = False
+        if changed:
+            check_transition(old_status, status)
+
         # Si l'ID n'existe pas, on le génère
         if not self.submission_id:
             newid = generate_submission_id()
@@ -127,5 +214,259 @@ class Submission(models.Model):
 
             self.submission_id = newid
         
-        # Appel de la méthode save() normale de Django
+        with transaction.atomic():
+            # Appel de la méthode save() normale de Django
+            super().save(*args, **kwargs)
+
+            # Historique + signal, dans la même transaction que le changement
+            if changed:
+                source = getattr(self, "_status_source", "save")
+                SubmissionStatusEvent.record(
+                    [(self.submission_id, self.conference_id, old_status, status)], source,
+                )
+                status_changed.send(sender=Submission, changes=[
+                    (self.submission_id, self.user_id, self.title, old_status or None, status),
+                ])
+        if status is not None:
+            self._loaded_status = status
+
+
+# ===================================================================
+#   MODEL : ÉVALUATION D'UNE SOUMISSION PAR UN MEMBRE DU COMITÉ
+# ===================================================================
+class Review(models.Model):
+    # Note de 1 (rejet fort) à 10 (acceptation forte), confiance de 1 à 5
+    SCORE_MIN, SCORE_MAX = 1, 10
+    CONFIDENCE_MIN, CONFIDENCE_MAX = 1, 5
+
+    # Pas de contrainte de clé étrangère : l'archivage déplace soumissions et
+    # comités par DELETE direct, les évaluations restent (comme l'historique)
+    submission = models.ForeignKey(
+        Submission, on_delete=models.CASCADE, db_constraint=False, related_name="reviews",
+    )
+    reviewer = models.ForeignKey(
+        "UserApp.OrganizingCommittee", on_delete=models.CASCADE, db_constraint=False, related_name="reviews",
+    )
+    score = models.PositiveSmallIntegerField(
+        validators=[MinValueValidator(SCORE_MIN), MaxValueValidator(SCORE_MAX)],
+    )
+    confidence = models.PositiveSmallIntegerField(
+        validators=[MinValueValidator(CONFIDENCE_MIN), MaxValueValidator(CONFIDENCE_MAX)],
+    )
+    comment = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    update_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["submission", "reviewer"], name="review_one_per_reviewer"),
+            models.CheckConstraint(
+                condition=models.Q(score__gte=1, score__lte=10), name="review_score_range",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(confidence__gte=1, confidence__lte=5), name="review_confidence_range",
+            ),
+        ]
+        indexes = [
+            # Chargement des évaluations d'une conférence (classement)
+            models.Index(fields=["reviewer"], name="review_reviewer_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.submission_id} : {self.score}/10 (confiance {self.confidence})"
+
+    def clean(self):
+        super().clean()
+        if self.submission_id is None or self.reviewer_id is None:
+            return
+        if self.reviewer.conference_id != self.submission.conference_id:
+            raise ValidationError({"reviewer": "Ce membre ne fait pas partie du comité de cette conférence."})
+        if self.reviewer.user_id == self.submission.user_id:
+            raise ValidationError({"reviewer": "Un auteur ne peut pas évaluer sa propre soumission."})
+
+
+# ===================================================================
+#   MODEL : HISTORIQUE DES STATUTS (journal en ajout seul)
+# ===================================================================
+class SubmissionStatusEventQuerySet(models.QuerySet):
+
+    def update(self, **kwargs):
+        raise TypeError("L'historique des statuts est en ajout seul.")
+
+    def delete(self):
+        raise TypeError("L'historique des statuts est en ajout seul.")
+
+    # -----------------------------
+    # Requêtes d'agrégation (servies par les index)
+    # -----------------------------
+    def between(self, start=None, end=None, conference=None):
+        events = self
+        if conference is not None:
+            events = events.filter(conference=conference)
+        if start is not None:
+            events = events.filter(timestamp__gte=start)
+        if end is not None:
+            events = events.filter(timestamp__lt=end)
+        return events
+
+    def moved_to(self, status):
+        return self.filter(to_status=STATUS_CODES[status])
+
+    def counts_by_status(self):
+        """ {statut : nombre de passages à ce statut} """
+        rows = self.order_by().values_list("to_status").annotate(n=Count("id"))
+        return {SubmissionStatusEvent.STATUS_NAMES[code]: n for code, n in rows}
+
+    def decision_times(self):
+        """
+        Durées entre la soumission et la décision, une ligne par événement
+        de décision du queryset (sous-requête sur l'index (submission, timestamp)).
+        """
+        submitted_at = SubmissionStatusEvent.objects.filter(
+            submission_id=OuterRef("submission_id"), to_status=STATUS_CODES["submitted"],
+        ).order_by("timestamp").values("timestamp")[:1]
+        return (
+            self.filter(to_status__in=[STATUS_CODES[s] for s in DECISIONS])
+            .annotate(submitted_at=Subquery(submitted_at))
+            .exclude(submitted_at=None)
+            .annotate(duration=ExpressionWrapper(F("timestamp") - F("submitted_at"), output_field=DurationField()))
+        )
+
+    def median_decision_time(self):
+        # Médiane calculée par la base (ORDER BY + OFFSET) : rien n'est chargé en mémoire
+        durations = self.decision_times()
+        count = durations.count()
+        if not count:
+            return None
+        return durations.order_by("duration").values_list("duration", flat=True)[count // 2]
+
+
+class SubmissionStatusEvent(models.Model):
+    """
+    Une ligne par changement de statut, jamais modifiée ni supprimée.
+    Statuts stockés en petits entiers ; conference dupliquée depuis la
+    soumission pour filtrer sans jointure.
+    """
+    STATUS_CHOICES = [(code, name) for name, code in STATUS_CODES.items()]
+    STATUS_NAMES = dict(STATUS_CHOICES)
+
+    # Pas de contrainte de clé étrangère : l'historique survit à la suppression
+    submission = models.ForeignKey(
+        Submission, on_delete=models.DO_NOTHING, db_constraint=False, related_name="status_events",
+    )
+    conference = models.ForeignKey(
+        Conference, on_delete=models.DO_NOTHING, db_constraint=False, related_name="status_events",
+    )
+    from_status = models.PositiveSmallIntegerField(choices=STATUS_CHOICES, null=True)
+    to_status = models.PositiveSmallIntegerField(choices=STATUS_CHOICES)
+    source = models.PositiveSmallIntegerField(choices=SOURCES, default=SOURCE_CODES["save"])
+    timestamp = models.DateTimeField(default=timezone.now)
+
+    objects = SubmissionStatusEventQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # "combien de soumissions passées en revue cette semaine (par conférence)"
+            models.Index(fields=["conference", "to_status", "timestamp"], name="status_event_conf_idx"),
+            models.Index(fields=["to_status", "timestamp"], name="status_event_status_idx"),
+            # date de soumission d'un article (durée jusqu'à la décision)
+            models.Index(fields=["submission", "timestamp"], name="status_event_sub_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.submission_id} : {self.get_from_status_display()} -> {self.get_to_status_display()}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise TypeError("L'historique des statuts est en ajout seul.")
         super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise TypeError("L'historique des statuts est en ajout seul.")
+
+    @classmethod
+    def record(cls, changes, source="save"):
+        """ changes : liste de (submission_id, conference_id, ancien statut, nouveau statut). """
+        now = timezone.now()
+        cls.objects.bulk_create([
+            cls(
+                submission_id=submission_id,
+                conference_id=conference_id,
+                from_status=STATUS_CODES.get(old),
+                to_status=STATUS_CODES[new],
+                source=SOURCE_CODES[source],
+                timestamp=now,
+            )
+            for submission_id, conference_id, old, new in changes
+        ], batch_size=1000)
+
+
+# ===================================================================
+#   MODEL : NOMBRE DE LIGNES PAR JOUR (date_hierarchy de l'admin)
+# ===================================================================
+class DateBucket(models.Model):
+    """
+    Compteurs précalculés par jour, tenus à jour par les signaux : la navigation
+    par date de l'admin lit cette petite table au lieu d'agréger la grosse.
+    """
+    # Série : "<modèle>.<champ>", ex : "conference.start_date"
+    series = models.CharField(max_length=100)
+    day = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["series", "day"], name="date_bucket_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.series} {self.day} : {self.count}"
+
+    @classmethod
+    def add(cls, series, day, delta):
+        if day is None:
+            return
+        with transaction.atomic():
+            updated = cls.objects.filter(series=series, day=day).update(count=F("count") + delta)
+            if not updated and delta > 0:
+                cls.objects.create(series=series, day=day, count=delta)
+
+    @classmethod
+    def rebuild(cls, series, queryset, field):
+        """ Recalcule toute une série (après des bulk_create / update hors signaux). """
+        rows = queryset.order_by().values_list(field).annotate(n=Count("pk"))
+        with transaction.atomic():
+            cls.objects.filter(series=series).delete()
+            cls.objects.bulk_create(
+                [cls(series=series, day=day, count=n) for day, n in rows if day is not None],
+                batch_size=1000,
+            )
+
+
+# Séries tenues à jour : série -> (modèle, champ)
+DATE_BUCKET_SERIES = {
+    "conference.start_date": (Conference, "start_date"),
+    "submission.submission_date": (Submission, "submission_date"),
+}
+
+
+# ===================================================================
+#   MODEL : PAGE PUBLIQUE À REGÉNÉRER (file des snapshots statiques)
+# ===================================================================
+class PendingSnapshot(models.Model):
+    """
+    Une ligne par page à regénérer ("list", "detail:<pk>", "program:<pk>").
+    La clé unique dédoublonne : dix modifications d'une conférence avant le
+    passage du worker ne donnent qu'un rendu (voir ConferenceApp.snapshots).
+    """
+    page = models.CharField(max_length=100, unique=True)
+    # Date du dernier changement : le worker ne supprime la ligne que si elle
+    # n'a pas été re-signalée pendant le rendu
+    queued_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [models.Index(fields=["queued_at"], name="pending_snapshot_queued_idx")]
+
+    def __str__(self):
+        return self.page
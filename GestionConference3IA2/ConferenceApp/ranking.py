@@ -0,0 +1,173 @@
+"""
+Agrégation des évaluations (Review) et classement des soumissions par conférence.
+
+Pour chaque soumission :
+  - moyenne des notes et moyenne pondérée par la confiance ;
+  - note normalisée : chaque note est centrée-réduite par rapport aux notes du
+    même évaluateur (z-score), ce qui corrige les membres systématiquement
+    sévères ou généreux, puis moyennée avec la confiance comme poids.
+Le classement (note normalisée, puis moyenne pondérée) est calculé en NumPy
+pour toutes les conférences demandées en une passe, et gardé en cache par
+conférence : une évaluation modifiée ne fait recalculer que sa conférence.
+"""
+
+from dataclasses import dataclass
+from itertools import islice
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from .models import Review, Submission
+from .signals import RANKING_VERSION_KEY
+
+
+# ============================
+# Paramètres (surchargeables dans settings.RANKING)
+# ============================
+DEFAULTS = {
+    "MIN_REVIEWER_REVIEWS": 3,     # en dessous, l'évaluateur est comparé à toute la conférence
+    "CACHE_TIMEOUT": 24 * 3600,
+    "DECISION_CHUNK_SIZE": 500,    # soumissions décidées par transaction
+}
+
+RANKING_KEY = "ranking:{conference_id}:{version}"
+
+
+def ranking_setting(name):
+    return getattr(settings, "RANKING", {}).get(name, DEFAULTS[name])
+
+
+def _cache_keys(conference_ids):
+    versions = cache.get_many([RANKING_VERSION_KEY.format(conference_id=pk) for pk in conference_ids])
+    return {
+        pk: RANKING_KEY.format(
+            conference_id=pk, version=versions.get(RANKING_VERSION_KEY.format(conference_id=pk), 0),
+        )
+        for pk in conference_ids
+    }
+
+
+# ============================
+# CALCUL (vectorisé)
+# ============================
+def compute_rankings(conference_ids=None):
+    """
+    Renvoie {conference_id: [lignes triées par rang]}, chaque ligne étant un
+    dict (submission_id, reviews, mean, weighted_mean, normalized, rank).
+    Une seule requête pour toutes les conférences.
+    """
+    reviews = Review.objects.order_by()
+    if conference_ids is not None:
+        reviews = reviews.filter(reviewer__conference_id__in=conference_ids)
+    rows = list(reviews.values_list("reviewer__conference_id", "submission_id", "reviewer_id", "score", "confidence"))
+    rankings = {pk: [] for pk in conference_ids or ()}
+    if not rows:
+        return rankings
+
+    conference, submission, reviewer, score, confidence = (np.array(column) for column in zip(*rows))
+    score = score.astype(np.float64)
+    weight = confidence.astype(np.float64)
+
+    # Statistiques par évaluateur (un membre de comité = une conférence)
+    _, reviewer_codes = np.unique(reviewer, return_inverse=True)
+    reviewer_count = np.bincount(reviewer_codes)
+    reviewer_mean = np.bincount(reviewer_codes, weights=score) / reviewer_count
+    reviewer_std = np.sqrt(np.maximum(
+        np.bincount(reviewer_codes, weights=score ** 2) / reviewer_count - reviewer_mean ** 2, 0,
+    ))
+
+    # Repli : évaluateur avec trop peu de notes (ou toutes identiques) -> statistiques de la conférence
+    _, conference_codes = np.unique(conference, return_inverse=True)
+    conference_count = np.bincount(conference_codes)
+    conference_mean = np.bincount(conference_codes, weights=score) / conference_count
+    conference_std = np.sqrt(np.maximum(
+        np.bincount(conference_codes, weights=score ** 2) / conference_count - conference_mean ** 2, 0,
+    ))
+    mean = reviewer_mean[reviewer_codes]
+    std = reviewer_std[reviewer_codes]
+    fallback = (reviewer_count[reviewer_codes] < ranking_setting("MIN_REVIEWER_REVIEWS")) | (std == 0)
+    mean = np.where(fallback, conference_mean[conference_codes], mean)
+    std = np.where(fallback, conference_std[conference_codes], std)
+    z = np.divide(score - mean, std, out=np.zeros_like(score), where=std > 0)
+
+    # Agrégats par soumission
+    submission_ids, first, submission_codes = np.unique(submission, return_index=True, return_inverse=True)
+    submission_conference = conference[first]
+    count = np.bincount(submission_codes)
+    total_weight = np.bincount(submission_codes, weights=weight)
+    means = np.bincount(submission_codes, weights=score) / count
+    weighted = np.bincount(submission_codes, weights=weight * score) / total_weight
+    normalized = np.bincount(submission_codes, weights=weight * z) / total_weight
+
+    # Classement par conférence : tri (conférence, -normalisée, -pondérée), rang = position dans le groupe
+    order = np.lexsort((-weighted, -normalized, submission_conference))
+    sorted_conference = submission_conference[order]
+    starts = np.flatnonzero(np.r_[True, sorted_conference[1:] != sorted_conference[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    rank = np.arange(len(order)) - group_start + 1
+
+    for i, position in zip(order.tolist(), rank.tolist()):
+        rankings.setdefault(int(submission_conference[i]), []).append({
+            "submission_id": str(submission_ids[i]),
+            "reviews": int(count[i]),
+            "mean": round(float(means[i]), 3),
+            "weighted_mean": round(float(weighted[i]), 3),
+            "normalized": round(float(normalized[i]), 3),
+            "rank": position,
+        })
+    return rankings
+
+
+def get_rankings(conference_ids):
+    """ Classements en cache ; les conférences absentes du cache sont recalculées ensemble. """
+    keys = _cache_keys(conference_ids)
+    cached = cache.get_many(list(keys.values()))
+    rankings = {pk: cached[key] for pk, key in keys.items() if key in cached}
+    missing = [pk for pk in conference_ids if pk not in rankings]
+    if missing:
+        computed = compute_rankings(missing)
+        cache.set_many({keys[pk]: computed[pk] for pk in missing}, ranking_setting("CACHE_TIMEOUT"))
+        rankings.update(computed)
+    return rankings
+
+
+def get_ranking(conference_id):
+    return get_rankings([conference_id])[conference_id]
+
+
+# ============================
+# DÉCISION DES N MEILLEURES
+# ============================
+@dataclass
+class DecisionReport:
+    accepted: int = 0
+    rejected: int = 0
+
+
+def _chunks(ids, size):
+    it = iter(ids)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def decide_top(conference_id, n, reject_others=False, chunk_size=None):
+    """
+    Accepte les `n` soumissions "under review" les mieux classées de la
+    conférence (et refuse les autres évaluées si `reject_others`). Les
+    soumissions sans évaluation ne sont pas touchées. Les statuts changent
+    par change_status() (historique, notifications), un lot par transaction.
+    """
+    ranked = [row["submission_id"] for row in get_ranking(conference_id)]
+    pending = set(
+        Submission.objects.filter(conference_id=conference_id, status="under review")
+        .values_list("submission_id", flat=True)
+    )
+    ranked = [pk for pk in ranked if pk in pending]
+    chunk_size = chunk_size or ranking_setting("DECISION_CHUNK_SIZE")
+
+    report = DecisionReport()
+    for chunk in _chunks(ranked[:n], chunk_size):
+        report.accepted += Submission.objects.filter(submission_id__in=chunk).change_status("accepted")
+    if reject_others:
+        for chunk in _chunks(ranked[n:], chunk_size):
+            report.rejected += Submission.objects.filter(submission_id__in=chunk).change_status("rejected")
+    return report
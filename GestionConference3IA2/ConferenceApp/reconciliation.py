@@ -0,0 +1,169 @@
+import csv
+import re
+import unicodedata
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+from difflib import SequenceMatcher
+from django.db import transaction
+from django.db.models.functions import Lower
+from GestionConference3IA2.concurrency import bump_version
+from .models import Submission
+from .signals import invalidate_analytics
+
+
+# Colonnes du fichier de la comptabilité (submission_id peut être vide :
+# on se rabat alors sur email + titre)
+LEDGER_COLUMNS = ["submission_id", "name", "email", "title", "amount"]
+
+# Similarité minimale des titres et écart minimal avec le 2e candidat
+TITLE_MIN_RATIO = 0.85
+TITLE_MIN_GAP = 0.05
+
+
+# ============================
+# RAPPORT DE RAPPROCHEMENT
+# ============================
+class ReconciliationReport:
+    def __init__(self):
+        self.lines = 0
+        self.matched = 0          # soumissions passées à payed=True
+        self.already_payed = 0    # déjà marquées payées en base
+        self.fuzzy = 0            # trouvées par email + titre
+        self.unmatched = []       # liste de (numéro de ligne, message)
+        self.ambiguous = []       # liste de (numéro de ligne, submission_id candidats)
+
+    def rows(self):
+        """ Lignes du rapport CSV (non rapprochées puis ambiguës). """
+        for line, message in self.unmatched:
+            yield line, "unmatched", message
+        for line, candidates in self.ambiguous:
+            yield line, "ambiguous", " ".join(candidates)
+
+
+def normalize_title(title):
+    # minuscules, sans accents ni ponctuation : "L'IA  générative" -> "l ia generative"
+    title = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode().lower()
+    return " ".join(re.findall(r"[a-z0-9]+", title))
+
+
+# ============================
+# RAPPROCHEMENT PRINCIPAL
+# ============================
+def reconcile_ledger(lines, chunk_size=5000, dry_run=False):
+    """
+    Rapproche un export comptable (itérable de lignes CSV) des soumissions,
+    lu en flux par lots de `chunk_size` lignes :
+      - index par submission_id : une requête in_bulk par lot ;
+      - sinon email + titre approché (difflib), une requête par lot ;
+      - mise à jour de payed par lot, dans une transaction.
+    """
+    report = ReconciliationReport()
+    reader = csv.DictReader(lines)
+    fields = reader.fieldnames or []
+    if "amount" not in fields or "submission_id" not in fields and not {"email", "title"} <= set(fields):
+        report.unmatched.append((1, "En-tête invalide : amount et submission_id (ou email + title) requis"))
+        return report
+
+    seen = set()
+    batch = []
+    # La ligne 1 est l'en-tête
+    for line, row in enumerate(reader, start=2):
+        batch.append((line, row))
+        if len(batch) >= chunk_size:
+            _reconcile_batch(batch, report, seen, dry_run)
+            batch = []
+    if batch:
+        _reconcile_batch(batch, report, seen, dry_run)
+    return report
+
+
+def _match_title(title, candidates):
+    """
+    candidates : liste de (submission_id, titre normalisé).
+    Renvoie (submission_id, None) ou (None, liste des candidats ambigus).
+    """
+    wanted = normalize_title(title)
+    scored = sorted(
+        ((SequenceMatcher(None, wanted, other).ratio(), pk) for pk, other in candidates),
+        reverse=True,
+    )
+    if not scored or scored[0][0] < TITLE_MIN_RATIO:
+        return None, []
+    close = [pk for ratio, pk in scored if scored[0][0] - ratio < TITLE_MIN_GAP]
+    if len(close) > 1:
+        return None, close
+    return scored[0][1], None
+
+
+def _reconcile_batch(batch, report, seen, dry_run):
+    report.lines += len(batch)
+
+    # 1. Lecture et validation des lignes (sans accès à la base)
+    rows = []
+    for line, row in batch:
+        try:
+            amount = Decimal((row.get("amount") or "").replace(",", ".").strip())
+        except InvalidOperation:
+            report.unmatched.append((line, "Montant invalide"))
+            continue
+        if amount <= 0:
+            report.unmatched.append((line, "Montant nul ou négatif"))
+            continue
+        rows.append((
+            line,
+            (row.get("submission_id") or "").strip().upper(),
+            (row.get("email") or "").strip().lower(),
+            (row.get("title") or "").strip(),
+        ))
+
+    # 2. Index par identifiant : une seule requête pour le lot
+    by_id = Submission.objects.only("submission_id", "payed").in_bulk(
+        [sid for _, sid, _, _ in rows if sid], field_name="submission_id",
+    )
+
+    # 3. Repli email + titre pour les lignes restantes : une requête pour le lot
+    fallback = [(line, email, title) for line, sid, email, title in rows if sid not in by_id and email and title]
+    by_email = defaultdict(list)
+    payed = {pk: submission.payed for pk, submission in by_id.items()}
+    # Les emails du fichier sont en minuscules : la comparaison se fait sur LOWER(email)
+    for pk, email, title, is_payed in Submission.objects.annotate(
+        user_email=Lower("user__email"),
+    ).filter(
+        user_email__in={email for _, email, _ in fallback},
+    ).values_list("submission_id", "user_email", "title", "payed"):
+        by_email[email].append((pk, normalize_title(title)))
+        payed[pk] = is_payed
+
+    # 4. Décision ligne par ligne
+    to_update = []
+    for line, sid, email, title in rows:
+        if sid in by_id:
+            pk = sid
+        elif email and title:
+            pk, candidates = _match_title(title, by_email.get(email, []))
+            if candidates:
+                report.ambiguous.append((line, candidates))
+                continue
+            if pk is None:
+                report.unmatched.append((line, f"Aucune soumission pour {sid or email}"))
+                continue
+            report.fuzzy += 1
+        else:
+            report.unmatched.append((line, f"Soumission {sid or '(vide)'} introuvable"))
+            continue
+
+        if pk in seen:
+            report.unmatched.append((line, f"Paiement en double pour {pk} dans le fichier"))
+            continue
+        seen.add(pk)
+        if payed[pk]:
+            report.already_payed += 1
+        else:
+            to_update.append(pk)
+
+    # 5. Écriture : une requête UPDATE ... WHERE submission_id IN (...) par lot
+    if not dry_run and to_update:
+        with transaction.atomic():
+            Submission.objects.filter(submission_id__in=to_update).update(payed=True, **bump_version())
+        invalidate_analytics()
+    report.matched += len(to_update)
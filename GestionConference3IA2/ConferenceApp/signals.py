@@ -0,0 +1,137 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from SessionApp.models import Session
+from UserApp.models import OrganizingCommittee
+from .autocomplete import conference_index, conference_texts
+from .async_views import CONFERENCE_DETAIL_CACHE_KEY, CONFERENCE_LIST_CACHE_KEY
+from .models import Conference, DateBucket, Review, Submission
+from .snapshots import conference_pages, enqueue as enqueue_snapshots
+from .status import status_changed
+
+
+# ============================
+# Invalidation du cache des vues asynchrones
+# ============================
+@receiver(post_save, sender=Conference)
+@receiver(post_delete, sender=Conference)
+def invalidate_conference_cache(sender, instance, **kwargs):
+    cache.delete_many([
+        CONFERENCE_LIST_CACHE_KEY,
+        CONFERENCE_DETAIL_CACHE_KEY.format(pk=instance.pk),
+    ])
+
+
+# ============================
+# Index d'autocomplétion (mise à jour incrémentale)
+# ============================
+@receiver(post_save, sender=Conference)
+def update_conference_index(sender, instance, **kwargs):
+    conference_index.update(instance.pk, instance.name, conference_texts(instance.name))
+
+
+@receiver(post_delete, sender=Conference)
+def remove_from_conference_index(sender, instance, **kwargs):
+    conference_index.remove(instance.pk)
+
+
+# ============================
+# Compteurs par jour de la navigation par date de l'admin (DateBucket)
+# ============================
+@receiver(post_save, sender=Conference)
+def update_conference_buckets(sender, instance, created, **kwargs):
+    old_day = None if created else instance._loaded_start_date
+    if old_day != instance.start_date:
+        if old_day is not None:
+            DateBucket.add("conference.start_date", old_day, -1)
+        DateBucket.add("conference.start_date", instance.start_date, 1)
+    instance._loaded_start_date = instance.start_date
+
+
+@receiver(post_delete, sender=Conference)
+def remove_conference_bucket(sender, instance, **kwargs):
+    DateBucket.add("conference.start_date", instance.start_date, -1)
+
+
+@receiver(post_save, sender=Submission)
+def update_submission_buckets(sender, instance, created, **kwargs):
+    # submission_date (auto_now_add) ne change jamais après la création
+    if created:
+        DateBucket.add("submission.submission_date", instance.submission_date, 1)
+
+
+@receiver(post_delete, sender=Submission)
+def remove_submission_bucket(sender, instance, **kwargs):
+    DateBucket.add("submission.submission_date", instance.submission_date, -1)
+
+
+# ============================
+# Version des données des statistiques (ConferenceApp.analytics)
+# ============================
+ANALYTICS_VERSION_KEY = "analytics:version"
+
+
+def invalidate_analytics():
+    """
+    Les statistiques en cache sont indexées par cette version : l'incrémenter
+    suffit à faire recalculer le prochain rapport.
+    """
+    try:
+        cache.incr(ANALYTICS_VERSION_KEY)
+    except ValueError:
+        cache.set(ANALYTICS_VERSION_KEY, 1, None)
+
+
+@receiver(post_save, sender=Submission)
+@receiver(post_delete, sender=Submission)
+@receiver(post_save, sender=Conference)
+@receiver(post_delete, sender=Conference)
+def submissions_changed(sender, **kwargs):
+    invalidate_analytics()
+
+
+@receiver(status_changed)
+def statuses_changed(sender, **kwargs):
+    # change_status() (actions de masse) passe par update(), sans post_save
+    invalidate_analytics()
+
+
+# ============================
+# Classement des soumissions (ConferenceApp.ranking), une version par conférence
+# ============================
+RANKING_VERSION_KEY = "ranking:version:{conference_id}"
+
+
+def invalidate_ranking(conference_id):
+    key = RANKING_VERSION_KEY.format(conference_id=conference_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def review_changed(sender, instance, **kwargs):
+    # Seule la conférence de l'évaluation est recalculée au prochain affichage
+    conference_id = (
+        OrganizingCommittee.objects.filter(pk=instance.reviewer_id).values_list("conference_id", flat=True).first()
+    )
+    if conference_id is not None:
+        invalidate_ranking(conference_id)
+
+
+# ============================
+# Snapshots statiques des pages publiques (ConferenceApp.snapshots)
+# ============================
+@receiver(post_save, sender=Conference)
+@receiver(post_delete, sender=Conference)
+def conference_snapshots(sender, instance, **kwargs):
+    enqueue_snapshots(conference_pages(instance.pk))
+
+
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+def session_snapshots(sender, instance, **kwargs):
+    # Seul le programme affiche les sessions
+    enqueue_snapshots([f"program:{instance.conference_id}"])
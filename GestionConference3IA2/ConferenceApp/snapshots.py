@@ -0,0 +1,216 @@
+"""
+Snapshots statiques des pages publiques : liste des conférences, détail
+d'une conférence et programme JSON de ses sessions.
+
+- Les signaux ajoutent les pages touchées par un changement de Conference /
+  Session à la file PendingSnapshot (dans la même transaction).
+- La commande render_snapshots vide la file : chaque page est rendue par sa
+  vue Django, comme pour un visiteur anonyme, avec plusieurs threads, puis
+  écrite de façon atomique (fichier temporaire + os.replace).
+- Les fichiers suivent les URLs (conferences/liste/index.html,
+  conferences/<pk>/index.html, conferences/<pk>/program.json) : nginx peut
+  les servir directement (try_files), sinon SnapshotMiddleware les renvoie
+  aux visiteurs anonymes sans passer par la base.
+"""
+
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.db.models import Q
+from django.http import Http404, HttpRequest
+from django.urls import resolve, reverse
+from django.utils import timezone
+from archiveApp.models import ArchivedConference
+from .models import Conference, PendingSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+# ============================
+# Paramètres (surchargeables dans settings.SNAPSHOTS)
+# ============================
+DEFAULTS = {
+    "ROOT": None,          # dossier des fichiers (None : <BASE_DIR>/snapshots)
+    "SERVE": False,        # SnapshotMiddleware actif (inutile si nginx sert le dossier)
+    "WORKERS": 4,          # threads de rendu
+    "BATCH_SIZE": 200,     # pages prises dans la file à chaque passage
+}
+
+LIST_PAGE = "list"
+
+
+def snapshots_setting(name):
+    return getattr(settings, "SNAPSHOTS", {}).get(name, DEFAULTS[name])
+
+
+def snapshot_root():
+    return snapshots_setting("ROOT") or os.path.join(settings.BASE_DIR, "snapshots")
+
+
+# ============================
+# PAGES, URLS ET FICHIERS
+# ============================
+def conference_pages(conference_id):
+    """ Pages touchées par un changement de la conférence. """
+    return [LIST_PAGE, f"detail:{conference_id}", f"program:{conference_id}"]
+
+
+def page_url(page):
+    kind, _, pk = page.partition(":")
+    if kind == LIST_PAGE:
+        return reverse("liste_conferences")
+    return reverse({"detail": "conference_details", "program": "conference_program"}[kind], args=[int(pk)])
+
+
+def snapshot_path(url):
+    """
+    Fichier d'une URL ("/conferences/3/" -> <root>/conferences/3/index.html),
+    None si l'URL sort du dossier ou désigne un fichier caché (temporaire).
+    """
+    root = os.path.realpath(snapshot_root())
+    relative = url.lstrip("/") + ("index.html" if url.endswith("/") else "")
+    path = os.path.realpath(os.path.join(root, relative))
+    if not path.startswith(root + os.sep) or os.path.basename(path).startswith("."):
+        return None
+    return path
+
+
+# ============================
+# FILE DES CHANGEMENTS
+# ============================
+def enqueue(pages):
+    """ Ajoute (ou re-date) les pages à regénérer ; une ligne par page. """
+    now = timezone.now()
+    PendingSnapshot.objects.bulk_create(
+        [PendingSnapshot(page=page, queued_at=now) for page in sorted(set(pages))],
+        update_conflicts=True, unique_fields=["page"], update_fields=["queued_at"],
+    )
+
+
+def enqueue_all():
+    pages = [LIST_PAGE]
+    for model in (Conference, ArchivedConference):
+        for pk in model.objects.values_list("pk", flat=True).iterator():
+            pages += conference_pages(pk)[1:]
+    enqueue(pages)
+    return len(pages)
+
+
+# ============================
+# RENDU
+# ============================
+def _anonymous_request(url):
+    request = HttpRequest()
+    request.method = "GET"
+    request.path = request.path_info = url
+    request.META = {"SERVER_NAME": "snapshot", "SERVER_PORT": "80", "REQUEST_METHOD": "GET"}
+    request.user = AnonymousUser()
+    return request
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        # Le serveur ne voit jamais un fichier à moitié écrit
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def render_page(page):
+    """ Rend la page par sa vue ; "written", ou "removed" si elle n'existe plus (404). """
+    url = page_url(page)
+    path = snapshot_path(url)
+    match = resolve(url)
+    try:
+        response = match.func(_anonymous_request(url), *match.args, **match.kwargs)
+    except Http404:
+        response = None
+    if response is None or response.status_code == 404:
+        if os.path.exists(path):
+            os.unlink(path)
+        return "removed"
+    if hasattr(response, "render"):
+        response.render()
+    if response.status_code != 200:
+        raise ValueError(f"{url} : statut {response.status_code}")
+    _write(path, response.content)
+    return "written"
+
+
+def _render_pages(pages):
+    results = {}
+    for page in pages:
+        try:
+            results[page] = render_page(page)
+        except Exception:
+            logger.exception("Snapshot %s impossible", page)
+            results[page] = "failed"
+    return results
+
+
+def _render_in_thread(pages):
+    try:
+        return _render_pages(pages)
+    finally:
+        # Connexion ouverte par ce thread du pool
+        connection.close()
+
+
+@dataclass
+class RenderReport:
+    written: int = 0
+    removed: int = 0
+    failed: int = 0
+    elapsed_s: float = 0.0
+    # Pages en erreur : laissées dans la file, mais plus reprises par ce worker
+    failed_pages: set = field(default_factory=set)
+
+
+def process_queue(report, workers=None, batch_size=None):
+    """
+    Un passage du worker : prend jusqu'à batch_size pages, les rend en
+    parallèle et retire de la file celles qui n'ont pas changé entre-temps.
+    Renvoie le nombre de pages prises (0 : file vide).
+    """
+    workers = workers or snapshots_setting("WORKERS")
+    claimed = list(
+        PendingSnapshot.objects.exclude(page__in=report.failed_pages).order_by("queued_at", "pk")
+        [:batch_size or snapshots_setting("BATCH_SIZE")]
+    )
+    if not claimed:
+        return 0
+    start = time.perf_counter()
+    pages = [row.page for row in claimed]
+    chunks = [pages[i::workers] for i in range(workers) if pages[i::workers]]
+    if len(chunks) == 1:
+        results = _render_pages(pages)
+    else:
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            for chunk_results in pool.map(_render_in_thread, chunks):
+                results.update(chunk_results)
+
+    done = [row for row in claimed if results[row.page] != "failed"]
+    if done:
+        condition = Q()
+        for row in done:
+            condition |= Q(pk=row.pk, queued_at=row.queued_at)
+        PendingSnapshot.objects.filter(condition).delete()
+    for page, outcome in results.items():
+        setattr(report, outcome, getattr(report, outcome) + 1)
+        if outcome == "failed":
+            report.failed_pages.add(page)
+    report.elapsed_s += time.perf_counter() - start
+    return len(claimed)
+
@@ -0,0 +1,35 @@
+// Autocomplétion des <select data-autocomplete-url="..."> (voir ConferenceApp.forms.AutocompleteSelect)
+document.addEventListener("DOMContentLoaded", function () {
+    document.querySelectorAll("select[data-autocomplete-url]").forEach(function (select) {
+        if (select.disabled) {
+            return;
+        }
+        var input = document.createElement("input");
+        input.type = "search";
+        input.placeholder = "Rechercher...";
+        select.parentNode.insertBefore(input, select);
+
+        var timer = null;
+        input.addEventListener("input", function () {
+            clearTimeout(timer);
+            timer = setTimeout(function () {
+                var url = select.dataset.autocompleteUrl + "?q=" + encodeURIComponent(input.value);
+                fetch(url, {credentials: "same-origin"})
+                    .then(function (response) { return response.json(); })
+                    .then(function (data) {
+                        // On garde l'option sélectionnée, on remplace les autres
+                        Array.from(select.options).forEach(function (option) {
+                            if (!option.selected && option.value) {
+                                option.remove();
+                            }
+                        });
+                        data.results.forEach(function (result) {
+                            if (!select.querySelector('option[value="' + result.id + '"]')) {
+                                select.add(new Option(result.text, result.id));
+                            }
+                        });
+                    });
+            }, 150);
+        });
+    });
+});
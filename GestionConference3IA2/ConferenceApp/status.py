@@ -0,0 +1,58 @@
+from django.core.exceptions import ValidationError
+from django.dispatch import Signal
+
+
+# ============================
+# MACHINE À ÉTATS DES SOUMISSIONS
+# ============================
+# None : création de la soumission. accepted / rejected sont des états finaux
+# (UpdateSubmission interdit déjà toute modification une fois la décision prise).
+TRANSITIONS = {
+    None: {"submitted"},
+    "submitted": {"under review", "accepted", "rejected"},
+    "under review": {"submitted", "accepted", "rejected"},
+    "accepted": set(),
+    "rejected": set(),
+}
+
+DECISIONS = ("accepted", "rejected")
+
+# Codes entiers stockés dans l'historique (schéma compact)
+STATUS_CODES = {"submitted": 1, "under review": 2, "accepted": 3, "rejected": 4}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+# Origine d'un changement de statut
+SOURCES = [
+    (1, "save"),       # save() direct (shell, code)
+    (2, "form"),       # formulaire du site
+    (3, "admin"),      # formulaire de l'admin
+    (4, "bulk"),       # action de masse (queryset.change_status)
+    (5, "backfill"),   # reprise de l'existant à la migration
+]
+SOURCE_CODES = {name: code for code, name in SOURCES}
+
+# Envoyé après chaque changement de statut enregistré (save() ou action de masse),
+# dans la transaction du changement.
+# changes : liste de (submission_id, user_id, title, ancien statut, nouveau statut)
+status_changed = Signal()
+
+
+class InvalidTransition(ValidationError):
+    pass
+
+
+def allowed_sources(new_status):
+    """ Statuts depuis lesquels on peut passer à `new_status`. """
+    return [old for old, targets in TRANSITIONS.items() if old and new_status in targets]
+
+
+def check_transition(old_status, new_status):
+    # Les anciennes lignes sans statut ("") sont traitées comme une création
+    old_status = old_status or None
+    if old_status == new_status:
+        return
+    if new_status not in TRANSITIONS.get(old_status, ()):
+        raise InvalidTransition(
+            f"Transition interdite : {old_status or 'création'} -> {new_status}",
+            code="invalid_transition",
+        )
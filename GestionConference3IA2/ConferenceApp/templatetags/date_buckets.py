@@ -0,0 +1,79 @@
+import datetime
+from django import template
+from django.db.models import Max, Min
+from django.utils import formats
+from django.utils.text import capfirst
+from ..models import DateBucket
+
+register = template.Library()
+
+
+# Utilisation (templates change_list de l'admin) :
+#   {% load date_buckets %} {% bucketed_date_hierarchy cl %}
+# Même rendu que {% date_hierarchy cl %}, mais les années / mois / jours proposés
+# viennent de DateBucket au lieu d'une agrégation sur toute la table.
+# Les choix ne tiennent pas compte des autres filtres de la liste.
+@register.inclusion_tag("admin/date_hierarchy.html")
+def bucketed_date_hierarchy(cl):
+    field_name = cl.date_hierarchy
+    buckets = DateBucket.objects.filter(series=f"{cl.opts.model_name}.{field_name}", count__gt=0)
+    year_field, month_field, day_field = (f"{field_name}__{part}" for part in ("year", "month", "day"))
+    year_lookup = cl.params.get(year_field)
+    month_lookup = cl.params.get(month_field)
+    day_lookup = cl.params.get(day_field)
+
+    def link(filters):
+        return cl.get_query_string(filters, [f"{field_name}__"])
+
+    if not (year_lookup or month_lookup or day_lookup):
+        # Niveau de départ : l'année (et le mois) s'il n'y en a qu'un(e)
+        date_range = buckets.aggregate(first=Min("day"), last=Max("day"))
+        if date_range["first"] and date_range["first"].year == date_range["last"].year:
+            year_lookup = date_range["first"].year
+            if date_range["first"].month == date_range["last"].month:
+                month_lookup = date_range["first"].month
+
+    if year_lookup and month_lookup and day_lookup:
+        day = datetime.date(int(year_lookup), int(month_lookup), int(day_lookup))
+        return {
+            "show": True,
+            "back": {
+                "link": link({year_field: year_lookup, month_field: month_lookup}),
+                "title": capfirst(formats.date_format(day, "YEAR_MONTH_FORMAT")),
+            },
+            "choices": [{"title": capfirst(formats.date_format(day, "MONTH_DAY_FORMAT"))}],
+        }
+    if year_lookup and month_lookup:
+        days = buckets.filter(day__year=year_lookup, day__month=month_lookup).dates("day", "day")
+        return {
+            "show": True,
+            "back": {"link": link({year_field: year_lookup}), "title": str(year_lookup)},
+            "choices": [
+                {
+                    "link": link({year_field: year_lookup, month_field: month_lookup, day_field: day.day}),
+                    "title": capfirst(formats.date_format(day, "MONTH_DAY_FORMAT")),
+                }
+                for day in days
+            ],
+        }
+    if year_lookup:
+        months = buckets.filter(day__year=year_lookup).dates("day", "month")
+        return {
+            "show": True,
+            "back": {"link": link({}), "title": "Toutes les dates"},
+            "choices": [
+                {
+                    "link": link({year_field: year_lookup, month_field: month.month}),
+                    "title": capfirst(formats.date_format(month, "YEAR_MONTH_FORMAT")),
+                }
+                for month in months
+            ],
+        }
+    return {
+        "show": True,
+        "back": None,
+        "choices": [
+            {"link": link({year_field: str(year.year)}), "title": str(year.year)}
+            for year in buckets.dates("day", "year")
+        ],
+    }
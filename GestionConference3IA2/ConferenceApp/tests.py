@@ -1,3 +1,828 @@
-from django.test import TestCase
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time as clock
+from datetime import date, time
+from importlib import import_module
+from io import StringIO
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from GestionConference3IA2.admin_tools import EstimatedCountPaginator
+from GestionConference3IA2.concurrency import ConflictError
+from GestionConference3IA2.db_router import use_replica
+from GestionConference3IA2.prefix_index import PrefixIndex
+from GestionConference3IA2.middleware import QueryInstrumentationMiddleware, ReadReplicaMiddleware
+from GestionConference3IA2.profiling import make_token, profile_store
+from UserApp.models import OrganizingCommittee, User
+from . import autocomplete
+from .analytics import get_report
+from SessionApp.models import Session
+from .models import Conference, PendingSnapshot, Review, Submission, SubmissionStatusEvent
+from .ranking import decide_top, get_ranking
+from .reconciliation import reconcile_ledger
+from .snapshots import RenderReport, process_queue
+from .status import SOURCE_CODES, STATUS_CODES, InvalidTransition
 
-# Create your tests here.
+
+class OptimisticConcurrencyTests(TestCase):
+    def setUp(self):
+        self.conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        self.chair = User.objects.create_user(
+            username="chair", email="chair@esprit.tn", password="Conf-Pass-2025",
+            first_name="Chair", last_name="Person", role="commitee",
+        )
+        OrganizingCommittee.objects.create(
+            user=self.chair, conference=self.conference, commitee_role="chair", join_date=date(2026, 1, 1),
+        )
+
+    def _form_data(self, **changes):
+        data = {
+            "name": "Conf", "theme": "IA", "location": "Tunis", "description": "desc",
+            "start_date": "2026-05-01", "end_date": "2026-05-03", "expected_version": 1,
+        }
+        data.update(changes)
+        return data
+
+    def test_stale_save_raises_instead_of_overwriting(self):
+        first = Conference.objects.get(pk=self.conference.pk)
+        second = Conference.objects.get(pk=self.conference.pk)
+        first.location = "Sousse"
+        first.save()
+        second.location = "Sfax"
+        with self.assertRaises(ConflictError):
+            second.save()
+        self.conference.refresh_from_db()
+        self.assertEqual((self.conference.location, self.conference.version), ("Sousse", 2))
+
+    def test_update_view_shows_merge_form_on_conflict(self):
+        self.client.force_login(self.chair)
+        url = f"/conferences/edit/{self.conference.pk}/"
+        # Deux membres du comité ouvrent le formulaire à la version 1
+        self.assertEqual(self.client.post(url, self._form_data(location="Sousse")).status_code, 302)
+        response = self.client.post(url, self._form_data(location="Sfax"))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "modifié par quelqu&#x27;un d&#x27;autre")
+        self.assertContains(response, "Valeur enregistrée entre-temps : Sousse")
+        self.conference.refresh_from_db()
+        self.assertEqual(self.conference.location, "Sousse")
+        # Renvoyer le formulaire de fusion (version 2) applique le changement
+        self.assertEqual(
+            self.client.post(url, self._form_data(location="Sfax", expected_version=2)).status_code, 302,
+        )
+        self.conference.refresh_from_db()
+        self.assertEqual((self.conference.location, self.conference.version), ("Sfax", 3))
+
+
+class AnalyticsTests(TestCase):
+    def setUp(self):
+        conferences = [
+            Conference.objects.create(
+                name=name, theme=theme, location="Tunis", description="desc",
+                start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+            )
+            for name, theme in (("Conf IA", "IA"), ("Conf SC", "SC"))
+        ]
+        authors = [
+            User.objects.create_user(
+                username=f"author{i}", email=f"author{i}@esprit.tn", password="Conf-Pass-2025",
+                first_name="Au", last_name="Thor", affiliation=affiliation, nationality="TN",
+            )
+            for i, affiliation in enumerate(("ESPRIT", "INSAT"))
+        ]
+        for i in range(4):
+            Submission.objects.create(
+                title=f"Article {i}", abstract="Résumé", keywords="IA", paper="papers/a.pdf",
+                user=authors[i % 2], conference=conferences[i // 3], payed=i == 0,
+            )
+        # 3 soumissions de "Conf IA" : une acceptée, une refusée, une en attente
+        Submission.objects.filter(title__in=["Article 0", "Article 1"]).change_status("under review")
+        Submission.objects.filter(title="Article 0").change_status("accepted")
+        Submission.objects.filter(title="Article 1").change_status("rejected")
+
+    def test_grouped_rates(self):
+        report = get_report()
+        self.assertEqual(report["submissions"], 4)
+        theme = {row["label"]: row for row in report["dimensions"]["theme"]}
+        self.assertEqual(theme["Computer science & IA"]["submissions"], 3)
+        self.assertEqual(theme["Computer science & IA"]["decided"], 2)
+        self.assertEqual(theme["Computer science & IA"]["acceptance_rate"], 0.5)
+        self.assertEqual(theme["Computer science & IA"]["payed_rate"], 0.3333)
+        self.assertIsNotNone(theme["Computer science & IA"]["decision_median_days"])
+        self.assertIsNone(theme["Social sciences"]["acceptance_rate"])
+        affiliation = {row["label"]: row for row in report["dimensions"]["affiliation"]}
+        self.assertEqual((affiliation["ESPRIT"]["submissions"], affiliation["INSAT"]["submissions"]), (2, 2))
+
+    def test_cache_follows_data_version(self):
+        self.assertEqual(get_report()["dimensions"]["nationality"][0]["decided"], 2)
+        Submission.objects.filter(title="Article 2").change_status("under review")
+        Submission.objects.filter(title="Article 2").change_status("accepted")
+        self.assertEqual(get_report()["dimensions"]["nationality"][0]["decided"], 3)
+
+    def test_admin_csv_export(self):
+        admin = User.objects.create_superuser(
+            username="admin", email="admin@esprit.tn", password="Conf-Pass-2025", first_name="Ad", last_name="Min",
+        )
+        self.client.force_login(admin)
+        self.assertContains(self.client.get("/admin/ConferenceApp/submission/analytics/"), "Par thème")
+        response = self.client.get("/admin/ConferenceApp/submission/analytics/export/?dimension=theme")
+        lines = response.content.decode().splitlines()
+        self.assertEqual(lines[0].split(",")[:3], ["dimension", "groupe", "submissions"])
+        self.assertIn("theme,Computer science & IA,3,2,0.5,0.3333", lines[1])
+
+
+class RankingTests(TestCase):
+    def setUp(self):
+        self.conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        users = [
+            User.objects.create_user(
+                username=f"user{i}", email=f"user{i}@esprit.tn", password="Conf-Pass-2025",
+                first_name="U", last_name=str(i),
+            )
+            for i in range(3)
+        ]
+        self.harsh, self.generous = (
+            OrganizingCommittee.objects.create(
+                user=user, conference=self.conference, commitee_role="member", join_date=date(2026, 1, 1),
+            )
+            for user in users[:2]
+        )
+        self.submissions = [
+            Submission.objects.create(
+                title=f"Article {i}", abstract="Résumé", keywords="IA", paper="papers/a.pdf",
+                user=users[2], conference=self.conference,
+            )
+            for i in range(4)
+        ]
+        Submission.objects.all().change_status("under review")
+        # Le membre sévère note entre 3 et 5, le généreux entre 8 et 10 (A2 et A3 n'ont qu'une note)
+        for reviewer, scores in ((self.harsh, {0: 3, 1: 4, 2: 5}), (self.generous, {0: 8, 1: 10, 3: 9})):
+            for i, score in scores.items():
+                Review.objects.create(
+                    submission=self.submissions[i], reviewer=reviewer, score=score,
+                    confidence=5 if reviewer is self.harsh else 1,
+                )
+
+    def _order(self):
+        titles = {s.submission_id: s.title for s in self.submissions}
+        return [titles[row["submission_id"]] for row in get_ranking(self.conference.pk)]
+
+    def test_ranking_normalizes_reviewer_bias(self):
+        # Moyennes brutes : A3 (9) > A1 (7) > A0 (5.5) > A2 (5) ; A2 est la meilleure note du membre sévère
+        self.assertEqual(self._order(), ["Article 2", "Article 1", "Article 3", "Article 0"])
+        second = get_ranking(self.conference.pk)[1]
+        self.assertEqual((second["reviews"], second["mean"], second["weighted_mean"], second["rank"]), (2, 7.0, 5.0, 2))
+
+    def test_review_change_recomputes_its_conference(self):
+        self.assertEqual(self._order()[0], "Article 2")
+        review = Review.objects.get(submission=self.submissions[0], reviewer=self.harsh)
+        review.score = 6
+        review.save()
+        self.assertEqual(self._order()[0], "Article 0")
+
+    def test_decide_top_in_chunks(self):
+        report = decide_top(self.conference.pk, 1, reject_others=True, chunk_size=2)
+        self.assertEqual((report.accepted, report.rejected), (1, 3))
+        statuses = dict(Submission.objects.values_list("title", "status"))
+        self.assertEqual(statuses.pop("Article 2"), "accepted")
+        self.assertEqual(set(statuses.values()), {"rejected"})
+
+
+class PaperDownloadTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name))
+        os.makedirs(os.path.join(media.name, "papers"))
+        self.content = bytes(range(256)) * 40
+        with open(os.path.join(media.name, "papers", "a.pdf"), "wb") as f:
+            f.write(self.content)
+
+        conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        self.author, self.member, self.other = (
+            User.objects.create_user(
+                username=name, email=f"{name}@esprit.tn", password="Conf-Pass-2025", first_name="U", last_name=name,
+            )
+            for name in ("author", "member", "other")
+        )
+        OrganizingCommittee.objects.create(
+            user=self.member, conference=conference, commitee_role="member", join_date=date(2026, 1, 1),
+        )
+        submission = Submission.objects.create(
+            title="Article", abstract="Résumé", keywords="IA", paper="papers/a.pdf",
+            user=self.author, conference=conference,
+        )
+        self.url = reverse("download_paper", args=[submission.pk])
+
+    def test_access_rules(self):
+        self.client.force_login(self.other)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.client.force_login(self.member)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.content)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+
+    def test_range_and_etag(self):
+        self.client.force_login(self.author)
+        response = self.client.get(self.url, headers={"Range": "bytes=100-199"})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 100-199/{len(self.content)}")
+        self.assertEqual(b"".join(response.streaming_content), self.content[100:200])
+        response.close()
+
+        suffix = self.client.get(self.url, headers={"Range": "bytes=-10"})
+        self.assertEqual(b"".join(suffix.streaming_content), self.content[-10:])
+        suffix.close()
+        self.assertEqual(self.client.get(self.url, headers={"Range": "bytes=99999-"}).status_code, 416)
+        etag = suffix["ETag"]
+        self.assertEqual(self.client.get(self.url, headers={"If-None-Match": etag}).status_code, 304)
+        # If-Range périmé : fichier complet
+        stale = self.client.get(self.url, headers={"Range": "bytes=0-9", "If-Range": '"0-0"'})
+        self.assertEqual(stale.status_code, 200)
+        stale.close()
+
+    @override_settings(FILE_SERVING={"MODE": "x-accel-redirect"})
+    def test_proxy_mode(self):
+        self.client.force_login(self.author)
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Accel-Redirect"], "/protected-media/papers/a.pdf")
+        self.assertEqual(response.content, b"")
+
+
+class SnapshotTests(TestCase):
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.root = root.name
+        self.enterContext(override_settings(SNAPSHOTS={"ROOT": self.root, "SERVE": True, "WORKERS": 1}))
+        self.conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+
+    def _pending(self):
+        return set(PendingSnapshot.objects.values_list("page", flat=True))
+
+    def _file(self, *parts):
+        return os.path.join(self.root, "conferences", *parts)
+
+    def test_changes_regenerate_only_affected_pages(self):
+        pk = str(self.conference.pk)
+        self.assertEqual(self._pending(), {"list", f"detail:{pk}", f"program:{pk}"})
+        process_queue(RenderReport())
+        self.assertEqual(self._pending(), set())
+        self.assertTrue(os.path.exists(self._file("liste", "index.html")))
+
+        Session.objects.create(
+            title="Keynote", topic="IA", session_day=date(2026, 5, 1), room="Salle 1",
+            start_time=time(9), end_time=time(10), conference=self.conference,
+        )
+        self.assertEqual(self._pending(), {f"program:{pk}"})
+        process_queue(RenderReport())
+        with open(self._file(pk, "program.json")) as f:
+            self.assertIn("Keynote", f.read())
+
+        self.conference.delete()
+        report = RenderReport()
+        process_queue(report)
+        self.assertEqual((report.written, report.removed), (1, 2))
+        self.assertFalse(os.path.exists(self._file(pk, "index.html")))
+
+    def test_anonymous_visitors_get_snapshot_without_queries(self):
+        process_queue(RenderReport())
+        url = f"/conferences/{self.conference.pk}/"
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response["X-Snapshot"], "hit")
+        # Mêmes en-têtes de sécurité qu'une page dynamique
+        self.assertEqual(response["X-Frame-Options"], "DENY")
+        self.assertEqual(response["X-Content-Type-Options"], "nosniff")
+        self.assertIn(b"Conf", b"".join(response.streaming_content))
+        response.close()
+
+        # Utilisateur connecté : page dynamique
+        user = User.objects.create_user(
+            username="u", email="u@esprit.tn", password="Conf-Pass-2025", first_name="U", last_name="V",
+        )
+        self.client.force_login(user)
+        self.assertFalse(self.client.get(url).has_header("X-Snapshot"))
+
+    async def test_async_chain_serves_snapshot(self):
+        await sync_to_async(process_queue)(RenderReport())
+        url = f"/conferences/{self.conference.pk}/"
+        response = await self.async_client.get(url)
+        self.assertEqual(response["X-Snapshot"], "hit")
+        self.assertEqual(response["X-Frame-Options"], "DENY")
+        response.close()
+        self.assertFalse((await self.async_client.get(f"{url}?page=2")).has_header("X-Snapshot"))
+
+
+class AdminPermissionTests(TestCase):
+    def setUp(self):
+        self.conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@esprit.tn", password="Conf-Pass-2025",
+            first_name="S", last_name="T", is_staff=True,
+        )
+        self.submission = Submission.objects.create(
+            title="Article", abstract="Résumé", keywords="IA", paper="papers/a.pdf",
+            user=self.staff, conference=self.conference,
+        )
+        self.staff.user_permissions.add(*Permission.objects.filter(codename__in=["view_submission", "view_conference"]))
+        self.client.force_login(self.staff)
+
+    def test_reconcile_requires_change_permission(self):
+        url = reverse("admin:ConferenceApp_submission_reconcile")
+        ledger = SimpleUploadedFile(
+            "ledger.csv", f"submission_id,name,email,title,amount\n{self.submission.pk},S T,staff@esprit.tn,Article,100\n".encode(),
+        )
+        self.assertEqual(self.client.post(url, {"ledger_file": ledger}).status_code, 403)
+        self.submission.refresh_from_db()
+        self.assertFalse(self.submission.payed)
+        self.assertNotContains(self.client.get(reverse("admin:ConferenceApp_submission_changelist")), url)
+
+    def test_decide_top_requires_submission_change_permission(self):
+        Submission.objects.all().change_status("under review")
+        member = OrganizingCommittee.objects.create(
+            user=self.staff, conference=self.conference, commitee_role="member", join_date=date(2026, 1, 1),
+        )
+        Review.objects.create(submission=self.submission, reviewer=member, score=8, confidence=3)
+        changelist = reverse("admin:ConferenceApp_conference_changelist")
+        data = {"action": "decide_top_submissions", "_selected_action": [self.conference.pk], "apply": "1", "n": 1}
+        # Modifier la conférence ne suffit pas : l'action change le statut des soumissions
+        self.staff.user_permissions.add(Permission.objects.get(codename="change_conference"))
+        self.assertNotContains(self.client.get(changelist), "decide_top_submissions")
+        self.client.post(changelist, data)
+        self.assertEqual(Submission.objects.get().status, "under review")
+
+        self.staff.user_permissions.add(Permission.objects.get(codename="change_submission"))
+        self.assertContains(self.client.get(changelist), "decide_top_submissions")
+        self.client.post(changelist, data)
+        self.assertEqual(Submission.objects.get().status, "accepted")
+
+
+class ReconciliationTests(TestCase):
+    def test_email_fallback_ignores_case(self):
+        conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        author = User.objects.create_user(
+            username="alice", email="Alice.Ben@esprit.tn", password="Conf-Pass-2025",
+            first_name="Alice", last_name="Ben",
+        )
+        submission = Submission.objects.create(
+            title="L'IA générative", abstract="Résumé", keywords="IA", paper="papers/a.pdf",
+            user=author, conference=conference,
+        )
+        report = reconcile_ledger([
+            "submission_id,name,email,title,amount",
+            ",Alice Ben,ALICE.BEN@esprit.tn,L'IA generative,100",
+        ])
+        self.assertEqual((report.matched, report.fuzzy, report.unmatched), (1, 1, []))
+        submission.refresh_from_db()
+        self.assertTrue(submission.payed)
+
+
+class GenerateFixturesTests(TestCase):
+    def _generate(self, *args):
+        call_command(
+            "generate_fixtures", "--seed", "7", "--conferences", "3", "--users", "5", "--submissions", "10",
+            "--sessions", "4", *args, stdout=StringIO(),
+        )
+        return (
+            list(User.objects.order_by("username").values_list("username", "user_id")),
+            list(Submission.objects.order_by("pk").values_list("pk", "user_id", "conference_id", "status")),
+        )
+
+    def test_same_seed_gives_same_rows(self):
+        first = self._generate()
+        self.assertEqual(self._generate("--flush"), first)
+
+    def test_second_run_without_flush_fails_clearly(self):
+        self._generate()
+        with self.assertRaisesMessage(CommandError, "--flush"):
+            self._generate()
+
+
+class AsyncMiddlewareTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+
+    def test_middleware_follows_the_chain_mode(self):
+        async def async_view(request):
+            return HttpResponse()
+
+        self.assertTrue(iscoroutinefunction(QueryInstrumentationMiddleware(async_view)))
+        self.assertFalse(iscoroutinefunction(QueryInstrumentationMiddleware(lambda request: HttpResponse())))
+
+    async def test_replica_flag_reaches_sync_code(self):
+        def sync_view(request):
+            return HttpResponse(str(use_replica.get()))
+
+        async def view(request):
+            return await sync_to_async(sync_view)(request)
+
+        middleware = ReadReplicaMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        for method, expected in (("get", b"True"), ("post", b"False")):
+            response = await middleware(getattr(RequestFactory(), method)("/"))
+            self.assertEqual(response.content, expected)
+        self.assertFalse(use_replica.get())
+
+    async def test_instrumentation_under_asgi(self):
+        response = await self.async_client.get(reverse("liste_conferences"))
+        self.assertEqual(response.status_code, 200)
+        # Les requêtes de la vue synchrone (exécutée par sync_to_async) sont comptées
+        self.assertRegex(response["Server-Timing"], r'desc="[1-9]\d* queries"')
+
+
+class ProfilingTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(PROFILING={**settings.PROFILING, "DIRECTORY": directory.name})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.staff, self.member = (
+            User.objects.create_user(
+                username=name, email=f"{name}@esprit.tn", password="Conf-Pass-2025",
+                first_name="P", last_name="R", is_staff=name == "staff",
+            )
+            for name in ("staff", "member")
+        )
+        self.url = reverse("liste_conferences")
+
+    def _profile_id(self, user, token):
+        self.client.force_login(user)
+        return self.client.get(self.url, HTTP_X_PROFILE=token).get("X-Profile-Id")
+
+    def test_signed_token_of_staff_user_is_profiled(self):
+        name = self._profile_id(self.staff, make_token(self.staff))
+        self.assertIsNotNone(name)
+        meta = profile_store.load(name)
+        self.assertEqual((meta["user"], meta["status"]), ("staff", 200))
+
+    def test_forged_or_foreign_tokens_are_ignored(self):
+        token = make_token(self.staff)
+        self.assertIsNone(self._profile_id(self.staff, token[:-1] + ("A" if token[-1] != "A" else "B")))
+        self.assertIsNone(self._profile_id(self.staff, make_token(self.member)))
+        self.assertIsNone(self._profile_id(self.member, make_token(self.member)))
+        self.assertEqual(profile_store.names(), [])
+
+    def test_store_rotation_keeps_the_newest_profiles(self):
+        with override_settings(PROFILING={**settings.PROFILING, "MAX_FILES": 2}):
+            names = [self._profile_id(self.staff, make_token(self.staff)) for _ in range(4)]
+            self.assertEqual(profile_store.names(), sorted(names[2:], reverse=True))
+
+    async def test_async_chain_is_profiled(self):
+        await self.async_client.aforce_login(self.staff)
+        response = await self.async_client.get(self.url, headers={"X-Profile": make_token(self.staff)})
+        self.assertEqual(response.status_code, 200)
+        meta = await sync_to_async(profile_store.load)(response["X-Profile-Id"])
+        self.assertEqual(meta["user"], "staff")
+
+
+class ReadReplicaRouterTests(SimpleTestCase):
+    # Processus séparés : en test la base est en mémoire et le routeur retombe sur "default"
+    def _manage(self, *args):
+        proc = subprocess.run(
+            [sys.executable, "manage.py", *args], cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=300,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+        return proc.stdout
+
+    def test_get_reads_use_on_disk_replica(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "routes.json")
+            self._manage(
+                "bench_routes", "--conferences", "5", "--users", "5", "--iterations", "2",
+                "--only", "conference_list", "conference_add", "api_sessions_list", "--output", output,
+            )
+            with open(output, encoding="utf-8") as f:
+                results = json.load(f)
+        for name in ("conference_list", "api_sessions_list"):
+            self.assertGreater(results[name]["replica_queries"], 0)
+            self.assertEqual(results[name]["replica_queries"], results[name]["queries"])
+        self.assertEqual(results["conference_add"]["replica_queries"], 0)
+
+    def test_replica_connection_is_read_only(self):
+        script = (
+            "from django.db import OperationalError, connections\n"
+            "from GestionConference3IA2.benchmark import disk_test_database\n"
+            "from GestionConference3IA2.db_router import use_replica\n"
+            "from ConferenceApp.models import Conference\n"
+            "with disk_test_database('router'):\n"
+            "    token = use_replica.set(True)\n"
+            "    queryset = Conference.objects.all()\n"
+            "    print(queryset.count(), queryset.db)\n"
+            "    use_replica.reset(token)\n"
+            "    try:\n"
+            "        connections['replica'].cursor().execute('CREATE TABLE t (x integer)')\n"
+            "    except OperationalError:\n"
+            "        print('lecture seule')\n"
+        )
+        self.assertEqual(self._manage("shell", "-v", "0", "-c", script).splitlines(), ["0 replica", "lecture seule"])
+
+
+class AutocompleteTests(TestCase):
+    def _conferences(self, names):
+        Conference.objects.bulk_create([
+            Conference(name=name, theme="IA", location="Tunis", description="desc",
+                       start_date=date(2026, 5, 1), end_date=date(2026, 5, 3))
+            for name in names
+        ])
+
+    def _index(self, loads=None):
+        def load():
+            if loads is not None:
+                loads.append(True)
+            return autocomplete._load()
+        return PrefixIndex(load, autocomplete._fallback, Conference.objects.count)
+
+    def test_lookup_under_5_ms(self):
+        words = ["deep", "learning", "vision", "robotique", "donnees", "securite", "cloud", "langage"]
+        self._conferences(f"{words[i % 8]} {words[i // 8 % 8]} {i}" for i in range(20000))
+        index = self._index()
+        index.search("a")
+        timings = []
+        for i in range(400):
+            start = clock.perf_counter()
+            self.assertTrue(index.search(words[i % 8][:1 + i % 4]))
+            timings.append(clock.perf_counter() - start)
+        timings.sort()
+        self.assertLess(timings[int(len(timings) * 0.95)], 0.005)
+
+    def test_fallback_matches_words_like_the_index(self):
+        self._conferences(["Deep learning 2026", "Learning systems", "Machine vision", "Unlearning"])
+        index = self._index()
+        index.rebuild()
+        with override_settings(AUTOCOMPLETE={"MAX_ENTRIES": 1}):
+            overflowing = self._index()
+            for query in ("learn", "2026", "machine vision", "vision"):
+                self.assertEqual(sorted(overflowing.search(query)), sorted(index.search(query)), query)
+            self.assertTrue(overflowing._overflow)
+
+    def test_overflow_is_remembered_until_rows_are_deleted(self):
+        self._conferences(f"Conf {i}" for i in range(10))
+        with override_settings(AUTOCOMPLETE={"MAX_ENTRIES": 15, "REBUILD_INTERVAL": 0}):
+            loads = []
+            index = self._index(loads)
+            index.search("conf")
+            self.assertTrue(index._overflow)
+            # Index périmé : comptage des lignes + recherche en base, sans tout relire
+            with self.assertNumQueries(2):
+                self.assertEqual(len(index.search("conf")), 10)
+            self.assertEqual(len(loads), 1)
+
+            Conference.objects.filter(name__in=["Conf 1", "Conf 2", "Conf 3"]).delete()
+            self.assertEqual(len(index.search("conf")), 7)
+            self.assertFalse(index._overflow)
+
+    def test_single_rebuild_and_updates_seen_during_it(self):
+        calls = []
+
+        def load():
+            calls.append(True)
+            clock.sleep(0.2)
+            yield 1, "Deep learning", ["Deep learning"]
+            # Sauvegarde d'une autre ligne pendant la lecture (signal post_save)
+            index.update(2, "Vision", ["Vision"])
+
+        index = PrefixIndex(load, lambda query, limit: [], lambda: 0)
+        threads = [threading.Thread(target=index.search, args=("deep",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(index.search("vis"), [(2, "Vision")])
+
+
+class StatusMachineTests(TestCase):
+    def setUp(self):
+        self.conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        self.author = User.objects.create_user(
+            username="author", email="author@esprit.tn", password="Conf-Pass-2025", first_name="Au", last_name="Thor",
+        )
+
+    def _submission(self, title="Article", **fields):
+        return Submission.objects.create(
+            title=title, abstract="Résumé", keywords="IA", paper="papers/a.pdf",
+            user=self.author, conference=self.conference, **fields,
+        )
+
+    def _events(self, submission):
+        return list(submission.status_events.order_by("id").values_list("from_status", "to_status"))
+
+    def test_invalid_transition_is_refused(self):
+        submission = self._submission()
+        submission.status = "accepted"
+        submission.save()
+        submission.status = "under review"
+        with self.assertRaises(InvalidTransition):
+            submission.save()
+        self.assertEqual(Submission.objects.get().status, "accepted")
+        with self.assertRaises(ValidationError) as ctx:
+            submission.full_clean()
+        self.assertIn("status", ctx.exception.message_dict)
+        self.assertEqual(
+            self._events(submission), [(None, STATUS_CODES["submitted"]), (STATUS_CODES["submitted"], STATUS_CODES["accepted"])],
+        )
+
+    def test_creation_must_start_as_submitted(self):
+        with self.assertRaises(InvalidTransition):
+            self._submission(status="accepted")
+        self.assertFalse(Submission.objects.exists())
+        self.assertFalse(SubmissionStatusEvent.objects.exists())
+
+    def test_change_status_writes_one_event_per_row(self):
+        for i in range(3):
+            self._submission(f"Article {i}")
+        Submission.objects.filter(title="Article 0").change_status("accepted")
+        # SAVEPOINT, lecture, UPDATE, un seul INSERT pour l'historique, RELEASE
+        with self.assertNumQueries(5):
+            changed = Submission.objects.all().change_status("under review")
+        self.assertEqual(changed, 2)
+        moved = SubmissionStatusEvent.objects.moved_to("under review")
+        self.assertEqual(sorted(moved.values_list("submission__title", flat=True)), ["Article 1", "Article 2"])
+        self.assertEqual(set(moved.values_list("source", flat=True)), {SOURCE_CODES["bulk"]})
+
+    def test_history_is_append_only(self):
+        self._submission()
+        event = SubmissionStatusEvent.objects.get()
+        with self.assertRaises(TypeError):
+            SubmissionStatusEvent.objects.update(to_status=STATUS_CODES["accepted"])
+        with self.assertRaises(TypeError):
+            SubmissionStatusEvent.objects.all().delete()
+        with self.assertRaises(TypeError):
+            event.save()
+        with self.assertRaises(TypeError):
+            event.delete()
+        self.assertEqual(SubmissionStatusEvent.objects.get().to_status, STATUS_CODES["submitted"])
+
+    def test_backfill_migration(self):
+        backfill_history = import_module("ConferenceApp.migrations.0004_submission_status_history").backfill_history
+        accepted = self._submission("Accepted")
+        accepted.status = "accepted"
+        accepted.save()
+        legacy = self._submission("Legacy")
+        # État d'avant la migration : pas d'historique, anciennes lignes sans statut
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SubmissionStatusEvent._meta.db_table}")
+        Submission.objects.filter(pk=legacy.pk).update(status="")
+
+        backfill_history(apps, None)
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.status, "submitted")
+        self.assertEqual(self._events(legacy), [(None, STATUS_CODES["submitted"])])
+        self.assertEqual(self._events(accepted), [(None, STATUS_CODES["accepted"])])
+        event = accepted.status_events.get()
+        self.assertEqual((event.source, event.timestamp), (SOURCE_CODES["backfill"], accepted.update_at))
+
+
+# Interpréteur neuf : l'admin et DRF ne doivent être chargés qu'au premier accès à leurs routes
+LAZY_URLS_SCRIPT = r"""
+import json, os, sys
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "GestionConference3IA2.settings")
+import django
+django.setup()
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+HEAVY = ("rest_framework.views", "rest_framework_simplejwt.authentication", "ConferenceApp.admin", "UserApp.admin")
+routes = [reverse(name) for name in ("liste_conferences", "session-list", "session_list_async", "token_obtain_pair")]
+report = {"resolved": [resolve(url).url_name for url in routes], "before": [m for m in HEAVY if m in sys.modules]}
+report["api_status"] = resolve("/api/sessions/").func(RequestFactory().get("/api/sessions/")).status_code
+report["api_loaded"] = [m for m in HEAVY if m in sys.modules]
+report["admin"] = [reverse("admin:ConferenceApp_submission_changelist"), resolve("/admin/login/").url_name]
+report["after"] = [m for m in HEAVY if m in sys.modules]
+print(json.dumps(report))
+"""
+
+
+class LazyURLTests(SimpleTestCase):
+    def test_heavy_modules_load_on_first_use(self):
+        proc = subprocess.run(
+            [sys.executable, "-c", LAZY_URLS_SCRIPT], cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=120,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+        report = json.loads(proc.stdout.strip().splitlines()[-1])
+        self.assertEqual(report["resolved"], ["liste_conferences", "session-list", "session_list_async", "token_obtain_pair"])
+        # reverse() de pages ordinaires : ni DRF ni les admin.py
+        self.assertEqual(report["before"], [])
+        self.assertEqual(report["api_status"], 401)
+        self.assertEqual(report["api_loaded"], ["rest_framework.views", "rest_framework_simplejwt.authentication"])
+        self.assertEqual(report["admin"], ["/admin/ConferenceApp/submission/", "login"])
+        self.assertIn("ConferenceApp.admin", report["after"])
+
+
+@override_settings(ADMIN_CHANGELIST={"COUNT_THRESHOLD": 5, "COUNT_CACHE_TIMEOUT": 300, "FACETS_CACHE_TIMEOUT": 60})
+class EstimatedCountPaginatorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _conferences(self, count, location="Tunis"):
+        Conference.objects.bulk_create([
+            Conference(name=f"Conf {location} {i}", theme="IA", location=location, description="desc",
+                       start_date=date(2026, 5, 1), end_date=date(2026, 5, 3))
+            for i in range(count)
+        ])
+
+    def _count(self, queryset):
+        return EstimatedCountPaginator(queryset.order_by("pk"), 2).count
+
+    def test_bounded_count_below_threshold(self):
+        self._conferences(3)
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self._count(Conference.objects.all()), 3)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn("LIMIT 6", ctx.captured_queries[0]["sql"])
+
+    def test_estimate_above_threshold_without_filter(self):
+        self._conferences(12)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        self._conferences(3, "Sfax")
+        # Comptage borné + statistiques de la table : l'estimation date de l'ANALYZE
+        with self.assertNumQueries(2):
+            self.assertEqual(self._count(Conference.objects.all()), 12)
+
+    def test_filtered_count_is_cached(self):
+        self._conferences(8)
+        self._conferences(2, "Sfax")
+        tunis = Conference.objects.filter(location="Tunis")
+        with self.assertNumQueries(2):
+            self.assertEqual(self._count(tunis), 8)
+        # Même filtre : seul le comptage borné est refait
+        with self.assertNumQueries(1):
+            self.assertEqual(self._count(Conference.objects.filter(location="Tunis")), 8)
+        with self.assertNumQueries(1):
+            self.assertEqual(self._count(Conference.objects.filter(location="Sfax")), 2)
+
+
+class CachedListFilterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        admin_user = User.objects.create_superuser(
+            username="admin", email="admin@esprit.tn", password="Conf-Pass-2025", first_name="A", last_name="D",
+        )
+        member = OrganizingCommittee.objects.create(
+            user=admin_user, conference=conference, commitee_role="member", join_date=date(2026, 1, 1),
+        )
+        submission = Submission.objects.create(
+            title="Article", abstract="Résumé", keywords="IA", paper="papers/a.pdf",
+            user=admin_user, conference=conference,
+        )
+        Review.objects.create(submission=submission, reviewer=member, score=8, confidence=3)
+        self.client.force_login(admin_user)
+
+    def _distinct_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertContains(response, "8 (1)")
+        return [q["sql"] for q in ctx.captured_queries if "DISTINCT" in q["sql"]]
+
+    def test_filter_values_are_cached(self):
+        url = reverse("admin:ConferenceApp_review_changelist") + "?_facets=1"
+        # score et confidence : un SELECT DISTINCT chacun, puis lus en cache
+        self.assertEqual(len(self._distinct_queries(url)), 2)
+        self.assertEqual(self._distinct_queries(url), [])
@@ -1,17 +1,24 @@
 from django.urls import path
 from . import views
 from .views import *
+from .async_views import conference_list_async, conference_details_async
 urlpatterns =[
  #path("liste/", views.list_conferences, name="liste_conferences"),
     path("liste/",ConferenceList.as_view(),name="liste_conferences"),
     path("<int:pk>/",ConferenceDetails.as_view(),name="conference_details"),
+    path("<int:pk>/program.json",conference_program,name="conference_program"),
+    path("autocomplete/",conference_autocomplete,name="conference_autocomplete"),
     path("add/",ConferenceCreate.as_view(),name="conference_add"),
     path("edit/<int:pk>/",ConferenceUpdate.as_view(),name="conference_update"),
     path("delete/<int:pk>/",ConferenceDelete.as_view(),name="conference_delete"),
+    # Versions asynchrones (ASGI) des pages de lecture
+    path("async/liste/",conference_list_async,name="liste_conferences_async"),
+    path("async/<int:pk>/",conference_details_async,name="conference_details_async"),
     #to add
     # Submissions
     path('submissions/', ListSubmissionsView.as_view(), name='list_submissions'),
     path('submissions/add/', AddSubmissionView.as_view(), name='add_submission'),
+    path('submissions/<str:pk>/paper/', download_paper, name='download_paper'),
     path('submissions/<str:pk>/', DetailSubmissionView.as_view(), name='detail_submission'),
     path('submissions/update/<str:pk>/', UpdateSubmission.as_view(), name='update_submission'),
 
@@ -1,3 +1,4 @@
+from django.http import JsonResponse
 from django.shortcuts import render
 from .models import Conference, Submission
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
@@ -5,6 +6,14 @@ from django.urls import reverse_lazy
 from .forms import ConferenceForm, SubmissionForm
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from archiveApp.models import ArchivedConference, ArchivedSession, ArchivedSubmission
+from SessionApp.models import Session
+from GestionConference3IA2.concurrency import OptimisticUpdateMixin
+from UserApp.permissions import get_committee_permissions
+from GestionConference3IA2.file_serving import serve_file
+from django.contrib.auth.decorators import login_required
+from .autocomplete import conference_index
 
 
 # ============================================================
@@ -35,6 +44,47 @@ class ConferenceDetails(DetailView):
     context_object_name = "conference"
     template_name = "conferences/details.html"
 
+    def get_object(self, queryset=None):
+        # Conférence passée archivée (archiveApp) : toujours consultable, en lecture seule
+        try:
+            return super().get_object(queryset)
+        except Http404:
+            return super().get_object(ArchivedConference.objects.all())
+
+
+# ============================================================
+#   PROGRAMME D'UNE CONFÉRENCE (JSON public, aussi pré-rendu en snapshot)
+# ============================================================
+PROGRAM_FIELDS = ("session_id", "title", "topic", "session_day", "start_time", "end_time", "room")
+
+
+def conference_program(request, pk):
+    fields = ("conference_id", "name", "location", "start_date", "end_date")
+    conference = Conference.objects.filter(pk=pk).values(*fields).first()
+    sessions = Session.objects
+    if conference is None:
+        conference = ArchivedConference.objects.filter(pk=pk).values(*fields).first()
+        sessions = ArchivedSession.objects
+    if conference is None:
+        raise Http404("Conférence introuvable")
+    program = sessions.filter(conference_id=pk).order_by("session_day", "start_time", "session_id")
+    return JsonResponse({"conference": conference, "sessions": list(program.values(*PROGRAM_FIELDS))})
+
+
+# ============================================================
+#   MIXIN : réservé au comité d'organisation de la conférence
+# ============================================================
+class ConferenceEditorRequiredMixin:
+    def get_object(self, queryset=None):
+        """
+        Vérifie le rôle de l'utilisateur dans le comité de CETTE conférence
+        (chair / co-chair). Les droits sont chargés une fois par requête.
+        """
+        conference = super().get_object(queryset)
+        if not get_committee_permissions(self.request).can_edit_conference(conference):
+            raise PermissionDenied("Vous ne faites pas partie du comité de cette conférence.")
+        return conference
+
 
 # ============================================================
 #   AJOUTER UNE CONFÉRENCE (seulement si connecté)
@@ -47,9 +97,9 @@ class ConferenceCreate(LoginRequiredMixin, CreateView):
 
 
 # ============================================================
-#   MODIFIER UNE CONFÉRENCE (seulement si connecté)
+#   MODIFIER UNE CONFÉRENCE (seulement le comité de la conférence)
 # ============================================================
-class ConferenceUpdate(LoginRequiredMixin, UpdateView):
+class ConferenceUpdate(LoginRequiredMixin, ConferenceEditorRequiredMixin, OptimisticUpdateMixin, UpdateView):
     model = Conference
     template_name = "conferences/form.html"
     form_class = ConferenceForm
@@ -57,9 +107,9 @@ class ConferenceUpdate(LoginRequiredMixin, UpdateView):
 
 
 # ============================================================
-#   SUPPRIMER UNE CONFÉRENCE
+#   SUPPRIMER UNE CONFÉRENCE (seulement le comité de la conférence)
 # ============================================================
-class ConferenceDelete(LoginRequiredMixin, DeleteView):
+class ConferenceDelete(LoginRequiredMixin, ConferenceEditorRequiredMixin, DeleteView):
     model = Conference
     template_name = "conferences/conference_confirm_delete.html"
     success_url = reverse_lazy("liste_conferences")
@@ -97,6 +147,37 @@ class DetailSubmissionView(LoginRequiredMixin, DetailView):
         """
         return Submission.objects.filter(user=self.request.user)
 
+    def get_object(self, queryset=None):
+        # Soumission d'une conférence archivée : lecture seule depuis l'archive
+        try:
+            return super().get_object(queryset)
+        except Http404:
+            return super().get_object(
+                ArchivedSubmission.objects.filter(user=self.request.user).select_related("conference")
+            )
+
+
+# ============================================================
+#   TÉLÉCHARGER L'ARTICLE D'UNE SUBMISSION
+# ============================================================
+@login_required
+def download_paper(request, pk):
+    """
+    L'auteur (comme DetailSubmissionView) ou un membre du comité de la
+    conférence (sauf pour ses propres articles). Le fichier est envoyé par
+    blocs / sendfile, avec Range et ETag (voir file_serving.py).
+    """
+    submission = (
+        Submission.objects.filter(pk=pk).only("submission_id", "paper", "user_id", "conference_id").first()
+        or ArchivedSubmission.objects.filter(pk=pk).only("submission_id", "paper", "user_id", "conference_id").first()
+    )
+    # 404 plutôt que 403 : on ne révèle pas l'existence des soumissions des autres
+    if submission is None or not (
+        submission.user_id == request.user.pk or get_committee_permissions(request).can_review(submission)
+    ):
+        raise Http404("Soumission introuvable")
+    return serve_file(request, submission.paper)
+
 
 # ============================================================
 #   AJOUTER UNE SUBMISSION
@@ -113,13 +194,14 @@ class AddSubmissionView(LoginRequiredMixin, CreateView):
         Sans cela, Django demanderait un champ user dans le formulaire.
         """
         form.instance.user = self.request.user
+        form.instance._status_source = "form"
         return super().form_valid(form)
 
 
 # ============================================================
 #   MODIFIER UNE SUBMISSION
 # ============================================================
-class UpdateSubmission(LoginRequiredMixin, UpdateView):
+class UpdateSubmission(LoginRequiredMixin, OptimisticUpdateMixin, UpdateView):
     model = Submission
     form_class = SubmissionForm
     template_name = "submissions/update_submission.html"
@@ -150,3 +232,15 @@ class UpdateSubmission(LoginRequiredMixin, UpdateView):
             if field in form.fields:
                 form.fields[field].disabled = True
         return form
+
+
+# ============================================================
+#   AUTOCOMPLÉTION DES CONFÉRENCES (?q=...)
+# ============================================================
+def conference_autocomplete(request):
+    """
+    Réponse au format attendu par les widgets d'autocomplétion :
+    {"results": [{"id": ..., "text": ...}]}
+    """
+    results = conference_index.search(request.GET.get("q", ""))
+    return JsonResponse({"results": [{"id": pk, "text": name} for pk, name in results]})
@@ -0,0 +1,174 @@
+"""
+Outils pour les listes de l'admin sur de grosses tables : pagination sans
+COUNT(*) complet et filtres dont les compteurs (facettes) et les valeurs
+proposées (SELECT DISTINCT) sont mis en cache.
+Contient aussi la gestion des conflits d'édition (modèles versionnés).
+Importé seulement par les admin.py (chargés au premier accès à /admin/).
+"""
+
+import hashlib
+from django.conf import settings
+from django.contrib import admin, messages
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.http import HttpResponseRedirect
+from django.utils.functional import cached_property
+from .concurrency import ConflictError, VersionedModelForm
+
+
+# ============================
+# Paramètres (surchargeables dans settings.ADMIN_CHANGELIST)
+# ============================
+DEFAULTS = {
+    "COUNT_THRESHOLD": 10000,     # en dessous : comptage exact (borné)
+    "COUNT_CACHE_TIMEOUT": 300,   # comptage exact d'une liste filtrée, en cache (s)
+    "FACETS_CACHE_TIMEOUT": 60,
+    "CHOICES_CACHE_TIMEOUT": 300, # valeurs distinctes proposées par un filtre (s)
+}
+
+
+def changelist_setting(name):
+    return getattr(settings, "ADMIN_CHANGELIST", {}).get(name, DEFAULTS[name])
+
+
+def _query_key(prefix, queryset):
+    try:
+        sql = f"{queryset.db}:{queryset.query}"
+    except EmptyResultSet:
+        return None
+    return f"{prefix}:{hashlib.md5(sql.encode()).hexdigest()}"
+
+
+# ============================
+# ESTIMATION DU NOMBRE DE LIGNES D'UNE TABLE
+# ============================
+def estimated_table_count(model, using="default"):
+    """
+    Nombre de lignes d'après les statistiques de la base (SQLite : sqlite_stat1,
+    rempli par ANALYZE ; PostgreSQL : pg_class.reltuples). None si indisponible.
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    if connection.vendor == "sqlite":
+        sql = "SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1"
+    elif connection.vendor == "postgresql":
+        sql = "SELECT reltuples::bigint FROM pg_class WHERE relname = %s"
+    else:
+        return None
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [table])
+            row = cursor.fetchone()
+    except DatabaseError:
+        # Pas encore de statistiques (ANALYZE jamais lancé)
+        return None
+    if not row or row[0] is None:
+        return None
+    count = int(str(row[0]).split()[0])
+    return count if count > 0 else None
+
+
+# ============================
+# PAGINATEUR À COMPTAGE ESTIMÉ
+# ============================
+class EstimatedCountPaginator(Paginator):
+    """
+    count :
+      - comptage exact borné (LIMIT seuil + 1) : coût indépendant de la taille de la table ;
+      - au-delà du seuil, sans filtre : estimation d'après les statistiques de la base ;
+      - au-delà du seuil, avec filtre : COUNT(*) exact mis en cache quelques minutes.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        threshold = changelist_setting("COUNT_THRESHOLD")
+        bounded = queryset.order_by()[:threshold + 1].count()
+        if bounded <= threshold:
+            return bounded
+
+        if not queryset.query.where:
+            estimate = estimated_table_count(queryset.model, queryset.db)
+            if estimate is not None:
+                return max(estimate, bounded)
+
+        key = _query_key("admin:count", queryset)
+        count = cache.get(key) if key else None
+        if count is None:
+            count = queryset.count()
+            if key:
+                cache.set(key, count, changelist_setting("COUNT_CACHE_TIMEOUT"))
+        return count
+
+
+# ============================
+# FILTRES : compteurs des facettes et valeurs proposées mis en cache
+# ============================
+class CachedFacetsMixin:
+    """
+    Compteurs des facettes en cache. Les valeurs proposées ne sont pas
+    concernées : les filtres à choix fixes (choices, booléens) n'en lisent
+    pas en base, celles de CachedAllValuesFieldListFilter ont leur propre cache.
+    """
+    def get_facet_queryset(self, changelist):
+        filtered_qs = changelist.get_queryset(self.request, exclude_parameters=self.expected_parameters())
+        prefix = f"admin:facets:{self.field_path}"
+        choices = getattr(self, "lookup_choices", None)
+        if choices is not None:
+            # Compteurs indexés par position : ils suivent la liste des valeurs
+            prefix += ":" + hashlib.md5(repr(list(choices)).encode()).hexdigest()
+        key = _query_key(prefix, filtered_qs)
+        counts = cache.get(key) if key else None
+        if counts is None:
+            counts = super().get_facet_queryset(changelist)
+            if key:
+                cache.set(key, counts, changelist_setting("FACETS_CACHE_TIMEOUT"))
+        return counts
+
+
+class CachedChoicesFieldListFilter(CachedFacetsMixin, admin.ChoicesFieldListFilter):
+    pass
+
+
+class CachedBooleanFieldListFilter(CachedFacetsMixin, admin.BooleanFieldListFilter):
+    pass
+
+
+class CachedAllValuesFieldListFilter(CachedFacetsMixin, admin.AllValuesFieldListFilter):
+    """ Valeurs distinctes de la colonne (SELECT DISTINCT) lues une fois par CHOICES_CACHE_TIMEOUT. """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        key = _query_key(f"admin:choices:{self.field_path}", self.lookup_choices)
+        choices = cache.get(key) if key else None
+        if choices is None:
+            choices = list(self.lookup_choices)
+            if key:
+                cache.set(key, choices, changelist_setting("CHOICES_CACHE_TIMEOUT"))
+        self.lookup_choices = choices
+
+
+# ============================
+# ÉDITION CONCURRENTE (modèles versionnés, voir concurrency.py)
+# ============================
+class OptimisticAdminMixin:
+    """
+    Formulaire avec la version lue à l'ouverture : un enregistrement fait
+    entre-temps par quelqu'un d'autre donne une erreur de fusion au lieu
+    d'être écrasé. Ajouter "expected_version" aux fieldsets éventuels.
+    """
+    form = VersionedModelForm
+
+    def changeform_view(self, request, object_id=None, form_url="", extra_context=None):
+        try:
+            return super().changeform_view(request, object_id, form_url, extra_context)
+        except ConflictError:
+            # Conflit apparu entre la validation du formulaire et le save() (rare)
+            self.message_user(
+                request,
+                "Cet élément vient d'être modifié par quelqu'un d'autre : vos changements n'ont pas "
+                "été enregistrés. Vérifiez les nouvelles valeurs puis recommencez.",
+                messages.ERROR,
+            )
+            return HttpResponseRedirect(request.get_full_path())
@@ -13,4 +13,19 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'GestionConference3IA2.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Flux SSE des sessions : connexions longues servies hors du handler Django
+# (voir sessionAppApi/sse.py), importé à la première connexion.
+SESSION_EVENTS_PATH = "/api/stream/sessions/"
+_session_events_app = None
+
+
+async def application(scope, receive, send):
+    global _session_events_app
+    if scope["type"] == "http" and scope["path"] == SESSION_EVENTS_PATH and scope["method"] == "GET":
+        if _session_events_app is None:
+            from sessionAppApi.sse import session_events_app
+            _session_events_app = session_events_app
+        return await _session_events_app(scope, receive, send)
+    return await django_application(scope, receive, send)
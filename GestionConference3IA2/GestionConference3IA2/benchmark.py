@@ -0,0 +1,220 @@
+"""
+Outils de mesure de charge partagés par les commandes de benchmark du projet.
+
+Le client HTTP est écrit avec asyncio (aucune dépendance externe) pour pouvoir
+maintenir plusieurs centaines de connexions simultanées depuis un seul processus.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+
+# ============================
+# FONCTION : percentile simple (méthode "nearest rank")
+# ============================
+def percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+# ============================
+# FONCTION : résumé statistique d'une série de latences (en secondes)
+# ============================
+def summarize(latencies, elapsed, errors=0):
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+# ============================
+# REQUÊTE HTTP/1.1 minimale sur une connexion neuve
+# ============================
+async def _fetch(host, port, path, headers, method="GET", body=b""):
+    reader, writer = await asyncio.open_connection(host, port)
+    lines = [f"{method} {path} HTTP/1.1", f"Host: {host}:{port}", "Connection: close"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    if body:
+        lines.append(f"Content-Length: {len(body)}")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    # On vide la réponse pour mesurer le temps complet de transfert
+    while await reader.read(65536):
+        pass
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (ConnectionError, OSError):
+        pass
+    return int(status_line.split()[1]) if status_line else 0
+
+
+async def _run_load(url, concurrency, total, headers, method, body):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                status = await _fetch(host, port, path, headers, method, body)
+            except (ConnectionError, OSError, asyncio.IncompleteReadError):
+                errors += 1
+                return
+            if status >= 400 or status == 0:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return summarize(latencies, time.perf_counter() - start, errors)
+
+
+# ============================
+# FONCTION PUBLIQUE : lancer `total` requêtes avec `concurrency` clients
+# ============================
+def run_http_load(url, concurrency=500, total=5000, headers=None, method="GET", body=b""):
+    """
+    Envoie `total` requêtes vers `url` en gardant au plus `concurrency`
+    requêtes en vol, et renvoie le débit (rps) et les percentiles de latence.
+    """
+    return asyncio.run(_run_load(url, concurrency, total, headers or {}, method, body))
+
+
+# ============================
+# JEU DE DONNÉES POUR LES BENCHMARKS (insertion en masse, sans save())
+# ============================
+def seed_dataset(conferences=1000, users=2000, submissions_per_user=5, sessions_per_conference=5, batch_size=2000):
+    """
+    Remplit la base courante avec un jeu de données volumineux.
+    Les identifiants (user_id, submission_id) sont calculés directement pour
+    éviter les boucles de génération de User.save() / Submission.save().
+    """
+    from datetime import date, time as dtime, timedelta
+    from django.contrib.auth.hashers import make_password
+    from ConferenceApp.models import Conference, Submission
+    from SessionApp.models import Session
+    from UserApp.models import OrganizingCommittee, User
+
+    themes = [code for code, _ in Conference.THEME]
+    statuses = [code for code, _ in Submission.STATUS]
+    start = date(2026, 1, 1)
+
+    Conference.objects.bulk_create(
+        [
+            Conference(
+                name=f"Conférence {i}", theme=themes[i % len(themes)], location="Tunis",
+                description="Conférence générée pour les benchmarks",
+                start_date=start + timedelta(days=i % 365),
+                end_date=start + timedelta(days=i % 365 + 2),
+            )
+            for i in range(conferences)
+        ],
+        batch_size=batch_size,
+    )
+    conference_ids = list(Conference.objects.order_by("-conference_id").values_list("pk", flat=True)[:conferences])
+
+    # Un seul hachage pour tous les utilisateurs générés
+    password = make_password("Bench-Pass-2025")
+    User.objects.bulk_create(
+        [
+            User(
+                user_id=f"USER{i:04X}", username=f"bench_user_{i}", email=f"bench{i}@esprit.tn",
+                first_name="Bench", last_name="User", affiliation="ESPRIT", nationality="TN",
+                password=password, role="participant",
+            )
+            for i in range(users)
+        ],
+        batch_size=batch_size,
+    )
+
+    Submission.objects.bulk_create(
+        [
+            Submission(
+                submission_id=f"SUB{u * submissions_per_user + k:08X}",
+                title=f"Article {u}-{k}", abstract="Résumé", keywords="IA, data",
+                paper="papers/bench.pdf", status=statuses[(u + k) % len(statuses)],
+                user_id=f"USER{u:04X}",
+                conference_id=conference_ids[(u * submissions_per_user + k) % len(conference_ids)],
+            )
+            for u in range(users)
+            for k in range(submissions_per_user)
+        ],
+        batch_size=batch_size,
+    )
+
+    Session.objects.bulk_create(
+        [
+            Session(
+                title=f"Session {c}-{k}", topic="IA", session_day=start, room=f"Salle {k}",
+                start_time=dtime(9 + k % 8), end_time=dtime(10 + k % 8), conference_id=c,
+            )
+            for c in conference_ids
+            for k in range(sessions_per_conference)
+        ],
+        batch_size=batch_size,
+    )
+
+    OrganizingCommittee.objects.bulk_create(
+        [
+            OrganizingCommittee(
+                user_id=f"USER{i % users:04X}", conference_id=c, join_date=start,
+                commitee_role=("chair", "co-chair", "member")[i % 3],
+            )
+            for i, c in enumerate(conference_ids)
+        ],
+        batch_size=batch_size,
+    )
+    return conference_ids
+
+
+# ============================
+# BASE DE TEST SUR DISQUE (benchmarks avec plusieurs écrivains)
+# ============================
+@contextmanager
+def disk_test_database(name):
+    """
+    Crée et migre une base de test SQLite dans un fichier temporaire. Une base
+    en mémoire partagée ne supporte pas plusieurs écrivains (pas de
+    busy_timeout en shared cache) : ici chaque thread a sa propre connexion, en WAL.
+    L'alias "replica" pointe sur le même fichier et garde ses OPTIONS (query_only) :
+    les lectures routées vers lui passent par une vraie connexion en lecture seule.
+    """
+    from django.db import connection, connections
+
+    replica = connections["replica"]
+    replica_settings = replica.settings_dict
+    with tempfile.TemporaryDirectory() as tmp:
+        connection.settings_dict["TEST"]["NAME"] = os.path.join(tmp, f"{name}.sqlite3")
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        # Comme set_as_test_mirror(), sans perdre le PRAGMA query_only du replica
+        replica.close()
+        replica.settings_dict = {**connection.settings_dict, "OPTIONS": replica_settings["OPTIONS"]}
+        try:
+            yield
+        finally:
+            connections.close_all()
+            replica.settings_dict = replica_settings
+            connection.creation.destroy_test_db(old_name, verbosity=0)
@@ -0,0 +1,146 @@
+"""
+Contrôle de concurrence optimiste : chaque ligne porte un numéro de version,
+et l'enregistrement est un "compare-and-swap"
+    UPDATE ... SET ..., version = version + 1 WHERE pk = %s AND version = %s
+Si un autre membre du comité a enregistré entre-temps, aucune ligne n'est
+modifiée et ConflictError est levée au lieu d'écraser ses changements.
+Aucun verrou n'est tenu pendant que le formulaire est ouvert.
+"""
+
+from django import forms
+from django.db import models, router, transaction
+from django.db.models import F
+
+
+class ConflictError(Exception):
+    """ La ligne a changé depuis sa lecture (version attendue != version en base). """
+
+    def __init__(self, instance, expected):
+        super().__init__(
+            f"{instance._meta.label} {instance.pk} : modifiée par ailleurs (version {expected} attendue)."
+        )
+        self.instance = instance
+        self.expected = expected
+
+    def current(self):
+        """ La version actuellement en base (None si la ligne a été supprimée). """
+        return type(self.instance)._base_manager.filter(pk=self.instance.pk).first()
+
+
+# ============================
+# MODÈLES VERSIONNÉS
+# ============================
+class VersionedModel(models.Model):
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, using=None, **kwargs):
+        # Savepoint : un conflit n'invalide pas la transaction de l'appelant
+        using = using or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, using=using, **kwargs)
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        # Même rôle que Model._do_update, avec la version dans le WHERE et le SET
+        expected = self.version
+        version_field = self._meta.get_field("version")
+        values = [(f, model, value) for f, model, value in values if f is not version_field]
+        values.append((version_field, None, F("version") + 1))
+        if base_qs.filter(pk=pk_val, version=expected)._update(values) > 0:
+            self.version = expected + 1
+            return True
+        if base_qs.filter(pk=pk_val).exists():
+            raise ConflictError(self, expected)
+        # Ligne absente : Django fait un INSERT (sauf update forcé)
+        return False
+
+
+def bump_version():
+    """ À ajouter aux queryset.update() qui modifient des champs éditables. """
+    return {"version": F("version") + 1}
+
+
+def etag(instance):
+    return f'"{instance.pk}-{instance.version}"'
+
+
+def parse_etag(value, instance):
+    """ Version annoncée par un en-tête If-Match (None si absent ou d'une autre ligne). """
+    for tag in (value or "").split(","):
+        tag = tag.strip().removeprefix("W/").strip('"')
+        pk, _, version = tag.rpartition("-")
+        if pk == str(instance.pk) and version.isdigit():
+            return int(version)
+    return None
+
+
+# ============================
+# FORMULAIRES
+# ============================
+class VersionedModelForm(forms.ModelForm):
+    """
+    Transporte la version lue à l'ouverture du formulaire (champ caché) : c'est
+    elle qui est comparée à l'enregistrement, pas celle relue au POST.
+    Sert aussi de `form` de base aux ModelAdmin des modèles versionnés.
+    """
+    expected_version = forms.IntegerField(widget=forms.HiddenInput, required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk is not None:
+            self.fields["expected_version"].initial = self.instance.version
+
+    def clean(self):
+        cleaned_data = super().clean()
+        version = cleaned_data.get("expected_version")
+        if self.instance.pk is not None and version is not None:
+            # Vérification anticipée (sans verrou) ; le compare-and-swap reste la garantie
+            current = type(self.instance)._base_manager.filter(pk=self.instance.pk).first()
+            if current is not None and current.version != version:
+                self.add_conflict(current)
+        return cleaned_data
+
+    def _post_clean(self):
+        super()._post_clean()
+        version = self.cleaned_data.get("expected_version")
+        if self.instance.pk is not None and version is not None:
+            self.instance.version = version
+
+    def add_conflict(self, current):
+        """
+        Réponse de fusion : chaque champ dont la valeur envoyée diffère de la
+        valeur en base affiche cette dernière. La version cachée est mise à
+        jour : renvoyer le formulaire tel quel écrase sciemment ces changements.
+        """
+        self.add_error(None, (
+            "Cet élément a été modifié par quelqu'un d'autre pendant votre édition. "
+            "Vérifiez les valeurs enregistrées ci-dessous puis enregistrez à nouveau."
+        ))
+        for name, field in list(self.fields.items()):
+            if name == "expected_version" or field.disabled or isinstance(field, forms.FileField):
+                continue
+            if name not in self.cleaned_data or not hasattr(current, name):
+                continue
+            saved = getattr(current, name)
+            if getattr(self.cleaned_data[name], "pk", self.cleaned_data[name]) != getattr(saved, "pk", saved):
+                self.add_error(name, f"Valeur enregistrée entre-temps : {saved}")
+        data = self.data.copy()
+        data[self.add_prefix("expected_version")] = current.version
+        self.data = data
+
+
+class OptimisticUpdateMixin:
+    """ Pour les UpdateView : un conflit au moment du save() réaffiche le formulaire. """
+
+    def form_valid(self, form):
+        try:
+            return super().form_valid(form)
+        except ConflictError as conflict:
+            current = conflict.current()
+            if current is None:
+                form.add_error(None, "Cet élément a été supprimé entre-temps.")
+            else:
+                form.add_conflict(current)
+            return self.form_invalid(form)
@@ -0,0 +1,40 @@
+from contextvars import ContextVar
+from django.db import connections
+
+# Vrai pendant le traitement d'une requête GET/HEAD (voir ReadReplicaMiddleware).
+# ContextVar : fonctionne aussi bien avec les threads (WSGI) qu'avec asyncio (ASGI).
+use_replica = ContextVar("use_replica", default=False)
+
+READ_ALIAS = "replica"
+WRITE_ALIAS = "default"
+
+
+class ReadReplicaRouter:
+    """
+    Envoie les lectures des requêtes GET/HEAD (listes, détails, API en lecture)
+    vers l'alias "replica" (même fichier SQLite, connexion query_only), et tout
+    le reste vers "default". Les commandes manage.py et les requêtes POST
+    lisent sur "default" pour voir leurs propres écritures en cours de transaction.
+    """
+
+    def db_for_read(self, model, **hints):
+        if use_replica.get() and not self._replica_in_memory():
+            return READ_ALIAS
+        return WRITE_ALIAS
+
+    @staticmethod
+    def _replica_in_memory():
+        # Base de test en mémoire (cache partagé) : une 2e connexion reste bloquée
+        # par la transaction ouverte de la 1re ("database table is locked")
+        name = str(connections[READ_ALIAS].settings_dict["NAME"])
+        return name == ":memory:" or "mode=memory" in name
+
+    def db_for_write(self, model, **hints):
+        return WRITE_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Les deux alias pointent sur la même base
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == WRITE_ALIAS
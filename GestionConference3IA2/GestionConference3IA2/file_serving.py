@@ -0,0 +1,150 @@
+"""
+Envoi de fichiers (articles PDF des soumissions) sans les charger en mémoire.
+
+- Mode par défaut : FileResponse sur le descripteur du fichier. Le contenu est
+  lu par blocs de BLOCK_SIZE, et un serveur WSGI qui fournit wsgi.file_wrapper
+  (gunicorn, uWSGI) l'envoie par os.sendfile() directement depuis le noyau.
+- Requêtes partielles (Range: bytes=a-b, If-Range) : 206 avec Content-Range ;
+  le descripteur est positionné au début de la plage et la lecture s'arrête
+  à sa fin (Content-Length borne aussi le sendfile de gunicorn).
+- If-None-Match : 304 sans ouvrir le fichier (ETag = taille + date de modification).
+- Modes "x-accel-redirect" (nginx) et "x-sendfile" (Apache, lighttpd) : la vue
+  ne fait que le contrôle d'accès, le proxy envoie le fichier lui-même.
+"""
+
+import mimetypes
+import os
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils.http import content_disposition_header, http_date, parse_etags
+
+
+# ============================
+# Paramètres (surchargeables dans settings.FILE_SERVING)
+# ============================
+DEFAULTS = {
+    "MODE": None,                          # None, "x-accel-redirect" ou "x-sendfile"
+    "ACCEL_PREFIX": "/protected-media/",   # location "internal" de nginx qui pointe sur MEDIA_ROOT
+    "BLOCK_SIZE": 64 * 1024,               # taille des lectures sans sendfile (ASGI, runserver)
+}
+
+
+def file_serving_setting(name):
+    return getattr(settings, "FILE_SERVING", {}).get(name, DEFAULTS[name])
+
+
+class FileSlice:
+    """
+    Vue en lecture seule sur [start, start + length) d'un fichier ouvert.
+    Pas de seek()/tell() : FileResponse ne recalcule pas Content-Length, et
+    fileno() donne le descripteur déjà positionné à wsgi.file_wrapper.
+    """
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b""
+        size = self.remaining if size is None or size < 0 else min(size, self.remaining)
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """
+    (début, fin incluse) d'une plage "bytes=" unique, None si l'en-tête est
+    absent ou ignoré (plusieurs plages, syntaxe invalide : réponse complète),
+    ValueError si la plage est hors du fichier (416).
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, sep, last = header[6:].strip().partition("-")
+    if not sep:
+        return None
+    if not first:
+        # Suffixe : les `last` derniers octets
+        if not last.isdigit():
+            return None
+        if int(last) == 0 or size == 0:
+            raise ValueError(header)
+        return max(0, size - int(last)), size - 1
+    if not first.isdigit() or last and (not last.isdigit() or int(last) < int(first)):
+        return None
+    start = int(first)
+    if start >= size:
+        raise ValueError(header)
+    return start, min(int(last), size - 1) if last else size - 1
+
+
+def _etag_matches(header, etag):
+    tags = parse_etags(header)
+    # Comparaison faible (RFC 9110) : W/"x" correspond à "x"
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+
+def serve_file(request, field_file, filename=None, content_type=None):
+    """
+    Réponse de téléchargement pour un FieldFile stocké sur le disque local
+    (FileSystemStorage). Le contrôle d'accès est fait par la vue appelante.
+    """
+    try:
+        path = field_file.path
+        stat = os.stat(path)
+    except (ValueError, FileNotFoundError):
+        raise Http404("Fichier introuvable")
+    filename = filename or os.path.basename(field_file.name)
+    content_type = content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+    last_modified = http_date(stat.st_mtime)
+
+    if _etag_matches(request.headers.get("If-None-Match", ""), etag):
+        response = HttpResponseNotModified()
+        response["ETag"] = etag
+        return response
+
+    mode = file_serving_setting("MODE")
+    if mode:
+        # Le proxy sert le fichier (et gère lui-même Range / If-None-Match)
+        response = HttpResponse(content_type=content_type)
+        if mode == "x-accel-redirect":
+            response["X-Accel-Redirect"] = file_serving_setting("ACCEL_PREFIX") + field_file.name
+        else:
+            response["X-Sendfile"] = path
+    else:
+        byte_range = None
+        if_range = request.headers.get("If-Range")
+        if if_range is None or if_range in (etag, last_modified):
+            try:
+                byte_range = parse_range(request.headers.get("Range"), stat.st_size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response["Content-Range"] = f"bytes */{stat.st_size}"
+                return response
+
+        file = open(path, "rb")
+        if byte_range is None:
+            response = FileResponse(file, content_type=content_type)
+        else:
+            start, end = byte_range
+            response = FileResponse(FileSlice(file, start, end - start + 1), content_type=content_type, status=206)
+            response["Content-Length"] = end - start + 1
+            response["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+        response.block_size = file_serving_setting("BLOCK_SIZE")
+        response["Accept-Ranges"] = "bytes"
+
+    response["ETag"] = etag
+    response["Last-Modified"] = last_modified
+    # Contenu réservé à l'auteur et au comité : jamais dans un cache partagé
+    response["Cache-Control"] = "private, no-cache"
+    response["Content-Disposition"] = content_disposition_header(True, filename)
+    return response
@@ -0,0 +1,183 @@
+"""
+Générateur de données synthétiques (conférences, utilisateurs, soumissions,
+comités, sessions) pour les benchmarks et le capacity planning.
+
+Toutes les valeurs dérivent de la graine (--seed) et du numéro de lot : deux
+exécutions avec la même graine produisent exactement les mêmes lignes, que la
+génération soit faite dans un seul processus ou répartie sur plusieurs.
+"""
+
+import itertools
+import random
+from datetime import date, datetime, time as dtime, timedelta
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+
+# ============================
+# Distributions "réalistes"
+# ============================
+THEME_WEIGHTS = {"IA": 0.55, "SE": 0.30, "SC": 0.15}
+STATUS_WEIGHTS = {"submitted": 0.40, "under review": 0.25, "accepted": 0.20, "rejected": 0.15}
+CITIES = ["Tunis", "Sousse", "Sfax", "Paris", "Lyon", "Montréal", "Berlin", "Madrid", "Rome", "Le Caire"]
+NATIONALITIES = ["TN", "FR", "DZ", "MA", "IT", "DE", "ES", "CA", "EG", "SN"]
+AFFILIATIONS = ["ESPRIT", "TEK-UP", "Central Univ", "SeaSame", "INSAT", "ENIT", "Sup'Com", "FST"]
+DOMAINS = ["esprit.tn", "seasame.com", "tek.tn", "central.net"]
+KEYWORDS = [
+    "deep learning", "IA", "data", "NLP", "vision", "cloud", "IoT", "sécurité", "blockchain",
+    "big data", "robotique", "optimisation", "graphes", "santé", "éducation", "énergie",
+    "réseaux", "bases de données", "compilation", "HPC", "quantique", "éthique", "économie",
+    "sociologie", "finance", "climat", "agriculture", "transport", "smart city", "5G",
+]
+FIRST_NAMES = ["Amine", "Sarra", "Yassine", "Meriem", "Omar", "Ines", "Karim", "Nour", "Hela", "Sami"]
+LAST_NAMES = ["Ben Ali", "Trabelsi", "Gharbi", "Jaziri", "Haddad", "Mansour", "Bouazizi", "Saidi"]
+ROOMS = [f"Salle {i}" for i in range(1, 13)]
+
+# Poids de Zipf (s = 1.1) sur le vocabulaire : quelques mots-clés très fréquents
+ZIPF_WEIGHTS = list(itertools.accumulate(1 / (rank ** 1.1) for rank in range(1, len(KEYWORDS) + 1)))
+
+START_DAY = date(2024, 1, 1)
+
+# Taille des lots écrits dans une même transaction
+CHUNK_SIZE = 50000
+
+
+def rng_for(seed, table, chunk):
+    # Graine dérivée : reproductible et indépendante de l'ordre d'exécution des lots
+    return random.Random(f"{seed}:{table}:{chunk}")
+
+
+def weighted(rng, weights):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def zipf_keywords(rng, count):
+    return ", ".join(dict.fromkeys(rng.choices(KEYWORDS, cum_weights=ZIPF_WEIGHTS, k=count)))
+
+
+def chunks(total, size=CHUNK_SIZE):
+    """ Découpe [0, total) en (numéro de lot, début, fin). """
+    return [(n, start, min(total, start + size)) for n, start in enumerate(range(0, total, size))]
+
+
+# ============================
+# Générateurs par table (un lot = une transaction)
+# ============================
+def write_conferences(seed, chunk, start, end, first_id, batch_size):
+    from ConferenceApp.models import Conference
+
+    rng = rng_for(seed, "conference", chunk)
+    rows = []
+    for i in range(start, end):
+        begin = START_DAY + timedelta(days=rng.randrange(0, 3 * 365))
+        theme = weighted(rng, THEME_WEIGHTS)
+        rows.append(Conference(
+            conference_id=first_id + i,
+            name=f"Conférence {theme} {i}",
+            theme=theme,
+            location=rng.choice(CITIES),
+            description=f"Conférence sur {zipf_keywords(rng, 3)}"[:300],
+            start_date=begin,
+            end_date=begin + timedelta(days=rng.choice([1, 2, 3, 3, 4, 5])),
+        ))
+    with transaction.atomic():
+        Conference.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
+
+
+def write_users(seed, chunk, start, end, user_ids, password, batch_size):
+    from UserApp.models import User
+
+    rng = rng_for(seed, "user", chunk)
+    rows = []
+    for i in range(start, end):
+        rows.append(User(
+            user_id=user_ids[i],
+            username=f"gen{seed}_{i}",
+            email=f"gen{seed}_{i}@{rng.choice(DOMAINS)}",
+            first_name=rng.choice(FIRST_NAMES),
+            last_name=rng.choice(LAST_NAMES),
+            affiliation=rng.choice(AFFILIATIONS),
+            nationality=rng.choice(NATIONALITIES),
+            role="commitee" if rng.random() < 0.05 else "participant",
+            password=password,
+        ))
+    with transaction.atomic():
+        User.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
+
+
+def write_submissions(seed, chunk, start, end, user_ids, conference_ids, batch_size):
+    from ConferenceApp.models import Submission
+
+    rng = rng_for(seed, "submission", chunk)
+    # Auteurs "prolifiques" : tirage biaisé vers le début de la liste
+    user_count, conference_count = len(user_ids), len(conference_ids)
+    rows = []
+    for i in range(start, end):
+        author = min(user_count - 1, int(rng.paretovariate(1.2)) - 1) if rng.random() < 0.3 \
+            else rng.randrange(user_count)
+        rows.append(Submission(
+            # SUB + 2 caractères de la graine + 6 du compteur (16,7 M soumissions max par graine)
+            submission_id=f"SUB{seed % 256:02X}{i:06X}",
+            title=f"Article {i}",
+            abstract=f"Travaux sur {zipf_keywords(rng, 4)}.",
+            keywords=zipf_keywords(rng, rng.randint(2, 5)),
+            paper=f"papers/generated_{i % 1000}.pdf",
+            status=weighted(rng, STATUS_WEIGHTS),
+            payed=rng.random() < 0.6,
+            user_id=user_ids[author],
+            conference_id=conference_ids[rng.randrange(conference_count)],
+        ))
+    with transaction.atomic():
+        Submission.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
+
+
+def write_sessions(seed, chunk, start, end, conferences, batch_size):
+    from SessionApp.models import Session
+
+    rng = rng_for(seed, "session", chunk)
+    rows = []
+    for i in range(start, end):
+        conference_id, begin, finish = conferences[rng.randrange(len(conferences))]
+        day = begin + timedelta(days=rng.randrange((finish - begin).days + 1))
+        # Créneaux qui se chevauchent : début toutes les 30 min entre 8h et 17h, durée 30 à 180 min
+        starts_at = datetime.combine(day, dtime(8)) + timedelta(minutes=30 * rng.randrange(19))
+        ends_at = starts_at + timedelta(minutes=rng.choice([30, 45, 60, 90, 120, 180]))
+        rows.append(Session(
+            title=f"Session {i}",
+            topic=zipf_keywords(rng, 1),
+            session_day=day,
+            start_time=starts_at.time(),
+            end_time=min(ends_at, datetime.combine(day, dtime(23, 59))).time(),
+            room=rng.choice(ROOMS),
+            conference_id=conference_id,
+        ))
+    with transaction.atomic():
+        Session.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
+
+
+def write_committees(seed, chunk, start, end, conference_ids, user_ids, per_conference, batch_size):
+    from UserApp.models import OrganizingCommittee
+
+    rng = rng_for(seed, "committee", chunk)
+    rows = []
+    for i in range(start, end):
+        members = rng.sample(range(len(user_ids)), min(per_conference, len(user_ids)))
+        for rank, member in enumerate(members):
+            rows.append(OrganizingCommittee(
+                user_id=user_ids[member],
+                conference_id=conference_ids[i],
+                commitee_role="chair" if rank == 0 else "co-chair" if rank == 1 else "member",
+                join_date=START_DAY + timedelta(days=rng.randrange(365)),
+            ))
+    with transaction.atomic():
+        OrganizingCommittee.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
+
+
+def hashed_password():
+    # Un seul hachage PBKDF2 partagé par tous les utilisateurs générés
+    return make_password("Generated-Pass-2025")
@@ -0,0 +1,104 @@
+"""
+Chargement paresseux des vues lourdes (DRF, simplejwt, admin).
+
+Les URLconfs n'importent plus ces modules : la vue n'est importée (et
+`as_view()` appelé) qu'à la première requête qui arrive sur la route.
+"""
+
+from django.urls import URLResolver
+from django.urls.resolvers import RoutePattern
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+
+
+def lazy_view(dotted_path, actions=None, csrf_exempt=False, is_async=False, **initkwargs):
+    """
+    Équivalent de `import_string(dotted_path).as_view(...)` retardé jusqu'au premier appel.
+    csrf_exempt doit être connu tout de suite (CsrfViewMiddleware le lit avant l'appel) :
+    le passer à True pour les vues DRF, qui sont déjà exemptées par APIView.as_view().
+    """
+    resolved = {}
+
+    def get_view():
+        view = resolved.get("view")
+        if view is None:
+            target = import_string(dotted_path)
+            if actions is not None:
+                view = target.as_view(actions, **initkwargs)
+            elif hasattr(target, "as_view"):
+                view = target.as_view(**initkwargs)
+            else:
+                view = target
+            resolved["view"] = view
+        return view
+
+    if is_async:
+        async def wrapper(request, *args, **kwargs):
+            return await get_view()(request, *args, **kwargs)
+    else:
+        def wrapper(request, *args, **kwargs):
+            return get_view()(request, *args, **kwargs)
+
+    wrapper.csrf_exempt = csrf_exempt
+    wrapper.__name__ = wrapper.__qualname__ = dotted_path.rsplit(".", 1)[-1]
+    return wrapper
+
+
+class LazyAdminURLConf:
+    """
+    URLconf de l'admin construite au premier accès : c'est seulement à ce moment
+    que les admin.py des applications sont importés (autodiscover).
+    """
+
+    @cached_property
+    def urlpatterns(self):
+        from django.contrib import admin
+
+        admin.autodiscover()
+        return admin.site.get_urls()
+
+
+class LazyURLResolver(URLResolver):
+    """
+    Le _populate() du résolveur racine (au premier reverse(), donc au premier
+    {% url %} de n'importe quelle page) appelle celui de chaque sous-résolveur,
+    ce qui chargerait l'URLconf de l'admin. Ici, l'index des noms n'est
+    construit qu'au premier reverse("admin:...") ; resolve() n'en a pas besoin.
+    """
+    _requested = False
+
+    def _populate(self):
+        if self._requested:
+            super()._populate()
+
+    def _request(self):
+        self._requested = True
+
+    def _reverse_with_prefix(self, *args, **kwargs):
+        self._request()
+        return super()._reverse_with_prefix(*args, **kwargs)
+
+    def _is_callback(self, name):
+        self._request()
+        return super()._is_callback(name)
+
+    @property
+    def reverse_dict(self):
+        self._request()
+        return super().reverse_dict
+
+    @property
+    def namespace_dict(self):
+        self._request()
+        return super().namespace_dict
+
+    @property
+    def app_dict(self):
+        self._request()
+        return super().app_dict
+
+
+def lazy_admin_urls(route="admin/"):
+    # Résolveur avec espace de noms "admin" : reverse() ne le parcourt que pour
+    # les noms "admin:...", donc les autres pages ne chargent jamais l'admin.
+    return LazyURLResolver(RoutePattern(route), LazyAdminURLConf(), app_name="admin", namespace="admin")
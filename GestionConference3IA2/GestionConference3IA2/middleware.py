@@ -0,0 +1,419 @@
+import cProfile
+import logging
+import mimetypes
+import random
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.signals import request_started
+from django.db import connections
+from django.http import FileResponse
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.middleware.security import SecurityMiddleware
+from .db_router import use_replica
+from .profiling import (
+    TOKEN_HEADER, TOKEN_PARAM, check_token, profile_store, profiler_lock, profiling_setting,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============================
+# Paramètres (surchargeables dans settings.SQL_INSTRUMENTATION)
+# ============================
+DEFAULTS = {
+    "ENABLED": True,
+    "N_PLUS_ONE_THRESHOLD": 5,  # même requête répétée N fois dans une page = N+1 suspect
+    "WINDOW": 1000,             # nombre de requêtes HTTP gardées par vue pour les percentiles
+}
+
+
+def instrumentation_setting(name):
+    return getattr(settings, "SQL_INSTRUMENTATION", {}).get(name, DEFAULTS[name])
+
+
+def _percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+# ============================
+# STATISTIQUES GLISSANTES PAR VUE (en mémoire du processus)
+# ============================
+class ViewStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def record(self, view, total_ms, db_ms, queries, n_plus_one):
+        with self._lock:
+            entry = self._views.get(view)
+            if entry is None:
+                entry = self._views[view] = {
+                    "samples": deque(maxlen=instrumentation_setting("WINDOW")),
+                    "hits": 0,
+                    "n_plus_one_hits": 0,
+                    "n_plus_one_queries": Counter(),
+                }
+            entry["samples"].append((total_ms, db_ms, queries))
+            entry["hits"] += 1
+            if n_plus_one:
+                entry["n_plus_one_hits"] += 1
+                entry["n_plus_one_queries"].update(n_plus_one)
+
+    def snapshot(self):
+        """
+        Résumé JSON-sérialisable : p50/p95 du temps total, du temps SQL
+        et du nombre de requêtes, plus les requêtes N+1 les plus fréquentes.
+        """
+        with self._lock:
+            views = {
+                name: (list(e["samples"]), e["hits"], e["n_plus_one_hits"], e["n_plus_one_queries"].most_common(5))
+                for name, e in self._views.items()
+            }
+        result = {}
+        for name, (samples, hits, n_plus_one_hits, n_plus_one_queries) in sorted(views.items()):
+            totals = [s[0] for s in samples]
+            db = [s[1] for s in samples]
+            queries = [s[2] for s in samples]
+            result[name] = {
+                "hits": hits,
+                "p50_ms": round(_percentile(totals, 50), 2),
+                "p95_ms": round(_percentile(totals, 95), 2),
+                "db_p50_ms": round(_percentile(db, 50), 2),
+                "db_p95_ms": round(_percentile(db, 95), 2),
+                "queries_p50": _percentile(queries, 50),
+                "queries_p95": _percentile(queries, 95),
+                "n_plus_one_hits": n_plus_one_hits,
+                "n_plus_one_queries": n_plus_one_queries,
+            }
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+view_stats = ViewStats()
+
+
+# ============================
+# Collecteurs de requêtes SQL
+# ============================
+class QueryCollector:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+
+    def add(self, sql, duration):
+        self.duration += duration
+        self.count += 1
+        # Les paramètres sont séparés du SQL : le texte sert d'empreinte
+        self.fingerprints[sql] += 1
+
+
+# Collecteurs actifs pour la requête en cours. Sous ASGI, les vues synchrones
+# tournent dans un autre thread, avec d'autres objets connexion (un par thread) :
+# une ContextVar, transmise par sync_to_async, suit la requête d'un thread à l'autre.
+_active_collectors = ContextVar("active_collectors", default=())
+
+
+def _dispatch(execute, sql, params, many, context):
+    collectors = _active_collectors.get()
+    if not collectors:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - start
+        for collector in collectors:
+            collector.add(sql, duration)
+
+
+def install_dispatch(**kwargs):
+    """ Branche _dispatch (une seule fois) sur les connexions du thread courant. """
+    for alias in connections:
+        wrappers = connections[alias].execute_wrappers
+        if _dispatch not in wrappers:
+            # En tête : les execute_wrapper() temporaires retirent le dernier élément
+            wrappers.insert(0, _dispatch)
+
+
+# request_started est reçu par le thread qui exécute la requête
+# (WSGI, ou le thread de sync_to_async de la requête sous ASGI)
+request_started.connect(install_dispatch, dispatch_uid="sql_instrumentation")
+
+
+@contextmanager
+def collect_queries(collector):
+    """ Ajoute le collecteur aux requêtes SQL de toutes les bases (DATABASES). """
+    install_dispatch()
+    token = _active_collectors.set(_active_collectors.get() + (collector,))
+    try:
+        yield collector
+    finally:
+        _active_collectors.reset(token)
+
+
+# ============================
+# BASE : middleware utilisable en WSGI comme en ASGI
+# ============================
+class HybridMiddleware:
+    """
+    Même principe que django.utils.deprecation.MiddlewareMixin : sous ASGI, si
+    la suite de la chaîne est asynchrone, __call__ renvoie la coroutine
+    __acall__ et Django n'ajoute pas d'aller-retour sync_to_async autour du
+    middleware. Les sous-classes commencent __call__ par ce test.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+
+# ============================
+# MIDDLEWARE : instrumentation SQL par requête
+# ============================
+class QueryInstrumentationMiddleware(HybridMiddleware):
+    """
+    Mesure pour chaque requête le nombre de requêtes SQL, le temps passé en
+    base et les requêtes répétées (N+1), ajoute un en-tête Server-Timing et
+    alimente les statistiques par vue (page /admin/sql-stats/).
+    """
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not instrumentation_setting("ENABLED"):
+            return self.get_response(request)
+
+        collector = QueryCollector()
+        start = time.perf_counter()
+        with collect_queries(collector):
+            response = self.get_response(request)
+        return self._record(request, response, collector, start)
+
+    async def __acall__(self, request):
+        if not instrumentation_setting("ENABLED"):
+            return await self.get_response(request)
+
+        collector = QueryCollector()
+        start = time.perf_counter()
+        # Les requêtes des vues synchrones (sync_to_async) passent par les mêmes connexions
+        with collect_queries(collector):
+            response = await self.get_response(request)
+        return self._record(request, response, collector, start)
+
+    def _record(self, request, response, collector, start):
+        total_ms = (time.perf_counter() - start) * 1000
+        db_ms = collector.duration * 1000
+
+        threshold = instrumentation_setting("N_PLUS_ONE_THRESHOLD")
+        n_plus_one = {sql: n for sql, n in collector.fingerprints.items() if n >= threshold}
+        match = request.resolver_match
+        view = (match.view_name or match.route) if match else "<unresolved>"
+        if n_plus_one:
+            logger.warning(
+                "N+1 probable sur %s (%s) : %s",
+                view, request.path,
+                "; ".join(f"{n}x {sql[:120]}" for sql, n in n_plus_one.items()),
+            )
+        view_stats.record(view, total_ms, db_ms, collector.count, n_plus_one)
+
+        response["Server-Timing"] = (
+            f'db;dur={db_ms:.2f};desc="{collector.count} queries", app;dur={total_ms - db_ms:.2f}'
+        )
+        return response
+
+
+# ============================
+# MIDDLEWARE : lectures des GET/HEAD sur la connexion en lecture seule
+# ============================
+class ReadReplicaMiddleware(HybridMiddleware):
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = use_replica.set(request.method in ("GET", "HEAD"))
+        try:
+            return self.get_response(request)
+        finally:
+            use_replica.reset(token)
+
+    async def __acall__(self, request):
+        # sync_to_async copie le contexte : les vues synchrones voient aussi use_replica
+        token = use_replica.set(request.method in ("GET", "HEAD"))
+        try:
+            return await self.get_response(request)
+        finally:
+            use_replica.reset(token)
+
+
+# ============================
+# MIDDLEWARE : profilage cProfile à la demande (staff)
+# ============================
+class ProfilingMiddleware(HybridMiddleware):
+    """
+    Profile la requête d'un membre du staff si elle porte un jeton signé
+    (en-tête X-Profile ou ?_profile=..., jeton donné par /admin/profiles/)
+    ou si elle est tirée au sort (PROFILING["SAMPLE_RATE"]).
+    Placé après AuthenticationMiddleware pour connaître l'utilisateur.
+    Sous ASGI, cProfile ne voit que le thread de la boucle d'événements (y compris
+    les autres requêtes servies pendant ce temps) : une vue synchrone exécutée
+    par sync_to_async n'apparaît que par son attente.
+    """
+
+    @staticmethod
+    def _candidate(request):
+        # Tests sans coût d'abord : request.user n'est chargé que si nécessaire.
+        # Renvoie le jeton ("" si tirage au sort), None si la requête n'est pas à profiler
+        if not profiling_setting("ENABLED"):
+            return None
+        token = request.META.get(TOKEN_HEADER) or request.GET.get(TOKEN_PARAM)
+        if not token and random.random() >= profiling_setting("SAMPLE_RATE"):
+            return None
+        return token or ""
+
+    @staticmethod
+    def _allowed(user, token):
+        if user is None or not (user.is_active and user.is_staff):
+            return False
+        return check_token(token, user) if token else True
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = self._candidate(request)
+        # Un autre profil est en cours (autre thread) : requête servie normalement
+        if token is None or not self._allowed(getattr(request, "user", None), token) \
+                or not profiler_lock.acquire(blocking=False):
+            return self.get_response(request)
+
+        try:
+            collector = QueryCollector()
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            with collect_queries(collector):
+                profiler.enable()
+                try:
+                    response = self.get_response(request)
+                finally:
+                    profiler.disable()
+            total_ms = (time.perf_counter() - start) * 1000
+        finally:
+            profiler_lock.release()
+        response["X-Profile-Id"] = profile_store.save(profiler, self._meta(request, response, collector, total_ms))
+        return response
+
+    async def __acall__(self, request):
+        token = self._candidate(request)
+        if token is None:
+            return await self.get_response(request)
+        user = await request.auser() if hasattr(request, "auser") else None
+        if not self._allowed(user, token) or not profiler_lock.acquire(blocking=False):
+            return await self.get_response(request)
+
+        try:
+            collector = QueryCollector()
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            with collect_queries(collector):
+                profiler.enable()
+                try:
+                    response = await self.get_response(request)
+                finally:
+                    profiler.disable()
+            total_ms = (time.perf_counter() - start) * 1000
+        finally:
+            profiler_lock.release()
+        # Écriture des fichiers du profil hors de la boucle d'événements
+        response["X-Profile-Id"] = await sync_to_async(profile_store.save)(
+            profiler, self._meta(request, response, collector, total_ms, user),
+        )
+        return response
+
+    @staticmethod
+    def _meta(request, response, collector, total_ms, user=None):
+        match = request.resolver_match
+        return {
+            "method": request.method,
+            "path": request.get_full_path(),
+            "view": (match.view_name or match.route) if match else "<unresolved>",
+            "user": (user or request.user).get_username(),
+            "status": response.status_code,
+            "timestamp": time.time(),
+            "total_ms": round(total_ms, 3),
+            "queries": collector.count,
+            "db_ms": round(collector.duration * 1000, 3),
+        }
+
+
+# ============================
+# MIDDLEWARE : pages publiques servies depuis les snapshots statiques
+# ============================
+class SnapshotMiddleware(HybridMiddleware):
+    """
+    Placé en premier : un visiteur anonyme (pas de cookie de session) qui
+    demande une page pré-rendue (ConferenceApp.snapshots) reçoit le fichier,
+    sans middleware, vue ni requête SQL. Sans snapshot, la requête suit son
+    cours normal. Désactivé si SNAPSHOTS["SERVE"] est faux (nginx sert le dossier).
+    """
+
+    def __init__(self, get_response):
+        from ConferenceApp.snapshots import snapshot_path, snapshots_setting
+
+        if not snapshots_setting("SERVE"):
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+        self.snapshot_path = snapshot_path
+        # Les middlewares de sécurité sont plus loin dans la chaîne : on applique
+        # leurs en-têtes (HSTS, nosniff, X-Frame-Options, ...) au fichier renvoyé
+        self.header_middlewares = [SecurityMiddleware(get_response), XFrameOptionsMiddleware(get_response)]
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self._snapshot(request)
+        if response is None:
+            response = self.get_response(request)
+        return response
+
+    async def __acall__(self, request):
+        response = self._snapshot(request)
+        if response is None:
+            response = await self.get_response(request)
+        return response
+
+    def _snapshot(self, request):
+        if (
+            request.method not in ("GET", "HEAD")
+            or request.META.get("QUERY_STRING")
+            or settings.SESSION_COOKIE_NAME in request.COOKIES
+        ):
+            return None
+        path = self.snapshot_path(request.path_info)
+        if path is None:
+            return None
+        try:
+            file = open(path, "rb")
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+        content_type = mimetypes.guess_type(path)[0]
+        if content_type == "text/html":
+            content_type += "; charset=utf-8"
+        response = FileResponse(file, content_type=content_type)
+        response["X-Snapshot"] = "hit"
+        for middleware in self.header_middlewares:
+            response = middleware.process_response(request, response)
+        return response
@@ -0,0 +1,189 @@
+"""
+Index de préfixes en mémoire (tableau trié + bisect) pour l'autocomplétion.
+
+Chaque processus garde son propre index : construit au premier appel,
+tenu à jour par les signaux des modèles (update / remove), et reconstruit
+entièrement toutes les REBUILD_INTERVAL secondes pour voir les écritures
+faites par les autres processus. Au-delà de MAX_ENTRIES clés, l'index
+n'est pas construit et la recherche passe par la base (fallback) tant que
+le nombre de lignes ne baisse pas.
+"""
+
+import bisect
+import threading
+import time
+import unicodedata
+from django.conf import settings
+
+
+# ============================
+# Paramètres (surchargeables dans settings.AUTOCOMPLETE)
+# ============================
+DEFAULTS = {
+    "MAX_ENTRIES": 500000,     # nombre maximal de clés par index
+    "MAX_KEY_LENGTH": 40,      # les clés sont tronquées (on ne tape pas plus)
+    "REBUILD_INTERVAL": 300,   # secondes
+    "MAX_RESULTS": 20,
+}
+
+
+def autocomplete_setting(name):
+    return getattr(settings, "AUTOCOMPLETE", {}).get(name, DEFAULTS[name])
+
+
+def normalize(text):
+    # minuscules, sans accents, espaces réduits : "  Étude  IA" -> "etude ia"
+    text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode()
+    return " ".join(text.lower().split())
+
+
+class PrefixIndex:
+    """
+    loader()        -> itérable de (pk, libellé, [textes à indexer])
+    fallback(q, n)  -> liste de (pk, libellé), utilisée si l'index est trop gros
+    count()         -> nombre de lignes, pour savoir si l'index tiendrait à nouveau
+    """
+
+    def __init__(self, loader, fallback, count):
+        self._loader = loader
+        self._fallback = fallback
+        self._count = count
+        self._lock = threading.Lock()          # protège _keys / _entries
+        self._rebuild_lock = threading.Lock()  # une seule reconstruction à la fois
+        self._keys = []        # liste triée de (clé, pk)
+        self._entries = {}     # pk -> (libellé, clés)
+        self._built_at = None
+        self._overflow = False
+        self._overflow_rows = 0  # nombre de lignes quand l'index a débordé
+        self._pending = None     # mises à jour reçues pendant une reconstruction
+
+    # -----------------------------
+    # Construction
+    # -----------------------------
+    def _keys_for(self, texts):
+        max_length = autocomplete_setting("MAX_KEY_LENGTH")
+        return tuple(sorted({normalize(text)[:max_length] for text in texts} - {""}))
+
+    def rebuild(self):
+        with self._rebuild_lock:
+            self._rebuild_locked()
+
+    def _rebuild_locked(self):
+        with self._lock:
+            self._pending = []
+        try:
+            max_entries = autocomplete_setting("MAX_ENTRIES")
+            keys, entries, overflow = [], {}, False
+            for pk, label, texts in self._loader():
+                entry_keys = self._keys_for(texts)
+                entries[pk] = (label, entry_keys)
+                keys.extend((key, pk) for key in entry_keys)
+                if len(keys) > max_entries:
+                    keys, entries, overflow = [], {}, True
+                    break
+            keys.sort()
+            rows = self._count() if overflow else 0
+        except BaseException:
+            with self._lock:
+                self._pending = None
+            raise
+        with self._lock:
+            pending, self._pending = self._pending, None
+            self._keys, self._entries = keys, entries
+            self._overflow, self._overflow_rows = overflow, rows
+            self._built_at = time.monotonic()
+            # Écritures signalées pendant la lecture des lignes
+            for pk, entry in pending:
+                if not self._overflow:
+                    self._apply_locked(pk, entry)
+
+    def _expired(self):
+        built_at = self._built_at
+        return built_at is None or time.monotonic() - built_at > autocomplete_setting("REBUILD_INTERVAL")
+
+    def _ensure_built(self):
+        if not self._expired():
+            return
+        if self._built_at is None:
+            self._rebuild_lock.acquire()
+        elif not self._rebuild_lock.acquire(blocking=False):
+            # Index périmé mais utilisable : un autre thread le reconstruit déjà
+            return
+        try:
+            # Un autre thread a pu le reconstruire pendant l'attente
+            if not self._expired():
+                return
+            if self._overflow and self._count() >= self._overflow_rows:
+                # Toujours trop de lignes : on reste sur la base sans tout relire
+                self._built_at = time.monotonic()
+                return
+            self._rebuild_locked()
+        finally:
+            self._rebuild_lock.release()
+
+    def reset(self):
+        with self._lock:
+            self._keys, self._entries, self._built_at = [], {}, None
+
+    # -----------------------------
+    # Mises à jour incrémentales (signaux)
+    # -----------------------------
+    def _remove_locked(self, pk):
+        _, old_keys = self._entries.pop(pk, (None, ()))
+        for key in old_keys:
+            i = bisect.bisect_left(self._keys, (key, pk))
+            if i < len(self._keys) and self._keys[i] == (key, pk):
+                del self._keys[i]
+
+    def _apply_locked(self, pk, entry):
+        """ entry : (libellé, clés), ou None pour une suppression. """
+        self._remove_locked(pk)
+        if entry is None:
+            return
+        self._entries[pk] = entry
+        for key in entry[1]:
+            bisect.insort(self._keys, (key, pk))
+        if len(self._keys) > autocomplete_setting("MAX_ENTRIES"):
+            # Trop gros : on libère la mémoire et on passe par la base
+            self._overflow_rows = len(self._entries)
+            self._keys, self._entries, self._overflow = [], {}, True
+
+    def _submit(self, pk, entry):
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((pk, entry))
+            elif self._built_at is not None and not self._overflow:
+                self._apply_locked(pk, entry)
+            # Sinon : index pas encore construit, il lira la ligne à sa construction
+
+    def update(self, pk, label, texts):
+        self._submit(pk, (label, self._keys_for(texts)))
+
+    def remove(self, pk):
+        self._submit(pk, None)
+
+    # -----------------------------
+    # Recherche
+    # -----------------------------
+    def search(self, query, limit=None):
+        """ Renvoie au plus `limit` (pk, libellé) dont une clé commence par `query`. """
+        limit = limit or autocomplete_setting("MAX_RESULTS")
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        self._ensure_built()
+        if self._overflow:
+            return self._fallback(query, limit)
+
+        results, seen = [], set()
+        with self._lock:
+            i = bisect.bisect_left(self._keys, (prefix,))
+            while i < len(self._keys) and len(results) < limit:
+                key, pk = self._keys[i]
+                if not key.startswith(prefix):
+                    break
+                if pk not in seen:
+                    seen.add(pk)
+                    results.append((pk, self._entries[pk][0]))
+                i += 1
+        return results
@@ -0,0 +1,161 @@
+"""
+Profilage cProfile à la demande (staff uniquement) et stockage des profils
+sur disque, avec rotation (nombre de fichiers et taille totale bornés).
+
+Un profil = un fichier .prof (lisible par pstats, snakeviz...) + un .json
+avec le résumé affiché dans l'admin (/admin/profiles/).
+"""
+
+import json
+import os
+import pstats
+import re
+import threading
+import time
+import uuid
+from django.conf import settings
+from django.core import signing
+
+
+# ============================
+# Paramètres (surchargeables dans settings.PROFILING)
+# ============================
+DEFAULTS = {
+    "ENABLED": True,
+    "SAMPLE_RATE": 0.0,         # part des requêtes staff profilées sans jeton (0.01 = 1 %)
+    "DIRECTORY": "profiles",    # relatif à BASE_DIR
+    "MAX_FILES": 200,
+    "MAX_BYTES": 100 * 1024 * 1024,
+    "TOKEN_MAX_AGE": 3600,      # durée de validité d'un jeton (s)
+    "TOP_FUNCTIONS": 30,
+}
+
+TOKEN_HEADER = "HTTP_X_PROFILE"
+TOKEN_PARAM = "_profile"
+_SALT = "GestionConference3IA2.profiling"
+_NAME_RE = re.compile(r"^[0-9A-Za-z_-]+$")
+
+# Un seul profileur actif à la fois (cProfile refuse deux profileurs simultanés)
+profiler_lock = threading.Lock()
+
+
+def profiling_setting(name):
+    return getattr(settings, "PROFILING", {}).get(name, DEFAULTS[name])
+
+
+# ============================
+# JETON SIGNÉ (en-tête X-Profile ou ?_profile=...)
+# ============================
+def make_token(user):
+    return signing.TimestampSigner(salt=_SALT).sign(str(user.pk))
+
+
+def check_token(value, user):
+    try:
+        user_pk = signing.TimestampSigner(salt=_SALT).unsign(value, max_age=profiling_setting("TOKEN_MAX_AGE"))
+    except signing.BadSignature:
+        return False
+    return user_pk == str(user.pk)
+
+
+# ============================
+# ANALYSE D'UN PROFIL
+# ============================
+# (fichier se terminant par, fonction) -> rubrique de la répartition
+BREAKDOWN = {
+    "template": ("django/template/base.py", "render"),
+    "orm": ("django/db/backends/utils.py", "_execute"),
+}
+
+
+def _label(func):
+    filename, line, name = func
+    for marker in ("site-packages/", "GestionConference3IA2/"):
+        if marker in filename:
+            filename = filename.split(marker, 1)[1]
+    return f"{filename}:{line}({name})"
+
+
+def summarize(stats, limit):
+    """
+    Fonctions les plus coûteuses (temps cumulé) et répartition template / ORM.
+    Pour la répartition on garde le plus grand temps cumulé : les appels
+    imbriqués (un template inclus dans un autre) ne sont pas comptés deux fois.
+    """
+    rows = []
+    breakdown = {key: 0.0 for key in BREAKDOWN}
+    for func, (cc, nc, tottime, cumtime, _callers) in stats.stats.items():
+        rows.append({
+            "function": _label(func),
+            "calls": nc,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3),
+        })
+        for key, (suffix, name) in BREAKDOWN.items():
+            if func[0].endswith(suffix) and func[2] == name:
+                breakdown[key] = max(breakdown[key], cumtime * 1000)
+    rows.sort(key=lambda row: row["cumtime_ms"], reverse=True)
+    return rows[:limit], {key: round(ms, 3) for key, ms in breakdown.items()}
+
+
+# ============================
+# STOCKAGE SUR DISQUE AVEC ROTATION
+# ============================
+class ProfileStore:
+
+    def directory(self):
+        path = os.path.join(settings.BASE_DIR, profiling_setting("DIRECTORY"))
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def path(self, name, extension):
+        if not _NAME_RE.match(name):
+            raise FileNotFoundError(name)
+        return os.path.join(self.directory(), f"{name}.{extension}")
+
+    def save(self, profiler, meta):
+        stats = pstats.Stats(profiler)
+        top, breakdown = summarize(stats, profiling_setting("TOP_FUNCTIONS"))
+        # Le nom commence par l'horodatage (à la microseconde) : l'ordre alphabétique
+        # est l'ordre chronologique, même pour plusieurs profils dans la même seconde
+        now = time.time()
+        name = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{int(now % 1 * 1e6):06d}-{uuid.uuid4().hex[:8]}"
+        stats.dump_stats(self.path(name, "prof"))
+        meta = {**meta, "name": name, "top": top, "breakdown": breakdown, "total_calls": stats.total_calls}
+        with open(self.path(name, "json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        self.rotate()
+        return name
+
+    def names(self):
+        return sorted((f[:-5] for f in os.listdir(self.directory()) if f.endswith(".json")), reverse=True)
+
+    def load(self, name):
+        with open(self.path(name, "json"), encoding="utf-8") as f:
+            return json.load(f)
+
+    def delete(self, name):
+        for extension in ("prof", "json"):
+            try:
+                os.remove(self.path(name, extension))
+            except FileNotFoundError:
+                pass
+
+    def rotate(self):
+        """ Supprime les profils les plus anciens au-delà de MAX_FILES / MAX_BYTES. """
+        names = self.names()
+        sizes = {}
+        for name in names:
+            sizes[name] = sum(
+                os.path.getsize(self.path(name, ext))
+                for ext in ("prof", "json") if os.path.exists(self.path(name, ext))
+            )
+        total = sum(sizes.values())
+        for index in range(len(names) - 1, -1, -1):
+            if index < profiling_setting("MAX_FILES") and total <= profiling_setting("MAX_BYTES"):
+                break
+            total -= sizes[names[index]]
+            self.delete(names[index])
+
+
+profile_store = ProfileStore()
@@ -31,7 +31,9 @@ ALLOWED_HOSTS = []
 # Application definition
 
 INSTALLED_APPS = [
-    'django.contrib.admin',
+    # sans autodiscover au démarrage : les admin.py sont chargés au premier
+    # accès à /admin/ (voir GestionConference3IA2.lazy_urls)
+    'django.contrib.admin.apps.SimpleAdminConfig',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
@@ -44,9 +46,17 @@ INSTALLED_APPS = [
     'SessionApp',
     'sessionAppApi',
     'securityConfigApp',
+    'notificationApp',
+    'archiveApp',
 ]
 
 MIDDLEWARE = [
+    # pages publiques pré-rendues pour les visiteurs anonymes (SNAPSHOTS['SERVE'])
+    'GestionConference3IA2.middleware.SnapshotMiddleware',
+    # en premier pour mesurer toute la requête (voir /admin/sql-stats/)
+    'GestionConference3IA2.middleware.QueryInstrumentationMiddleware',
+    # GET/HEAD : lectures envoyées sur la connexion en lecture seule
+    'GestionConference3IA2.middleware.ReadReplicaMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -54,6 +64,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # profilage cProfile des requêtes staff (voir /admin/profiles/)
+    'GestionConference3IA2.middleware.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'GestionConference3IA2.urls'
@@ -68,6 +80,8 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                # committee_perms : droits du comité chargés une fois par requête
+                'UserApp.context_processors.committee_permissions',
             ],
         },
     },
@@ -79,13 +93,52 @@ WSGI_APPLICATION = 'GestionConference3IA2.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Réglages SQLite appliqués à chaque nouvelle connexion :
+# WAL = les lectures ne bloquent plus les écritures (et inversement)
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',      # suffisant avec WAL, beaucoup moins de fsync
+    'cache_size': -64000,         # 64 Mo de cache de pages par connexion
+    'mmap_size': 268435456,       # 256 Mo lus via mmap
+    'busy_timeout': 20000,        # attend (ms) au lieu de lever "database is locked"
+    'temp_store': 'MEMORY',
+}
+SQLITE_INIT_COMMAND = ";".join(f"PRAGMA {name}={value}" for name, value in SQLITE_PRAGMAS.items())
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        # connexions persistantes (réutilisées entre les requêtes)
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'timeout': 20,
+            # BEGIN IMMEDIATE : le verrou d'écriture est pris dès le début de la
+            # transaction, ce qui évite les échecs de "lock upgrade" entre écrivains
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': SQLITE_INIT_COMMAND,
+        },
+    },
+    # Même fichier, connexion en lecture seule : utilisée pour les GET/HEAD
+    # (voir GestionConference3IA2.db_router)
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'timeout': 20,
+            'init_command': SQLITE_INIT_COMMAND + ";PRAGMA query_only=ON",
+        },
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    },
 }
 
+DATABASE_ROUTERS = ['GestionConference3IA2.db_router.ReadReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -137,7 +190,8 @@ LOGIN_URL="login"
 from datetime import timedelta
 REST_FRAMEWORK = {  
 'DEFAULT_AUTHENTICATION_CLASSES': ( 
-'rest_framework_simplejwt.authentication.JWTAuthentication', 
+# JWTAuthentication + utilisateur mis en cache (évite une requête SQL par appel)
+'securityConfigApp.authentication.CachedJWTAuthentication', 
 ), 
 'DEFAULT_PERMISSION_CLASSES': ( 
 'rest_framework.permissions.IsAuthenticated', 
@@ -148,9 +202,142 @@ SIMPLE_JWT = {
 'USER_ID_FIELD': 'user_id', 
 'USER_ID_CLAIM': 'user_id', 
 'ACCESS_TOKEN_LIFETIME': timedelta(minutes=5), 
+# le client renouvelle son access token via /security/api/token/refresh/
+# au lieu de renvoyer son mot de passe (hachage PBKDF2) toutes les 5 minutes
+'REFRESH_TOKEN_LIFETIME': timedelta(days=1), 
+'ROTATE_REFRESH_TOKENS': True, 
 'ALGORITHM': 'HS256', 
 # clé secrète (utilise la même que Django SECRET_KEY ou une autre forte) 
 'SIGNING_KEY': SECRET_KEY, 
 'AUTH_HEADER_TYPES': ('Bearer',), 
-'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',), }
+'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',), 
+# ajoute username/role/is_staff au token (utilisés par ClaimsJWTAuthentication)
+'TOKEN_OBTAIN_SERIALIZER': 'securityConfigApp.serializers.ClaimsTokenObtainPairSerializer', }
+
+# Filtre de Bloom des tokens révoqués (securityConfigApp.revocation)
+JWT_REVOCATION = {
+    # révocations vivantes : déconnexions, changements de mot de passe et désactivations
+    # des dernières 24 h (REFRESH_TOKEN_LIFETIME). La rotation n'en ajoute pas (cache
+    # partagé, voir revocation.rotate_refresh) ; au-delà, le filtre s'agrandit.
+    'CAPACITY': 100000,
+    'ERROR_RATE': 0.001,
+    'SYNC_INTERVAL': 30,
+}
+
+# Cache des utilisateurs authentifiés par JWT (securityConfigApp.authentication)
+JWT_USER_CACHE = {
+    'LOCAL_TTL': 5,
+    'LOCAL_MAX_SIZE': 10000,
+    'SHARED_TTL': 60,
+}
+
+
+# Cache partagé par tous les processus (workers WSGI/ASGI, commandes) : pages des
+# vues asynchrones, révocations des tokens JWT, versions des utilisateurs, ...
+# Un cache par processus (LocMemCache) ne verrait pas les invalidations des autres.
+# En production sur plusieurs machines : Redis (django.core.cache.backends.redis.RedisCache).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 50000,
+        },
+    }
+}
+# Durée (en secondes) de mise en cache des pages/listes servies en ASGI
+ASYNC_VIEWS_CACHE_TIMEOUT = 30
+
+# Instrumentation SQL par requête (GestionConference3IA2.middleware)
+SQL_INSTRUMENTATION = {
+    'ENABLED': True,
+    'N_PLUS_ONE_THRESHOLD': 5,
+    'WINDOW': 1000,
+}
+
+# Emails (notifications des auteurs, envoyées par `manage.py run_jobs`)
+EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+DEFAULT_FROM_EMAIL = 'conference@esprit.tn'
+
+# File de tâches en base (notificationApp.queue)
+JOB_QUEUE = {
+    'MAX_ATTEMPTS': 5,
+    'BACKOFF_BASE': 30,
+    'BACKOFF_MAX': 3600,
+    'LOCK_TIMEOUT': 600,
+}
+
+# Index de préfixes en mémoire pour l'autocomplétion (GestionConference3IA2.prefix_index)
+AUTOCOMPLETE = {
+    'MAX_ENTRIES': 500000,
+    'MAX_KEY_LENGTH': 40,
+    'REBUILD_INTERVAL': 300,
+    'MAX_RESULTS': 20,
+}
+
+# Profilage cProfile à la demande (GestionConference3IA2.profiling)
+PROFILING = {
+    'ENABLED': True,
+    'SAMPLE_RATE': 0.0,
+    'DIRECTORY': 'profiles',
+    'MAX_FILES': 200,
+    'MAX_BYTES': 100 * 1024 * 1024,
+    'TOKEN_MAX_AGE': 3600,
+    'TOP_FUNCTIONS': 30,
+}
+
+# Listes de l'admin sur de grosses tables (GestionConference3IA2.admin_tools)
+ADMIN_CHANGELIST = {
+    'COUNT_THRESHOLD': 10000,
+    'COUNT_CACHE_TIMEOUT': 300,
+    'FACETS_CACHE_TIMEOUT': 60,
+    'CHOICES_CACHE_TIMEOUT': 300,
+}
 
+# Archivage des conférences terminées (archiveApp.archive)
+ARCHIVE = {
+    'RETENTION_DAYS': 365,
+    'BATCH_SIZE': 200,
+}
+
+# Statistiques des soumissions (ConferenceApp.analytics)
+ANALYTICS = {
+    'CHUNK_SIZE': 50000,
+    'CACHE_TIMEOUT': 3600,
+}
+
+# Classement des soumissions à partir des évaluations (ConferenceApp.ranking)
+RANKING = {
+    'MIN_REVIEWER_REVIEWS': 3,
+    'CACHE_TIMEOUT': 24 * 3600,
+    'DECISION_CHUNK_SIZE': 500,
+}
+
+# Flux SSE des changements de sessions (sessionAppApi.events)
+SESSION_EVENTS = {
+    'HEARTBEAT': 15,
+    'POLL_INTERVAL': 2,
+    'BUFFER_SIZE': 100,
+    'RESUME_LIMIT': 1000,
+    'RETENTION_DAYS': 7,
+}
+
+# Téléchargement des articles (GestionConference3IA2.file_serving)
+# Derrière nginx : 'MODE': 'x-accel-redirect' avec une location internal
+#   location /protected-media/ { internal; alias <MEDIA_ROOT>/; }
+FILE_SERVING = {
+    'MODE': None,
+    'ACCEL_PREFIX': '/protected-media/',
+    'BLOCK_SIZE': 64 * 1024,
+}
+
+# Snapshots statiques des pages publiques (ConferenceApp.snapshots, `manage.py render_snapshots`)
+# Derrière nginx, le dossier est servi directement aux visiteurs sans cookie de session :
+#   map $cookie_sessionid $snapshot_root { "" <ROOT>; default /nonexistent; }
+#   location /conferences/ { root $snapshot_root; try_files ${uri}index.html $uri @django; }
+SNAPSHOTS = {
+    'ROOT': None,
+    'SERVE': False,
+    'WORKERS': 4,
+    'BATCH_SIZE': 200,
+}
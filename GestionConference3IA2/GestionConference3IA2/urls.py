@@ -14,12 +14,19 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.contrib import admin
 from django.urls import path ,include
 from django.views.generic import RedirectView
+from .lazy_urls import lazy_admin_urls, lazy_view
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
+    # avant admin/ : sinon la vue "catch-all" de l'admin répond 404
+    path('admin/sql-stats/', lazy_view('GestionConference3IA2.views.sql_stats'), name="sql_stats"),
+    path('admin/profiles/', lazy_view('GestionConference3IA2.views.profiles'), name="profiles"),
+    path('admin/profiles/<str:name>/', lazy_view('GestionConference3IA2.views.profile_detail'), name="profile_detail"),
+    path('admin/profiles/<str:name>/download/', lazy_view('GestionConference3IA2.views.profile_download'),
+         name="profile_download"),
+    # admin chargé au premier accès à /admin/ (voir lazy_urls.py)
+    lazy_admin_urls('admin/'),
     path("",RedirectView.as_view(url="conferences/liste/")),
     path('conferences/',include("ConferenceApp.urls")),
     path('user/',include("UserApp.urls")),
@@ -0,0 +1,78 @@
+from django.contrib import admin
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import FileResponse, Http404, JsonResponse
+from django.shortcuts import redirect, render
+from .middleware import view_stats
+from .profiling import TOKEN_PARAM, make_token, profile_store, profiling_setting
+
+
+# ============================
+# VUE : statistiques SQL par vue (réservée à l'admin)
+# ============================
+@staff_member_required
+def sql_stats(request):
+    """
+    Affiche les statistiques collectées par QueryInstrumentationMiddleware.
+    ?format=json pour les récupérer en JSON, POST pour les remettre à zéro.
+    """
+    if request.method == "POST":
+        view_stats.reset()
+        return redirect("sql_stats")
+
+    stats = view_stats.snapshot()
+    if request.GET.get("format") == "json":
+        return JsonResponse(stats)
+
+    context = {
+        **admin.site.each_context(request),
+        "title": "Statistiques SQL par vue",
+        "stats": sorted(stats.items(), key=lambda item: item[1]["p95_ms"], reverse=True),
+    }
+    return render(request, "admin/sql_stats.html", context)
+
+
+# ============================
+# VUES : profils cProfile enregistrés (réservées à l'admin)
+# ============================
+@staff_member_required
+def profiles(request):
+    """
+    Liste des profils et jeton à ajouter à une requête pour la profiler
+    (en-tête X-Profile ou paramètre ?_profile=). POST vide le stockage.
+    """
+    if request.method == "POST":
+        for name in profile_store.names():
+            profile_store.delete(name)
+        return redirect("profiles")
+
+    context = {
+        **admin.site.each_context(request),
+        "title": "Profils cProfile",
+        "profiles": [profile_store.load(name) for name in profile_store.names()],
+        "token": make_token(request.user),
+        "token_param": TOKEN_PARAM,
+        "token_max_age": profiling_setting("TOKEN_MAX_AGE"),
+    }
+    return render(request, "admin/profiles.html", context)
+
+
+@staff_member_required
+def profile_detail(request, name):
+    try:
+        profile = profile_store.load(name)
+    except FileNotFoundError:
+        raise Http404("Profil introuvable")
+    context = {
+        **admin.site.each_context(request),
+        "title": f"Profil {name}",
+        "profile": profile,
+    }
+    return render(request, "admin/profile_detail.html", context)
+
+
+@staff_member_required
+def profile_download(request, name):
+    try:
+        return FileResponse(open(profile_store.path(name, "prof"), "rb"), as_attachment=True, filename=f"{name}.prof")
+    except FileNotFoundError:
+        raise Http404("Profil introuvable")
@@ -1,4 +1,8 @@
 from django.contrib import admin
+from GestionConference3IA2.admin_tools import OptimisticAdminMixin
 from .models import Session 
 # Register your models here.
-admin.site.register(Session)
+@admin.register(Session)
+class SessionAdmin(OptimisticAdminMixin, admin.ModelAdmin):
+    list_display = ("title", "session_day", "room", "capacity", "seats_taken")
+    readonly_fields = ("seats_taken",)
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('SessionApp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='session',
+            name='capacity',
+            field=models.PositiveIntegerField(default=50),
+        ),
+        migrations.AddField(
+            model_name='session',
+            name='seats_taken',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddConstraint(
+            model_name='session',
+            constraint=models.CheckConstraint(condition=models.Q(('seats_taken__lte', models.F('capacity'))), name='session_not_overbooked'),
+        ),
+    ]
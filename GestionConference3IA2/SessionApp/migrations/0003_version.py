@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('SessionApp', '0002_session_capacity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='session',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -1,8 +1,10 @@
+from django.core.exceptions import ValidationError
 from django.db import models
+from GestionConference3IA2.concurrency import VersionedModel
 from ConferenceApp.models import Conference
 # Create your models here.
 
-class Session(models.Model):
+class Session(VersionedModel):
     session_id=models.AutoField(primary_key=True)
     title=models.CharField(max_length=255)
     topic=models.CharField(max_length=255)
@@ -10,9 +12,33 @@ class Session(models.Model):
     start_time=models.TimeField()
     end_time=models.TimeField()
     room=models.CharField(max_length=255)
+    # Places de la salle, et places prises (modifié uniquement par des UPDATE
+    # conditionnels avec F(), voir sessionAppApi.registration)
+    capacity=models.PositiveIntegerField(default=50)
+    seats_taken=models.PositiveIntegerField(default=0, editable=False)
     created_at=models.DateTimeField(auto_now_add=True)
     update_at=models.DateTimeField(auto_now=True)
     conference=models.ForeignKey("ConferenceApp.Conference",
                                   on_delete=models.CASCADE,
                                  related_name="sessions")
-    #conference=models.ForeignKey(Conference, on_delete=models.CASCADE)
\ No newline at end of file
+    #conference=models.ForeignKey(Conference, on_delete=models.CASCADE)
+
+    class Meta:
+        constraints = [
+            # Dernier garde-fou : la base refuse toute surréservation
+            models.CheckConstraint(condition=models.Q(seats_taken__lte=models.F("capacity")),
+                                   name="session_not_overbooked"),
+        ]
+
+    def clean(self):
+        if self.capacity is not None and self.capacity < self.seats_taken:
+            raise ValidationError({"capacity": f"{self.seats_taken} places sont déjà réservées."})
+
+    def save(self, *args, **kwargs):
+        # seats_taken n'est jamais réécrit depuis une copie en mémoire (formulaire,
+        # API) : elle peut être périmée pendant une vague d'inscriptions
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                f.name for f in self._meta.concrete_fields if not f.primary_key and f.name != "seats_taken"
+            ]
+        super().save(*args, **kwargs)
\ No newline at end of file
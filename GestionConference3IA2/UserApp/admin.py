@@ -1,5 +1,72 @@
-from django.contrib import admin
+import codecs
+from django import forms
+from django.contrib import admin, messages
+from django.core.exceptions import PermissionDenied
+from django.shortcuts import redirect, render
+from django.urls import path
+from .autocomplete import user_index
+from .importer import REQUIRED_COLUMNS, import_users
 from .models import User,OrganizingCommittee
-# Register your models here.
-admin.site.register(User)
+
+
+# ---------------------------
+# Formulaire d'upload du CSV d'utilisateurs
+# ---------------------------
+class UserImportForm(forms.Form):
+    csv_file = forms.FileField(label="Fichier CSV")
+    dry_run = forms.BooleanField(label="Vérifier sans importer", required=False)
+
+
+# ---------------------------
+# Admin du modèle User (+ import CSV)
+# ---------------------------
+@admin.register(User)
+class UserAdminModel(admin.ModelAdmin):
+    change_list_template = "admin/UserApp/user/change_list.html"
+    search_fields = ("username", "last_name", "email")
+
+    def get_search_results(self, request, queryset, search_term):
+        # Autocomplétion de l'admin (champ user des soumissions) : index en mémoire
+        if search_term and request.resolver_match.url_name == "autocomplete":
+            pks = [pk for pk, _ in user_index.search(search_term)]
+            return queryset.filter(pk__in=pks), False
+        return super().get_search_results(request, queryset, search_term)
+
+    def get_urls(self):
+        urls = [
+            path("import-csv/", self.admin_site.admin_view(self.import_csv), name="UserApp_user_import_csv"),
+        ]
+        return urls + super().get_urls()
+
+    def import_csv(self, request):
+        # L'import crée des comptes : même droit que le bouton "Ajouter"
+        if not self.has_add_permission(request):
+            raise PermissionDenied
+        if request.method == "POST":
+            form = UserImportForm(request.POST, request.FILES)
+            if form.is_valid():
+                # Lecture en flux : le fichier n'est jamais chargé entièrement en mémoire
+                lines = codecs.iterdecode(form.cleaned_data["csv_file"], "utf-8")
+                report = import_users(lines, dry_run=form.cleaned_data["dry_run"])
+                for line, message in report.errors[:50]:
+                    messages.warning(request, f"Ligne {line} : {message}")
+                messages.success(
+                    request,
+                    f"{report.created} utilisateurs {'valides' if form.cleaned_data['dry_run'] else 'importés'}, "
+                    f"{len(report.errors)} erreurs.",
+                )
+                return redirect("admin:UserApp_user_changelist")
+        else:
+            form = UserImportForm()
+
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "form": form,
+            "columns": REQUIRED_COLUMNS + ["password (optionnelle)"],
+            "title": "Importer des utilisateurs",
+        }
+        return render(request, "admin/UserApp/user/import_csv.html", context)
+
+
 admin.site.register(OrganizingCommittee)
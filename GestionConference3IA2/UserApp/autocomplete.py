@@ -0,0 +1,27 @@
+from django.db.models import Q
+from GestionConference3IA2.prefix_index import PrefixIndex
+from .models import User
+
+
+def user_label(username, first_name, last_name, email):
+    return f"{first_name} {last_name} ({username}, {email})"
+
+
+def user_texts(username, last_name, email):
+    return [username, last_name, email]
+
+
+def _load():
+    rows = User.objects.values_list("pk", "username", "first_name", "last_name", "email")
+    for pk, username, first_name, last_name, email in rows.iterator(chunk_size=5000):
+        yield pk, user_label(username, first_name, last_name, email), user_texts(username, last_name, email)
+
+
+def _fallback(query, limit):
+    rows = User.objects.filter(
+        Q(username__istartswith=query) | Q(last_name__istartswith=query) | Q(email__istartswith=query)
+    ).order_by("username").values_list("pk", "username", "first_name", "last_name", "email")[:limit]
+    return [(pk, user_label(*fields)) for pk, *fields in rows]
+
+
+user_index = PrefixIndex(_load, _fallback, User.objects.count)
@@ -0,0 +1,10 @@
+from django.utils.functional import SimpleLazyObject
+from .permissions import get_committee_permissions
+
+
+def committee_permissions(request):
+    """
+    Rend `committee_perms` disponible dans tous les templates.
+    Paresseux : aucune requête si le template ne l'utilise pas.
+    """
+    return {"committee_perms": SimpleLazyObject(lambda: get_committee_permissions(request))}
@@ -0,0 +1,213 @@
+import csv
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.tokens import default_token_generator
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+from .models import ALLOWED_EMAIL_DOMAINS, User, name_validator
+
+
+# Colonnes attendues dans le CSV (password est optionnelle)
+REQUIRED_COLUMNS = ["username", "first_name", "last_name", "email", "affiliation", "nationality"]
+
+# Tous les user_id possibles : "USER" + 4 caractères hexadécimaux (voir generate_user_id)
+USER_ID_SPACE = 16 ** 4
+
+
+# ============================
+# RAPPORT D'IMPORT
+# ============================
+class ImportReport:
+    def __init__(self):
+        self.created = 0
+        self.errors = []        # liste de (numéro de ligne, message)
+        self.reset_tokens = []  # liste de (user_id, email, uidb64, token)
+
+    def error(self, line, message):
+        self.errors.append((line, message))
+
+
+# ============================
+# TRAVAIL FAIT DANS LES PROCESSUS DU POOL
+# ============================
+def _init_worker():
+    import django
+    django.setup()
+
+
+def _hash_chunk(chunk):
+    """
+    Valide (mêmes règles que UserRegisterForm) et hache une liste de
+    (username, first_name, last_name, email, password).
+    Renvoie une liste de (hash, None) ou (None, message d'erreur).
+    """
+    results = []
+    for username, first_name, last_name, email, password in chunk:
+        user = User(username=username, first_name=first_name, last_name=last_name, email=email)
+        try:
+            validate_password(password, user)
+        except ValidationError as e:
+            results.append((None, " ".join(e.messages)))
+            continue
+        results.append((make_password(password), None))
+    return results
+
+
+# ============================
+# ALLOCATION DES IDENTIFIANTS EN UNE SEULE REQUÊTE
+# ============================
+def free_user_ids(rng=random):
+    """
+    Remplace la boucle "générer puis vérifier" de User.save() : on charge une
+    seule fois les identifiants existants et on tire au hasard parmi les libres.
+    `rng` (random.Random(graine)) rend le tirage reproductible.
+    """
+    used = set(User.objects.values_list("user_id", flat=True))
+    free = [f"USER{i:04X}" for i in range(USER_ID_SPACE)]
+    free = [user_id for user_id in free if user_id not in used]
+    rng.shuffle(free)
+    return free
+
+
+# ============================
+# VALIDATION D'UNE LIGNE (sans accès à la base)
+# ============================
+def _clean_row(row):
+    missing = [col for col in REQUIRED_COLUMNS if not (row.get(col) or "").strip()]
+    if missing:
+        raise ValidationError(f"Colonnes manquantes : {', '.join(missing)}")
+
+    data = {col: row[col].strip() for col in REQUIRED_COLUMNS}
+    data["email"] = data["email"].lower()
+    data["password"] = (row.get("password") or "").strip()
+
+    if data["email"].count("@") != 1 or data["email"].split("@")[1] not in ALLOWED_EMAIL_DOMAINS:
+        raise ValidationError("L'email est invalide et doit appartenir à un domaine universitaire privé")
+    name_validator(data["first_name"])
+    name_validator(data["last_name"])
+    return data
+
+
+# ============================
+# IMPORT PRINCIPAL
+# ============================
+def import_users(lines, batch_size=2000, workers=None, dry_run=False):
+    """
+    Importe des utilisateurs depuis un itérable de lignes CSV (fichier ouvert,
+    upload décodé...). Le fichier est lu en flux, par lots de `batch_size` :
+      - validation des lignes et des doublons (dans le fichier puis en base, en lot) ;
+      - hachage des mots de passe réparti sur un ProcessPoolExecutor ;
+      - sans mot de passe : mot de passe inutilisable + token de réinitialisation ;
+      - insertion avec bulk_create.
+    """
+    report = ImportReport()
+    reader = csv.DictReader(lines)
+    missing = [col for col in REQUIRED_COLUMNS if col not in (reader.fieldnames or [])]
+    if missing:
+        report.error(1, f"En-tête incomplet, colonnes manquantes : {', '.join(missing)}")
+        return report
+
+    free_ids = free_user_ids()
+    seen_usernames, seen_emails = set(), set()
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        batch = []
+        # La ligne 1 est l'en-tête
+        for line, row in enumerate(reader, start=2):
+            batch.append((line, row))
+            if len(batch) >= batch_size:
+                _import_batch(batch, report, free_ids, seen_usernames, seen_emails, executor, workers, dry_run)
+                batch = []
+        if batch:
+            _import_batch(batch, report, free_ids, seen_usernames, seen_emails, executor, workers, dry_run)
+    return report
+
+
+def _import_batch(batch, report, free_ids, seen_usernames, seen_emails, executor, workers, dry_run):
+    # 1. Validation ligne par ligne + doublons à l'intérieur du fichier
+    rows = []
+    for line, row in batch:
+        try:
+            data = _clean_row(row)
+        except ValidationError as e:
+            report.error(line, " ".join(e.messages))
+            continue
+        if data["username"] in seen_usernames or data["email"] in seen_emails:
+            report.error(line, "Doublon dans le fichier (username ou email)")
+            continue
+        seen_usernames.add(data["username"])
+        seen_emails.add(data["email"])
+        rows.append((line, data))
+
+    # 2. Unicité en base : deux requêtes pour tout le lot
+    usernames = set(User.objects.filter(
+        username__in=[d["username"] for _, d in rows]).values_list("username", flat=True))
+    emails = set(User.objects.filter(
+        email__in=[d["email"] for _, d in rows]).values_list("email", flat=True))
+    unique_rows = []
+    for line, data in rows:
+        if data["username"] in usernames or data["email"] in emails:
+            report.error(line, "Un utilisateur avec ce username ou cet email existe déjà")
+        else:
+            unique_rows.append((line, data))
+
+    # 3. Hachage en parallèle des mots de passe fournis
+    with_password = [(line, d) for line, d in unique_rows if d["password"]]
+    payload = [(d["username"], d["first_name"], d["last_name"], d["email"], d["password"])
+               for _, d in with_password]
+    chunk_size = max(1, len(payload) // (workers * 4))
+    chunks = [payload[i:i + chunk_size] for i in range(0, len(payload), chunk_size)]
+    hashes = {}
+    results = (result for chunk in executor.map(_hash_chunk, chunks) for result in chunk)
+    for (line, _), (hashed, error) in zip(with_password, results):
+        if error:
+            report.error(line, error)
+        else:
+            hashes[line] = hashed
+
+    # 4. Construction des objets (user_id pris dans la réserve d'identifiants libres)
+    users, needs_reset = [], []
+    for line, data in unique_rows:
+        if data["password"] and line not in hashes:
+            continue
+        if not free_ids:
+            report.error(line, "Plus aucun user_id disponible (format USERXXXX)")
+            continue
+        user = User(
+            user_id=free_ids.pop(),
+            username=data["username"],
+            first_name=data["first_name"],
+            last_name=data["last_name"],
+            email=data["email"],
+            affiliation=data["affiliation"],
+            nationality=data["nationality"],
+            role="participant",
+            password=hashes.get(line) or make_password(None),
+        )
+        users.append(user)
+        if not data["password"]:
+            needs_reset.append(user)
+
+    if dry_run:
+        # Rien n'est écrit : on compte seulement les utilisateurs valides
+        report.created += len(users)
+        return
+
+    # 5. Insertion en une transaction par lot
+    with transaction.atomic():
+        User.objects.bulk_create(users, batch_size=500)
+    report.created += len(users)
+
+    for user in needs_reset:
+        report.reset_tokens.append((
+            user.user_id,
+            user.email,
+            urlsafe_base64_encode(force_bytes(user.pk)),
+            default_token_generator.make_token(user),
+        ))
@@ -0,0 +1,46 @@
+import csv
+import time
+from django.core.management.base import BaseCommand
+from UserApp.importer import REQUIRED_COLUMNS, import_users
+
+
+class Command(BaseCommand):
+    help = (
+        "Importe des utilisateurs depuis un CSV (colonnes : "
+        + ", ".join(REQUIRED_COLUMNS) + ", password optionnelle)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("csv_file")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--workers", type=int, default=None, help="processus de hachage (défaut : nb de CPU)")
+        parser.add_argument("--dry-run", action="store_true", help="valide le fichier sans rien écrire")
+        parser.add_argument(
+            "--tokens-out",
+            help="CSV où écrire les tokens de réinitialisation des utilisateurs créés sans mot de passe",
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        with open(options["csv_file"], newline="", encoding="utf-8") as f:
+            report = import_users(
+                f,
+                batch_size=options["batch_size"],
+                workers=options["workers"],
+                dry_run=options["dry_run"],
+            )
+        elapsed = time.perf_counter() - start
+
+        for line, message in report.errors:
+            self.stderr.write(f"ligne {line} : {message}")
+
+        if options["tokens_out"] and report.reset_tokens:
+            with open(options["tokens_out"], "w", newline="", encoding="utf-8") as out:
+                writer = csv.writer(out)
+                writer.writerow(["user_id", "email", "uidb64", "token"])
+                writer.writerows(report.reset_tokens)
+
+        verb = "valides" if options["dry_run"] else "créés"
+        self.stdout.write(self.style.SUCCESS(
+            f"{report.created} utilisateurs {verb}, {len(report.errors)} erreurs en {elapsed:.1f} s"
+        ))
@@ -16,15 +16,15 @@ def generate_user_id():
 # ============================
 # FONCTION : validation des emails
 # ============================
+# Liste des domaines autorisés (emails universitaires privés)
+ALLOWED_EMAIL_DOMAINS = ["esprit.tn", "seasame.com", "tek.tn", "central.net"]
+
 def verify_email(email):
-    # Liste des domaines autorisés (emails universitaires privés)
-    domaines = ["esprit.tn", "seasame.com", "tek.tn", "central.net"]
-    
     # Récupère le domaine après le "@" dans l'email
     email_domaine = email.split("@")[1]
 
     # Vérifie si le domaine est autorisé
-    if email_domaine not in domaines:
+    if email_domaine not in ALLOWED_EMAIL_DOMAINS:
         raise ValidationError("L'email est invalide et doit appartenir à un domaine universitaire privé")
 
 # ============================
@@ -0,0 +1,111 @@
+from django.core.cache import cache
+from .models import OrganizingCommittee
+
+
+# Rôles du comité qui peuvent modifier une conférence
+EDITOR_ROLES = ("chair", "co-chair")
+
+# Durée de vie (s) des droits dans le cache partagé ; la version les invalide plus tôt
+PERMISSIONS_CACHE_TIMEOUT = 300
+
+
+def _version_key(user_id):
+    return f"perms:committee_version:{user_id}"
+
+
+def _data_key(user_id, version):
+    return f"perms:committee:{user_id}:{version}"
+
+
+def invalidate_committee_permissions(user_id):
+    """
+    Appelée quand une ligne OrganizingCommittee de l'utilisateur change
+    (voir UserApp.signals) : les droits seront rechargés au prochain accès.
+    """
+    try:
+        cache.incr(_version_key(user_id))
+    except ValueError:
+        cache.set(_version_key(user_id), 1, None)
+
+
+# ============================
+# DROITS D'UN UTILISATEUR SUR LES CONFÉRENCES
+# ============================
+class CommitteePermissions:
+    """
+    Charge UNE fois toutes les lignes OrganizingCommittee de l'utilisateur
+    ({conference_id: rôle}) puis répond aux vérifications sans requête SQL,
+    quel que soit le nombre de conférences affichées.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._roles = None
+
+    @property
+    def roles(self):
+        if self._roles is None:
+            if not self.user.is_authenticated:
+                self._roles = {}
+            else:
+                version = cache.get(_version_key(self.user.pk), 0)
+                key = _data_key(self.user.pk, version)
+                self._roles = cache.get(key)
+                if self._roles is None:
+                    self._roles = dict(
+                        OrganizingCommittee.objects.filter(user_id=self.user.pk)
+                        .values_list("conference_id", "commitee_role")
+                    )
+                    cache.set(key, self._roles, PERMISSIONS_CACHE_TIMEOUT)
+        return self._roles
+
+    async def aload(self):
+        """
+        Version asynchrone du chargement (pour les vues ASGI, voir async_views.py).
+        """
+        if self._roles is None and self.user.is_authenticated:
+            version = await cache.aget(_version_key(self.user.pk), 0)
+            key = _data_key(self.user.pk, version)
+            self._roles = await cache.aget(key)
+            if self._roles is None:
+                self._roles = {
+                    conference_id: role
+                    async for conference_id, role in OrganizingCommittee.objects.filter(
+                        user_id=self.user.pk
+                    ).values_list("conference_id", "commitee_role")
+                }
+                await cache.aset(key, self._roles, PERMISSIONS_CACHE_TIMEOUT)
+        return self
+
+    def role_for(self, conference):
+        conference_id = getattr(conference, "pk", conference)
+        return self.roles.get(conference_id)
+
+    @property
+    def is_committee(self):
+        return self.user.is_authenticated and (
+            self.user.is_superuser or getattr(self.user, "role", None) == "commitee" or bool(self.roles)
+        )
+
+    def can_edit_conference(self, conference):
+        """ Président ou co-président du comité de cette conférence. """
+        if not self.user.is_authenticated:
+            return False
+        return self.user.is_superuser or self.role_for(conference) in EDITOR_ROLES
+
+    def can_review(self, submission):
+        """ Tout membre du comité de la conférence, sauf pour ses propres soumissions. """
+        if not self.user.is_authenticated or submission.user_id == self.user.pk:
+            return False
+        return self.user.is_superuser or self.role_for(submission.conference_id) is not None
+
+
+def get_committee_permissions(request):
+    """
+    Un seul objet CommitteePermissions par requête (mis en cache sur la requête).
+    """
+    perms = getattr(request, "_committee_perms", None)
+    if perms is None or perms.user is not request.user:
+        perms = CommitteePermissions(request.user)
+        request._committee_perms = perms
+    return perms
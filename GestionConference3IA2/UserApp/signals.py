@@ -0,0 +1,31 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .autocomplete import user_index, user_label, user_texts
+from .models import OrganizingCommittee, User
+from .permissions import invalidate_committee_permissions
+
+
+# ============================
+# Invalidation du cache des droits du comité
+# ============================
+@receiver(post_save, sender=OrganizingCommittee)
+@receiver(post_delete, sender=OrganizingCommittee)
+def invalidate_committee_cache(sender, instance, **kwargs):
+    invalidate_committee_permissions(instance.user_id)
+
+
+# ============================
+# Index d'autocomplétion (mise à jour incrémentale)
+# ============================
+@receiver(post_save, sender=User)
+def update_user_index(sender, instance, **kwargs):
+    user_index.update(
+        instance.pk,
+        user_label(instance.username, instance.first_name, instance.last_name, instance.email),
+        user_texts(instance.username, instance.last_name, instance.email),
+    )
+
+
+@receiver(post_delete, sender=User)
+def remove_from_user_index(sender, instance, **kwargs):
+    user_index.remove(instance.pk)
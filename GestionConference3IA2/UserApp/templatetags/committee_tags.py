@@ -0,0 +1,14 @@
+from django import template
+
+register = template.Library()
+
+
+# Utilisation : {% load committee_tags %} puis {% if committee_perms|can_edit_conference:c %}
+@register.filter
+def can_edit_conference(perms, conference):
+    return perms.can_edit_conference(conference)
+
+
+@register.filter
+def can_review(perms, submission):
+    return perms.can_review(submission)
@@ -1,3 +1,85 @@
+from datetime import date
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from ConferenceApp.models import Conference
+from .models import OrganizingCommittee, User
+from .permissions import CommitteePermissions
 
-# Create your tests here.
+
+class CommitteePermissionsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="chair", email="chair@esprit.tn", password="Conf-Pass-2025",
+            first_name="Chair", last_name="Person", role="commitee",
+        )
+
+    def _create_conferences(self, count):
+        Conference.objects.bulk_create([
+            Conference(name=f"Conf {i}", theme="IA", location="Tunis", description="desc",
+                       start_date=date(2026, 1, 1), end_date=date(2026, 1, 2))
+            for i in range(count)
+        ])
+        conferences = list(Conference.objects.order_by("-conference_id")[:count])
+        # Le membre est chair d'une conférence sur deux
+        OrganizingCommittee.objects.bulk_create([
+            OrganizingCommittee(user=self.user, conference=c, join_date=date(2025, 1, 1),
+                                commitee_role="chair" if i % 2 else "member")
+            for i, c in enumerate(conferences)
+        ])
+
+    def _count_queries(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("liste_conferences"))
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_listing_query_count_does_not_depend_on_rows(self):
+        self.client.force_login(self.user)
+        self._create_conferences(10)
+        small = self._count_queries()
+        self._create_conferences(990)
+        large = self._count_queries()
+        self.assertEqual(small, large)
+
+    def test_checks_use_loaded_roles(self):
+        self._create_conferences(4)
+        perms = CommitteePermissions(self.user)
+        conferences = list(Conference.objects.all())
+        with self.assertNumQueries(1):
+            editable = [perms.can_edit_conference(c) for c in conferences]
+        self.assertEqual(editable.count(True), 2)
+
+    def test_cache_invalidated_on_membership_change(self):
+        self._create_conferences(1)
+        conference = Conference.objects.get()
+        self.assertFalse(CommitteePermissions(self.user).can_edit_conference(conference))
+        OrganizingCommittee.objects.filter(user=self.user).get().delete()
+        OrganizingCommittee.objects.create(user=self.user, conference=conference,
+                                           join_date=date(2025, 1, 1), commitee_role="chair")
+        self.assertTrue(CommitteePermissions(self.user).can_edit_conference(conference))
+
+
+class UserImportAdminTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@esprit.tn", password="Conf-Pass-2025",
+            first_name="S", last_name="T", is_staff=True,
+        )
+        self.staff.user_permissions.add(Permission.objects.get(codename="view_user"))
+        self.client.force_login(self.staff)
+
+    def test_import_requires_add_permission(self):
+        url = reverse("admin:UserApp_user_import_csv")
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.assertNotContains(self.client.get(reverse("admin:UserApp_user_changelist")), url)
+
+        self.staff.user_permissions.add(Permission.objects.get(codename="add_user"))
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertContains(self.client.get(reverse("admin:UserApp_user_changelist")), url)
@@ -4,5 +4,6 @@ from django.contrib.auth.views import LoginView
 urlpatterns =[
     path( "register/", views.register , name="register"),
     path('login',LoginView.as_view(template_name="login.html"),name="login"),
-    path('logout/',views.logout_view,name="logout")
+    path('logout/',views.logout_view,name="logout"),
+    path('autocomplete/',views.user_autocomplete,name="user_autocomplete"),
 ]
\ No newline at end of file
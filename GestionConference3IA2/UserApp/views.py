@@ -1,6 +1,9 @@
 from django.shortcuts import render, redirect  # render pour afficher les templates, redirect pour rediriger après une action
 from .forms import UserRegisterForm             # le formulaire d'inscription personnalisé
 from django.contrib.auth import logout          # fonction pour déconnecter un utilisateur
+from django.contrib.auth.decorators import user_passes_test
+from django.http import JsonResponse
+from .autocomplete import user_index
 
 
 # ============================
@@ -33,3 +36,13 @@ def logout_view(req):
     """
     logout(req)           # Déconnecte l'utilisateur (supprime sa session)
     return redirect("login")  # Redirige vers la page de login
+
+
+# ============================
+# VUE : Autocomplétion des utilisateurs (réservée au staff : expose les emails)
+# ============================
+# user_passes_test plutôt que staff_member_required : n'importe pas django.contrib.admin
+@user_passes_test(lambda u: u.is_active and u.is_staff)
+def user_autocomplete(req):
+    results = user_index.search(req.GET.get("q", ""))
+    return JsonResponse({"results": [{"id": pk, "text": label} for pk, label in results]})
@@ -0,0 +1,68 @@
+from django.contrib import admin, messages
+from GestionConference3IA2.admin_tools import EstimatedCountPaginator
+from .archive import restore_conferences
+from .models import ArchivedCommittee, ArchivedConference, ArchivedSession, ArchivedSubmission
+
+
+# ---------------------------
+# Archive en lecture seule (seule action : la restauration)
+# ---------------------------
+class ReadOnlyAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.action(description="Restaurer dans les tables actives", permissions=["restore"])
+def restore_selected(modeladmin, request, queryset):
+    report = restore_conferences(list(queryset.values_list("pk", flat=True)))
+    modeladmin.message_user(
+        request,
+        f"{report.conferences} conférence(s) restaurée(s) ({report.submissions} soumissions, "
+        f"{report.sessions} sessions, {report.committees} membres du comité).",
+        messages.SUCCESS,
+    )
+
+
+@admin.register(ArchivedConference)
+class ArchivedConferenceAdmin(ReadOnlyAdmin):
+    list_display = ("conference_id", "name", "theme", "start_date", "end_date", "archived_at")
+    list_filter = ("theme",)
+    search_fields = ("name",)
+    ordering = ("-end_date",)
+    date_hierarchy = "end_date"
+    actions = [restore_selected]
+
+    def has_restore_permission(self, request):
+        # La restauration réécrit les tables actives : droit "change" sur l'archive
+        return request.user.has_perm("archiveApp.change_archivedconference")
+
+
+@admin.register(ArchivedSubmission)
+class ArchivedSubmissionAdmin(ReadOnlyAdmin):
+    list_display = ("submission_id", "title", "status", "payed", "user", "conference")
+    list_filter = ("status", "payed")
+    list_select_related = ("user", "conference")
+    search_fields = ("submission_id", "title")
+    readonly_fields = ("abstract",)
+    exclude = ("abstract_compressed",)
+
+
+@admin.register(ArchivedSession)
+class ArchivedSessionAdmin(ReadOnlyAdmin):
+    list_display = ("title", "session_day", "room", "conference")
+    list_select_related = ("conference",)
+
+
+@admin.register(ArchivedCommittee)
+class ArchivedCommitteeAdmin(ReadOnlyAdmin):
+    list_display = ("user", "commitee_role", "conference")
+    list_select_related = ("user", "conference")
@@ -0,0 +1,258 @@
+"""
+Archivage des conférences terminées : les lignes (conférence, soumissions,
+sessions, comité) quittent les tables "chaudes" pour les tables archiveApp_*,
+avec les résumés compressés. Les listes, l'admin et les index ne parcourent
+plus que les conférences actives ; la restauration fait le chemin inverse.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from ConferenceApp.async_views import CONFERENCE_DETAIL_CACHE_KEY, CONFERENCE_LIST_CACHE_KEY
+from ConferenceApp.autocomplete import conference_index
+from ConferenceApp.models import DATE_BUCKET_SERIES, Conference, DateBucket, Submission
+from ConferenceApp.signals import invalidate_analytics, invalidate_ranking
+from ConferenceApp.snapshots import conference_pages, enqueue as enqueue_snapshots
+from SessionApp.models import Session
+from sessionAppApi.signals import SESSION_DETAIL_CACHE_KEY, SESSION_LIST_CACHE_KEY
+from UserApp.models import OrganizingCommittee
+from UserApp.permissions import invalidate_committee_permissions
+from .models import (
+    ArchivedCommittee, ArchivedConference, ArchivedSession, ArchivedSubmission, compress, decompress,
+)
+
+
+# ============================
+# Paramètres (surchargeables dans settings.ARCHIVE)
+# ============================
+DEFAULTS = {
+    "RETENTION_DAYS": 365,   # archive les conférences terminées depuis plus longtemps
+    "BATCH_SIZE": 200,       # conférences déplacées par transaction
+}
+
+
+def archive_setting(name):
+    return getattr(settings, "ARCHIVE", {}).get(name, DEFAULTS[name])
+
+
+def default_cutoff():
+    return date.today() - timedelta(days=archive_setting("RETENTION_DAYS"))
+
+
+@dataclass
+class MoveReport:
+    conferences: int = 0
+    submissions: int = 0
+    sessions: int = 0
+    committees: int = 0
+    dry_run: bool = False
+    conference_ids: list = field(default_factory=list)
+
+
+def _batches(ids, size):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def _raw_delete(queryset):
+    # DELETE direct, sans collecteur ni signaux post_delete : les compteurs
+    # (DateBucket), l'index et les caches sont recalculés une fois à la fin.
+    return queryset._raw_delete(queryset.db)
+
+
+# ============================
+# ARCHIVAGE
+# ============================
+def archive_conferences(end_before=None, conference_ids=None, batch_size=None, dry_run=False):
+    """
+    Déplace les conférences terminées avant `end_before` (ou la liste
+    `conference_ids`) vers les tables d'archive. Chaque lot est copié puis
+    supprimé dans la même transaction : une conférence n'est jamais à la fois
+    absente des deux côtés. L'historique des statuts (SubmissionStatusEvent)
+    reste en place pour les rapports.
+    """
+    queryset = Conference.objects.all()
+    if conference_ids is not None:
+        queryset = queryset.filter(pk__in=conference_ids)
+    else:
+        queryset = queryset.filter(end_date__lt=end_before or default_cutoff())
+    ids = list(queryset.order_by("pk").values_list("pk", flat=True))
+
+    report = MoveReport(dry_run=dry_run, conference_ids=ids)
+    if dry_run:
+        report.conferences = len(ids)
+        report.submissions = Submission.objects.filter(conference_id__in=ids).count()
+        report.sessions = Session.objects.filter(conference_id__in=ids).count()
+        report.committees = OrganizingCommittee.objects.filter(conference_id__in=ids).count()
+        return report
+
+    user_ids = set()
+    for batch in _batches(ids, batch_size or archive_setting("BATCH_SIZE")):
+        with transaction.atomic():
+            _archive_batch(batch, report, user_ids)
+    if ids:
+        _after_move(ids, user_ids)
+    return report
+
+
+def _archive_batch(ids, report, user_ids):
+    ArchivedConference.objects.bulk_create([
+        ArchivedConference(
+            conference_id=c.conference_id, name=c.name, theme=c.theme, location=c.location,
+            description=c.description, start_date=c.start_date, end_date=c.end_date,
+            created_at=c.created_at, update_at=c.update_at,
+        )
+        for c in Conference.objects.filter(pk__in=ids)
+    ])
+    submissions = Submission.objects.filter(conference_id__in=ids)
+    ArchivedSubmission.objects.bulk_create(
+        (
+            ArchivedSubmission(
+                submission_id=s.submission_id, title=s.title, abstract_compressed=compress(s.abstract),
+                keywords=s.keywords, paper=s.paper.name, status=s.status, payed=s.payed,
+                submission_date=s.submission_date, created_at=s.created_at, update_at=s.update_at,
+                user_id=s.user_id, conference_id=s.conference_id,
+            )
+            for s in submissions.iterator(chunk_size=2000)
+        ),
+        batch_size=1000,
+    )
+    sessions = Session.objects.filter(conference_id__in=ids)
+    ArchivedSession.objects.bulk_create(
+        (
+            ArchivedSession(
+                session_id=s.session_id, title=s.title, topic=s.topic, session_day=s.session_day,
+                start_time=s.start_time, end_time=s.end_time, room=s.room,
+                capacity=s.capacity, seats_taken=s.seats_taken,
+                created_at=s.created_at, update_at=s.update_at, conference_id=s.conference_id,
+            )
+            for s in sessions.iterator(chunk_size=2000)
+        ),
+        batch_size=1000,
+    )
+    committees = OrganizingCommittee.objects.filter(conference_id__in=ids)
+    rows = list(committees)
+    ArchivedCommittee.objects.bulk_create([
+        ArchivedCommittee(
+            original_id=m.pk, commitee_role=m.commitee_role, join_date=m.join_date,
+            created_at=m.created_at, update_at=m.update_at, user_id=m.user_id, conference_id=m.conference_id,
+        )
+        for m in rows
+    ], batch_size=1000)
+    user_ids.update(m.user_id for m in rows)
+
+    report.submissions += _raw_delete(submissions)
+    report.sessions += _raw_delete(sessions)
+    report.committees += _raw_delete(committees)
+    report.conferences += _raw_delete(Conference.objects.filter(pk__in=ids))
+
+
+# ============================
+# RESTAURATION
+# ============================
+def restore_conferences(conference_ids, batch_size=None):
+    """
+    Remet les conférences archivées dans les tables actives, avec les mêmes
+    identifiants. Les lignes sont réinsérées par bulk_create : pas de save(),
+    donc ni transition de statut ni notification.
+    """
+    ids = list(ArchivedConference.objects.filter(pk__in=conference_ids).order_by("pk").values_list("pk", flat=True))
+    report = MoveReport(conference_ids=ids)
+    user_ids = set()
+    for batch in _batches(ids, batch_size or archive_setting("BATCH_SIZE")):
+        with transaction.atomic():
+            _restore_batch(batch, report, user_ids)
+    if ids:
+        _after_move(ids, user_ids)
+    return report
+
+
+def _restore_batch(ids, report, user_ids):
+    conferences = Conference.objects.bulk_create([
+        Conference(
+            conference_id=c.conference_id, name=c.name, theme=c.theme, location=c.location,
+            description=c.description, start_date=c.start_date, end_date=c.end_date,
+            created_at=c.created_at, update_at=c.update_at,
+        )
+        for c in ArchivedConference.objects.filter(pk__in=ids)
+    ])
+    submissions = Submission.objects.bulk_create(
+        (
+            Submission(
+                submission_id=s.submission_id, title=s.title, abstract=decompress(s.abstract_compressed),
+                keywords=s.keywords, paper=s.paper.name, status=s.status, payed=s.payed,
+                submission_date=s.submission_date, created_at=s.created_at, update_at=s.update_at,
+                user_id=s.user_id, conference_id=s.conference_id,
+            )
+            for s in ArchivedSubmission.objects.filter(conference_id__in=ids).iterator(chunk_size=2000)
+        ),
+        batch_size=1000,
+    )
+    sessions = Session.objects.bulk_create(
+        (
+            Session(
+                session_id=s.session_id, title=s.title, topic=s.topic, session_day=s.session_day,
+                start_time=s.start_time, end_time=s.end_time, room=s.room,
+                capacity=s.capacity, seats_taken=s.seats_taken,
+                created_at=s.created_at, update_at=s.update_at, conference_id=s.conference_id,
+            )
+            for s in ArchivedSession.objects.filter(conference_id__in=ids).iterator(chunk_size=2000)
+        ),
+        batch_size=1000,
+    )
+    committees = OrganizingCommittee.objects.bulk_create([
+        OrganizingCommittee(
+            id=m.original_id, commitee_role=m.commitee_role, join_date=m.join_date,
+            created_at=m.created_at, update_at=m.update_at, user_id=m.user_id, conference_id=m.conference_id,
+        )
+        for m in ArchivedCommittee.objects.filter(conference_id__in=ids)
+    ], batch_size=1000)
+    user_ids.update(m.user_id for m in committees)
+
+    # auto_now / auto_now_add écrasent les dates à l'insertion : on remet celles d'origine
+    for model, archived, key in (
+        (Conference, ArchivedConference, "pk__in"),
+        (Submission, ArchivedSubmission, "conference_id__in"),
+        (Session, ArchivedSession, "conference_id__in"),
+    ):
+        _restore_dates(model, archived.objects.filter(**{key: ids}))
+    _restore_dates(OrganizingCommittee, ArchivedCommittee.objects.filter(conference_id__in=ids), pk="original_id")
+
+    report.conferences += len(conferences)
+    report.submissions += len(submissions)
+    report.sessions += len(sessions)
+    report.committees += len(committees)
+    # Suppression en cascade côté archive (aucun signal sur ces modèles)
+    ArchivedConference.objects.filter(pk__in=ids).delete()
+
+
+def _restore_dates(model, archived, pk="pk"):
+    fields = ["created_at", "update_at"]
+    if model is Submission:
+        fields.append("submission_date")
+    rows = [model(pk=values[0], **dict(zip(fields, values[1:]))) for values in archived.values_list(pk, *fields)]
+    model.objects.bulk_update(rows, fields, batch_size=500)
+
+
+# ============================
+# Après un déplacement : compteurs, index et caches
+# ============================
+def _after_move(conference_ids, user_ids):
+    for series, (model, field_name) in DATE_BUCKET_SERIES.items():
+        DateBucket.rebuild(series, model.objects.all(), field_name)
+    conference_index.reset()
+    invalidate_analytics()
+    for pk in conference_ids:
+        invalidate_ranking(pk)
+    for user_id in user_ids:
+        invalidate_committee_permissions(user_id)
+    cache.delete_many(
+        [CONFERENCE_LIST_CACHE_KEY, SESSION_LIST_CACHE_KEY]
+        + [CONFERENCE_DETAIL_CACHE_KEY.format(pk=pk) for pk in conference_ids]
+    )
+    session_ids = Session.objects.filter(conference_id__in=conference_ids).values_list("pk", flat=True)
+    archived_session_ids = ArchivedSession.objects.filter(conference_id__in=conference_ids).values_list("pk", flat=True)
+    cache.delete_many([SESSION_DETAIL_CACHE_KEY.format(pk=pk) for pk in [*session_ids, *archived_session_ids]])
+    enqueue_snapshots([page for pk in conference_ids for page in conference_pages(pk)])
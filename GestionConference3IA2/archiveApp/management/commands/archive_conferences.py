@@ -0,0 +1,29 @@
+import time
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand
+from archiveApp.archive import archive_conferences, archive_setting
+
+
+class Command(BaseCommand):
+    help = (
+        "Déplace les conférences terminées depuis plus de RETENTION_DAYS jours "
+        "(settings.ARCHIVE) et leurs soumissions, sessions et comités vers l'archive."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--retention-days", type=int, help="par défaut : ARCHIVE['RETENTION_DAYS']")
+        parser.add_argument("--before", type=date.fromisoformat, help="date de fin limite (AAAA-MM-JJ)")
+        parser.add_argument("--batch-size", type=int, help="conférences par transaction")
+        parser.add_argument("--dry-run", action="store_true", help="compte les lignes sans rien déplacer")
+
+    def handle(self, *args, **options):
+        cutoff = options["before"] or date.today() - timedelta(
+            days=options["retention_days"] or archive_setting("RETENTION_DAYS"))
+        start = time.perf_counter()
+        report = archive_conferences(end_before=cutoff, batch_size=options["batch_size"], dry_run=options["dry_run"])
+        verb = "à archiver" if report.dry_run else "archivées"
+        self.stdout.write(self.style.SUCCESS(
+            f"{report.conferences} conférences terminées avant le {cutoff} {verb} en "
+            f"{time.perf_counter() - start:.1f} s ({report.submissions} soumissions, "
+            f"{report.sessions} sessions, {report.committees} membres du comité)"
+        ))
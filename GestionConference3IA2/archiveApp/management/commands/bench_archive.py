@@ -0,0 +1,102 @@
+import tempfile
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+from django.db.models import Count, Sum
+from django.db.models.functions import Length
+from django.test import Client, override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+from GestionConference3IA2.benchmark import percentile, seed_dataset
+from ConferenceApp.autocomplete import conference_index
+from ConferenceApp.models import Conference, Submission
+from UserApp.models import User
+from archiveApp.archive import archive_conferences
+from archiveApp.models import ArchivedSubmission
+
+
+# ============================
+# REQUÊTES "CHAUDES" MESURÉES avant / après l'archivage
+# ============================
+def _hot_queries(client, user):
+    return {
+        "conference_list_page": lambda: client.get("/conferences/liste/"),
+        "submissions_by_status": lambda: list(Submission.objects.values("status").annotate(n=Count("pk"))),
+        "user_submissions": lambda: list(Submission.objects.filter(user=user).select_related("conference")),
+        "upcoming_conferences": lambda: list(Conference.objects.order_by("start_date")[:50]),
+        "autocomplete": lambda: conference_index.search("Conf"),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Mesure la latence des requêtes courantes sur une base de test, avant puis "
+        "après l'archivage d'une part des conférences (90 %% par défaut)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--conferences", type=int, default=2000)
+        parser.add_argument("--users", type=int, default=4000)
+        parser.add_argument("--share", type=float, default=0.9, help="part des conférences archivées")
+        parser.add_argument("--iterations", type=int, default=30)
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        # Les GET du client de test lisent sur "replica" : même base que "default"
+        connections["replica"].creation.set_as_test_mirror(connection.settings_dict)
+        try:
+            with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+                self._run(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+    def _run(self, options):
+        self.stdout.write("Création du jeu de données...")
+        seed_dataset(conferences=options["conferences"], users=options["users"])
+        user = User.objects.get(user_id="USER0000")
+        client = Client()
+
+        before = self._measure(_hot_queries(client, user), options["iterations"])
+
+        # Date limite : les `share` premières conférences (par date de fin) partent à l'archive
+        end_dates = sorted(Conference.objects.values_list("end_date", flat=True))
+        cutoff = end_dates[min(len(end_dates) - 1, int(len(end_dates) * options["share"]))]
+        # Taille en octets (UTF-8) des résumés qui vont être compressés
+        raw = sum(
+            len(abstract.encode("utf-8")) for abstract in Submission.objects.filter(
+                conference__end_date__lt=cutoff).values_list("abstract", flat=True).iterator()
+        )
+        start = time.perf_counter()
+        report = archive_conferences(end_before=cutoff)
+        elapsed = time.perf_counter() - start
+        compressed = ArchivedSubmission.objects.aggregate(n=Sum(Length("abstract_compressed")))["n"] or 0
+        self.stdout.write(
+            f"Archivage : {report.conferences} conférences, {report.submissions} soumissions "
+            f"en {elapsed:.1f} s ; résumés : {raw / 1024:.1f} Ko -> {compressed / 1024:.1f} Ko"
+        )
+
+        after = self._measure(_hot_queries(client, user), options["iterations"])
+
+        self.stdout.write(f"\n{'requête':<26} {'p50 avant':>12} {'p50 après':>12} {'p95 avant':>12} {'p95 après':>12}")
+        for name in before:
+            b, a = before[name], after[name]
+            self.stdout.write(
+                f"{name:<26} {b['p50_ms']:>9.2f} ms {a['p50_ms']:>9.2f} ms "
+                f"{b['p95_ms']:>9.2f} ms {a['p95_ms']:>9.2f} ms"
+            )
+
+    def _measure(self, queries, iterations):
+        results = {}
+        for name, run in queries.items():
+            run()  # échauffement (index d'autocomplétion, templates)
+            latencies = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                run()
+                latencies.append(time.perf_counter() - start)
+            results[name] = {
+                "p50_ms": percentile(latencies, 50) * 1000,
+                "p95_ms": percentile(latencies, 95) * 1000,
+            }
+        return results
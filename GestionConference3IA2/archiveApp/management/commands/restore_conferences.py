@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from archiveApp.archive import restore_conferences
+
+
+class Command(BaseCommand):
+    help = "Remet des conférences archivées (et leurs données) dans les tables actives."
+
+    def add_arguments(self, parser):
+        parser.add_argument("conference_ids", nargs="+", type=int)
+
+    def handle(self, *args, **options):
+        report = restore_conferences(options["conference_ids"])
+        missing = set(options["conference_ids"]) - set(report.conference_ids)
+        if missing:
+            self.stderr.write(f"Absentes de l'archive : {', '.join(map(str, sorted(missing)))}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{report.conferences} conférences restaurées ({report.submissions} soumissions, "
+            f"{report.sessions} sessions, {report.committees} membres du comité)"
+        ))
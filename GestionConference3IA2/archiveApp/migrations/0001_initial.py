@@ -0,0 +1,79 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedConference',
+            fields=[
+                ('conference_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('theme', models.CharField(max_length=255)),
+                ('location', models.CharField(max_length=50)),
+                ('description', models.TextField()),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('created_at', models.DateTimeField()),
+                ('update_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedCommittee',
+            fields=[
+                ('original_id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('commitee_role', models.CharField(max_length=255)),
+                ('join_date', models.DateField()),
+                ('created_at', models.DateTimeField()),
+                ('update_at', models.DateTimeField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_committees', to=settings.AUTH_USER_MODEL)),
+                ('conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='committees', to='archiveApp.archivedconference')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedSession',
+            fields=[
+                ('session_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('topic', models.CharField(max_length=255)),
+                ('session_day', models.DateField()),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('room', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField()),
+                ('update_at', models.DateTimeField()),
+                ('conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sessions', to='archiveApp.archivedconference')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedSubmission',
+            fields=[
+                ('submission_id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=50)),
+                ('abstract_compressed', models.BinaryField()),
+                ('keywords', models.TextField()),
+                ('paper', models.FileField(upload_to='papers/')),
+                ('status', models.CharField(max_length=50)),
+                ('payed', models.BooleanField(default=False)),
+                ('submission_date', models.DateField()),
+                ('created_at', models.DateTimeField()),
+                ('update_at', models.DateTimeField()),
+                ('conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submissions', to='archiveApp.archivedconference')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_submissions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'submission_id'], name='archived_submission_user_idx')],
+            },
+        ),
+    ]
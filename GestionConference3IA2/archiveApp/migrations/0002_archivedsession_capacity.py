@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archiveApp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedsession',
+            name='capacity',
+            field=models.PositiveIntegerField(default=50),
+        ),
+        migrations.AddField(
+            model_name='archivedsession',
+            name='seats_taken',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
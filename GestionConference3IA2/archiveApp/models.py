@@ -0,0 +1,111 @@
+import zlib
+from django.db import models
+
+
+# Niveau de compression zlib des résumés (9 = le plus compact ; l'archive est peu lue)
+COMPRESSION_LEVEL = 9
+
+
+# Préfixe des textes stockés tels quels (un flux zlib commence toujours par 0x78)
+RAW_PREFIX = b"\x00"
+
+
+def compress(text):
+    raw = text.encode("utf-8")
+    packed = zlib.compress(raw, COMPRESSION_LEVEL)
+    # Résumés très courts : l'en-tête zlib coûte plus qu'il ne fait gagner
+    return packed if len(packed) < len(raw) else RAW_PREFIX + raw
+
+
+def decompress(data):
+    data = bytes(data)
+    if data.startswith(RAW_PREFIX):
+        return data[len(RAW_PREFIX):].decode("utf-8")
+    return zlib.decompress(data).decode("utf-8")
+
+
+# ===================================================================
+#   TABLES D'ARCHIVE (conférences terminées, lecture seule)
+#   Mêmes identifiants que dans les tables "chaudes" : les liens et
+#   les URLs de détail restent valables, et la restauration les réutilise.
+# ===================================================================
+class ArchivedConference(models.Model):
+    conference_id = models.IntegerField(primary_key=True)
+    name = models.CharField(max_length=255)
+    theme = models.CharField(max_length=255)
+    location = models.CharField(max_length=50)
+    description = models.TextField()
+    start_date = models.DateField()
+    end_date = models.DateField()
+    created_at = models.DateTimeField()
+    update_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    # Une conférence archivée se lit comme une conférence (templates partagés)
+    is_archived = True
+
+    def __str__(self):
+        return f"Conférence archivée : {self.name}"
+
+
+class ArchivedSubmission(models.Model):
+    submission_id = models.CharField(max_length=255, primary_key=True)
+    title = models.CharField(max_length=50)
+    # Résumé compressé (zlib) : c'est le champ le plus volumineux
+    abstract_compressed = models.BinaryField()
+    keywords = models.TextField()
+    paper = models.FileField(upload_to="papers/")
+    status = models.CharField(max_length=50)
+    payed = models.BooleanField(default=False)
+    submission_date = models.DateField()
+    created_at = models.DateTimeField()
+    update_at = models.DateTimeField()
+    user = models.ForeignKey("UserApp.User", on_delete=models.CASCADE, related_name="archived_submissions")
+    conference = models.ForeignKey(ArchivedConference, on_delete=models.CASCADE, related_name="submissions")
+
+    is_archived = True
+
+    class Meta:
+        indexes = [
+            # "mes soumissions" (DetailSubmissionView filtre par auteur)
+            models.Index(fields=["user", "submission_id"], name="archived_submission_user_idx"),
+        ]
+
+    @property
+    def abstract(self):
+        return decompress(self.abstract_compressed)
+
+    def __str__(self):
+        return self.title
+
+
+class ArchivedSession(models.Model):
+    session_id = models.IntegerField(primary_key=True)
+    title = models.CharField(max_length=255)
+    topic = models.CharField(max_length=255)
+    session_day = models.DateField()
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    room = models.CharField(max_length=255)
+    capacity = models.PositiveIntegerField(default=50)
+    seats_taken = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField()
+    update_at = models.DateTimeField()
+    conference = models.ForeignKey(ArchivedConference, on_delete=models.CASCADE, related_name="sessions")
+
+    def __str__(self):
+        return self.title
+
+
+class ArchivedCommittee(models.Model):
+    # id de la ligne OrganizingCommittee d'origine
+    original_id = models.BigIntegerField(primary_key=True)
+    commitee_role = models.CharField(max_length=255)
+    join_date = models.DateField()
+    created_at = models.DateTimeField()
+    update_at = models.DateTimeField()
+    user = models.ForeignKey("UserApp.User", on_delete=models.CASCADE, related_name="archived_committees")
+    conference = models.ForeignKey(ArchivedConference, on_delete=models.CASCADE, related_name="committees")
+
+    def __str__(self):
+        return f"{self.user_id} - {self.commitee_role}"
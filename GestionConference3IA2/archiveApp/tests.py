@@ -0,0 +1,60 @@
+from datetime import date, time
+from django.test import TestCase
+from ConferenceApp.models import Conference, Submission
+from SessionApp.models import Session
+from UserApp.models import OrganizingCommittee, User
+from .archive import archive_conferences, restore_conferences
+from .models import ArchivedConference, ArchivedSubmission
+
+
+class ArchiveTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(
+            username="author", email="author@esprit.tn", password="Conf-Pass-2025",
+            first_name="Au", last_name="Thor",
+        )
+        self.old, self.current = (
+            Conference.objects.create(
+                name=name, theme="IA", location="Tunis", description="desc",
+                start_date=start, end_date=start.replace(day=3),
+            )
+            for name, start in (("Ancienne", date(2020, 5, 1)), ("Actuelle", date(2099, 5, 1)))
+        )
+        self.submission = Submission.objects.create(
+            title="Article", abstract="Résumé " * 50, keywords="IA", paper="papers/a.pdf",
+            user=self.author, conference=self.old,
+        )
+        Session.objects.create(
+            title="Session", topic="IA", session_day=date(2020, 5, 1), room="Salle 1",
+            start_time=time(9), end_time=time(10), conference=self.old,
+        )
+        OrganizingCommittee.objects.create(
+            user=self.author, conference=self.old, commitee_role="chair", join_date=date(2020, 1, 1),
+        )
+
+    def test_archive_moves_only_finished_conferences(self):
+        report = archive_conferences(end_before=date(2025, 1, 1))
+        self.assertEqual((report.conferences, report.submissions, report.sessions, report.committees), (1, 1, 1, 1))
+        self.assertEqual(list(Conference.objects.values_list("name", flat=True)), ["Actuelle"])
+        archived = ArchivedSubmission.objects.get()
+        self.assertLess(len(archived.abstract_compressed), len(self.submission.abstract))
+        self.assertEqual(archived.abstract, self.submission.abstract)
+
+    def test_archived_data_stays_readable(self):
+        archive_conferences(end_before=date(2025, 1, 1))
+        self.assertContains(self.client.get(f"/conferences/{self.old.pk}/"), "Ancienne")
+        self.client.force_login(self.author)
+        response = self.client.get(f"/conferences/submissions/{self.submission.pk}/")
+        self.assertContains(response, "Résumé")
+        self.assertContains(response, "lecture seule")
+
+    def test_restore_round_trip(self):
+        archive_conferences(end_before=date(2025, 1, 1))
+        report = restore_conferences([self.old.pk])
+        self.assertEqual(report.conferences, 1)
+        self.assertFalse(ArchivedConference.objects.exists())
+        restored = Submission.objects.get(pk=self.submission.pk)
+        self.assertEqual(restored.abstract, self.submission.abstract)
+        self.assertEqual(restored.created_at, self.submission.created_at)
+        self.assertEqual(Session.objects.filter(conference=self.old).count(), 1)
+        self.assertTrue(OrganizingCommittee.objects.filter(conference=self.old, user=self.author).exists())
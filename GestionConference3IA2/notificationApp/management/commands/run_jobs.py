@@ -0,0 +1,65 @@
+import time
+from collections import defaultdict
+from django.core.management.base import BaseCommand
+from notificationApp.notifications import HANDLERS
+from notificationApp.queue import claim, complete, fail, stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Worker de la file de tâches : traite les tâches prêtes par lots "
+        "(un email par destinataire et par lot), avec reprise et backoff en cas d'échec."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument("--interval", type=float, default=2.0, help="attente (s) quand la file est vide")
+        parser.add_argument("--once", action="store_true", help="vide la file puis s'arrête")
+
+    def handle(self, *args, **options):
+        totals = defaultdict(int)
+        started = time.perf_counter()
+        try:
+            while True:
+                jobs = claim(options["batch_size"])
+                if not jobs:
+                    if options["once"]:
+                        break
+                    time.sleep(options["interval"])
+                    continue
+                self._process(jobs, totals)
+        except KeyboardInterrupt:
+            pass
+
+        elapsed = time.perf_counter() - started
+        rate = totals["done"] / elapsed if elapsed else 0.0
+        self.stdout.write(
+            f"{totals['done']} tâches traitées, {totals['failed']} en échec, "
+            f"{totals['batches']} lots en {elapsed:.2f} s ({rate:.1f} tâches/s)"
+        )
+        self.stdout.write(f"File : {stats()}")
+
+    def _process(self, jobs, totals):
+        start = time.perf_counter()
+        by_kind = defaultdict(list)
+        for job in jobs:
+            by_kind[job.kind].append(job)
+
+        for kind, kind_jobs in by_kind.items():
+            handler = HANDLERS.get(kind)
+            if handler is None:
+                fail(kind_jobs, f"type de tâche inconnu : {kind}")
+                totals["failed"] += len(kind_jobs)
+                continue
+            try:
+                sent, failed = handler(kind_jobs)
+            except Exception as e:
+                sent, failed = [], [(kind_jobs, e)]
+            complete(sent)
+            totals["done"] += len(sent)
+            for failed_jobs, error in failed:
+                fail(failed_jobs, error)
+                totals["failed"] += len(failed_jobs)
+
+        totals["batches"] += 1
+        self.stdout.write(f"lot de {len(jobs)} tâches en {(time.perf_counter() - start) * 1000:.1f} ms")
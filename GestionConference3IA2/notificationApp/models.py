@@ -0,0 +1,44 @@
+from django.db import models
+
+
+# ============================
+# MODELE : tâche de la file d'attente
+# ============================
+class Job(models.Model):
+    STATUS = [
+        ("pending", "pending"),
+        ("running", "running"),
+        ("done", "done"),
+        ("failed", "failed"),
+    ]
+
+    # Type de tâche (ex : "submission_status"), utilisé pour choisir le traitement
+    kind = models.CharField(max_length=50)
+
+    # Données de la tâche (identifiants, anciens/nouveaux statuts...)
+    payload = models.JSONField(default=dict)
+
+    # Clé d'idempotence : un même évènement ne crée qu'une seule tâche
+    idempotency_key = models.CharField(max_length=255, unique=True)
+
+    status = models.CharField(max_length=20, choices=STATUS, default="pending")
+
+    # Nombre de tentatives et prochaine exécution possible (backoff exponentiel)
+    attempts = models.PositiveIntegerField(default=0)
+    run_after = models.DateTimeField()
+
+    # Date de prise en charge par un worker (pour récupérer les tâches d'un worker arrêté)
+    locked_at = models.DateTimeField(null=True, blank=True)
+
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Requête du worker : status = 'pending' AND run_after <= now ORDER BY id
+            models.Index(fields=["status", "run_after"], name="job_status_run_after_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
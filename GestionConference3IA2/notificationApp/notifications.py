@@ -0,0 +1,87 @@
+from collections import defaultdict
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from UserApp.models import User
+from .queue import enqueue_many
+
+
+STATUS_CHANGE = "submission_status"
+
+# Statuts qui déclenchent une notification à l'auteur
+NOTIFIED_STATUSES = ("accepted", "rejected")
+
+
+def status_change_job(submission_id, user_id, title, old_status, new_status):
+    # Clé d'idempotence : une seule notification par soumission et par statut final
+    return (
+        STATUS_CHANGE,
+        f"{STATUS_CHANGE}:{submission_id}:{new_status}",
+        {
+            "submission_id": submission_id,
+            "user_id": user_id,
+            "title": title,
+            "old_status": old_status,
+            "new_status": new_status,
+        },
+    )
+
+
+def notify_status_changes(changes):
+    """
+    changes : liste de (submission_id, user_id, title, old_status, new_status).
+    Ajoute une tâche par changement vers un statut notifié (dans la transaction
+    courante : la tâche n'existe que si le changement est bien enregistré).
+    """
+    enqueue_many([
+        status_change_job(*change) for change in changes
+        if change[4] in NOTIFIED_STATUSES and change[3] != change[4]
+    ])
+
+
+# ============================
+# ENVOI : un seul email par destinataire pour tout un lot de tâches
+# ============================
+STATUS_LABELS = {"accepted": "acceptée", "rejected": "refusée"}
+
+
+def send_status_notifications(jobs):
+    """
+    Regroupe les tâches par auteur et envoie un email récapitulatif à chacun,
+    sur une seule connexion du backend email configuré (EMAIL_BACKEND).
+    Renvoie (tâches envoyées, [(tâches en échec, erreur)]).
+    """
+    by_user = defaultdict(list)
+    for job in jobs:
+        by_user[job.payload["user_id"]].append(job)
+    emails = dict(User.objects.filter(user_id__in=by_user).values_list("user_id", "email"))
+
+    sent, failed = [], []
+    with get_connection() as mail_connection:
+        for user_id, user_jobs in by_user.items():
+            if user_id not in emails:
+                # Auteur supprimé : rien à envoyer
+                sent.extend(user_jobs)
+                continue
+            lines = [
+                f"- « {job.payload['title']} » : {STATUS_LABELS.get(job.payload['new_status'], job.payload['new_status'])}"
+                for job in user_jobs
+            ]
+            message = EmailMessage(
+                subject="Décision sur vos soumissions" if len(user_jobs) > 1 else "Décision sur votre soumission",
+                body="Bonjour,\n\nLe statut de vos soumissions a changé :\n" + "\n".join(lines) + "\n",
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[emails[user_id]],
+                connection=mail_connection,
+            )
+            try:
+                message.send()
+                sent.extend(user_jobs)
+            except Exception as e:
+                failed.append((user_jobs, e))
+    return sent, failed
+
+
+# Traitement associé à chaque type de tâche
+HANDLERS = {
+    STATUS_CHANGE: send_status_notifications,
+}
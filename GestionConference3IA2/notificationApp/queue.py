@@ -0,0 +1,95 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+from .models import Job
+
+
+# ============================
+# Paramètres (surchargeables dans settings.JOB_QUEUE)
+# ============================
+DEFAULTS = {
+    "MAX_ATTEMPTS": 5,
+    "BACKOFF_BASE": 30,      # secondes ; délai = base * 2^(tentative - 1)
+    "BACKOFF_MAX": 3600,
+    "LOCK_TIMEOUT": 600,     # une tâche "running" plus vieille est rendue à la file
+}
+
+
+def queue_setting(name):
+    return getattr(settings, "JOB_QUEUE", {}).get(name, DEFAULTS[name])
+
+
+# ============================
+# AJOUT DE TÂCHES
+# ============================
+def enqueue_many(jobs):
+    """
+    jobs : liste de (kind, idempotency_key, payload).
+    Les clés déjà présentes sont ignorées : rejouer un évènement ne crée pas de doublon.
+    """
+    now = timezone.now()
+    Job.objects.bulk_create(
+        [Job(kind=kind, idempotency_key=key, payload=payload, run_after=now) for kind, key, payload in jobs],
+        ignore_conflicts=True,
+    )
+
+
+def enqueue(kind, idempotency_key, payload):
+    enqueue_many([(kind, idempotency_key, payload)])
+
+
+# ============================
+# CONSOMMATION (worker)
+# ============================
+def claim(limit=100):
+    """
+    Réserve jusqu'à `limit` tâches prêtes et les passe en "running".
+    Sur SQLite, la transaction IMMEDIATE sérialise les workers ; sur une base
+    qui le permet, SELECT ... FOR UPDATE SKIP LOCKED évite qu'ils s'attendent.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        # Tâches d'un worker arrêté en cours de route
+        Job.objects.filter(
+            status="running", locked_at__lt=now - timedelta(seconds=queue_setting("LOCK_TIMEOUT"))
+        ).update(status="pending", locked_at=None)
+
+        ready = Job.objects.filter(status="pending", run_after__lte=now).order_by("id")
+        if connection.features.has_select_for_update_skip_locked:
+            ready = ready.select_for_update(skip_locked=True)
+        ids = list(ready.values_list("id", flat=True)[:limit])
+        Job.objects.filter(id__in=ids).update(status="running", locked_at=now)
+    return list(Job.objects.filter(id__in=ids).order_by("id"))
+
+
+def complete(jobs):
+    Job.objects.filter(id__in=[job.id for job in jobs]).update(
+        status="done", finished_at=timezone.now(), locked_at=None, last_error="",
+    )
+
+
+def fail(jobs, error):
+    """
+    Replanifie les tâches avec un backoff exponentiel, ou les marque "failed"
+    après MAX_ATTEMPTS tentatives.
+    """
+    now = timezone.now()
+    for job in jobs:
+        job.attempts += 1
+        job.last_error = str(error)[:2000]
+        job.locked_at = None
+        if job.attempts >= queue_setting("MAX_ATTEMPTS"):
+            job.status = "failed"
+            job.finished_at = now
+        else:
+            delay = min(queue_setting("BACKOFF_BASE") * 2 ** (job.attempts - 1), queue_setting("BACKOFF_MAX"))
+            job.status = "pending"
+            job.run_after = now + timedelta(seconds=delay)
+    Job.objects.bulk_update(jobs, ["attempts", "last_error", "locked_at", "status", "finished_at", "run_after"])
+
+
+def stats():
+    """ Nombre de tâches par statut (profondeur de la file). """
+    return dict(Job.objects.values_list("status").annotate(n=Count("id")).order_by())
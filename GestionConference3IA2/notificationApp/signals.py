@@ -0,0 +1,11 @@
+from django.dispatch import receiver
+from ConferenceApp.status import status_changed
+from .notifications import notify_status_changes
+
+
+# ============================
+# Changement de statut d'une soumission (save() ou queryset.change_status())
+# ============================
+@receiver(status_changed)
+def enqueue_status_notifications(sender, changes, **kwargs):
+    notify_status_changes(changes)
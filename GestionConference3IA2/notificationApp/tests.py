@@ -0,0 +1,69 @@
+from datetime import timedelta
+from io import StringIO
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from ConferenceApp.models import Conference, Submission
+from UserApp.models import User
+from .models import Job
+from .queue import claim, fail
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class StatusNotificationTests(TestCase):
+    def setUp(self):
+        self.conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=timezone.now().date(), end_date=timezone.now().date() + timedelta(days=2),
+        )
+        self.author = User.objects.create_user(
+            username="author", email="author@esprit.tn", password="Conf-Pass-2025",
+            first_name="Au", last_name="Thor",
+        )
+        self.submissions = [
+            Submission.objects.create(
+                title=f"Article {i}", abstract="abstract", keywords="IA", paper="papers/a.pdf",
+                status="submitted", user=self.author, conference=self.conference,
+            )
+            for i in range(3)
+        ]
+
+    def _run_jobs(self):
+        call_command("run_jobs", "--once", stdout=StringIO())
+
+    def test_save_enqueues_one_job_per_status(self):
+        submission = self.submissions[0]
+        submission.status = "accepted"
+        submission.save()
+        submission.save()
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_admin_update_is_batched_per_recipient(self):
+        Submission.objects.all().change_status("accepted")
+        self.assertEqual(Job.objects.filter(status="pending").count(), 3)
+
+        self._run_jobs()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["author@esprit.tn"])
+        self.assertIn("Article 2", mail.outbox[0].body)
+        self.assertEqual(Job.objects.filter(status="done").count(), 3)
+
+        # Rejouer l'action ne renvoie rien
+        Submission.objects.all().change_status("accepted")
+        self._run_jobs()
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(JOB_QUEUE={"MAX_ATTEMPTS": 2, "BACKOFF_BASE": 60})
+    def test_failure_backoff_then_failed(self):
+        Submission.objects.filter(pk=self.submissions[0].pk).change_status("rejected")
+        jobs = claim()
+        fail(jobs, "smtp down")
+        job = Job.objects.get()
+        self.assertEqual((job.status, job.attempts), ("pending", 1))
+        self.assertGreater(job.run_after, timezone.now() + timedelta(seconds=50))
+        self.assertEqual(claim(), [])
+
+        Job.objects.update(run_after=timezone.now())
+        fail(claim(), "smtp down")
+        self.assertEqual(Job.objects.get().status, "failed")
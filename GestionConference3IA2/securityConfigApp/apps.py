@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class SecurityconfigappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'securityConfigApp'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from .user_cache import _local_get, _local_set, cache_setting, user_key, version_key
+
+
+# ============================
+# AUTHENTIFICATION JWT avec utilisateur mis en cache
+# ============================
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    Comme JWTAuthentication, mais l'utilisateur est résolu depuis un cache
+    (processus puis cache partagé) indexé par user_id + version, au lieu
+    d'une requête SQL à chaque appel de l'API. La version vient du cache
+    partagé, incrémentée à chaque sauvegarde de l'utilisateur (signals.py).
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        # Version lue à chaque appel : une invalidation faite par un autre processus
+        # (désactivation, mot de passe) est vue tout de suite
+        version = cache.get(version_key(user_id), 0)
+        user = _local_get(user_id, version)
+        if user is not None:
+            return user
+
+        user = cache.get(user_key(user_id, version))
+        if user is None:
+            # Requête SQL + vérification is_active faites par simplejwt
+            user = super().get_user(validated_token)
+            cache.set(user_key(user_id, version), user, cache_setting("SHARED_TTL"))
+
+        _local_set(user_id, version, user)
+        return user
+
+
+# ============================
+# Utilisateur "léger" construit à partir des claims du token
+# ============================
+class ClaimsUser(TokenUser):
+    """
+    Utilisateur sans requête SQL : tous les attributs viennent du token
+    (voir securityConfigApp.serializers.ClaimsTokenObtainPairSerializer).
+    """
+
+    @cached_property
+    def user_id(self):
+        return self.token[api_settings.USER_ID_CLAIM]
+
+    @cached_property
+    def role(self):
+        return self.token.get("role", "participant")
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    Mode opt-in pour les endpoints en lecture seule :
+        authentication_classes = [ClaimsJWTAuthentication]
+    (utilisé par GET /api/registrations/, voir sessionAppApi.views.RegistrationViewSet).
+    Aucun accès à la base ni au cache. Attention : un utilisateur désactivé
+    garde l'accès jusqu'à l'expiration de son access token.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+        return ClaimsUser(validated_token)
@@ -0,0 +1,85 @@
+import json
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from UserApp.models import User
+from securityConfigApp.serializers import ClaimsTokenObtainPairSerializer, RotatingTokenRefreshSerializer
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare le coût CPU pour 1000 clients actifs pendant une heure : "
+        "connexion par mot de passe toutes les 5 minutes contre flux refresh token."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--samples", type=int, default=50, help="nombre d'opérations mesurées par scénario")
+        parser.add_argument("--clients", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        samples = options["samples"]
+        password = "Bench-Refresh-2025!"
+        try:
+            # Utilisateur temporaire : tout est annulé à la fin de la mesure
+            with transaction.atomic():
+                user = User(username="bench_refresh", email="bench_refresh@esprit.tn",
+                            first_name="Bench", last_name="Refresh",
+                            affiliation="bench", nationality="bench")
+                user.set_password(password)
+                user.save()
+
+                login_cpu = self._measure(samples, lambda: self._login(password))
+                refresh = self._login(password)["refresh"]
+
+                def do_refresh():
+                    nonlocal refresh
+                    refresh = self._refresh(refresh)["refresh"]
+
+                refresh_cpu = self._measure(samples, do_refresh)
+                raise Rollback
+        except Rollback:
+            pass
+
+        jwt = settings.SIMPLE_JWT
+        access_per_hour = 3600 / jwt["ACCESS_TOKEN_LIFETIME"].total_seconds()
+        refresh_lifetime_h = jwt["REFRESH_TOKEN_LIFETIME"].total_seconds() / 3600
+        clients = options["clients"]
+
+        # Scénario 1 : le client renvoie son mot de passe à chaque expiration
+        password_flow = clients * access_per_hour * login_cpu
+        # Scénario 2 : une connexion par durée de vie du refresh token, puis des refresh
+        refresh_flow = clients * (login_cpu / refresh_lifetime_h + access_per_hour * refresh_cpu)
+
+        result = {
+            "cpu_ms_per_login": round(login_cpu * 1000, 3),
+            "cpu_ms_per_refresh": round(refresh_cpu * 1000, 3),
+            "clients": clients,
+            "cpu_s_per_hour_password_flow": round(password_flow, 2),
+            "cpu_s_per_hour_refresh_flow": round(refresh_flow, 2),
+            "speedup": round(password_flow / refresh_flow, 1) if refresh_flow else None,
+        }
+        self.stdout.write(json.dumps(result, indent=2))
+
+    def _measure(self, samples, func):
+        start = time.process_time()
+        for _ in range(samples):
+            func()
+        return (time.process_time() - start) / samples
+
+    def _login(self, password):
+        serializer = ClaimsTokenObtainPairSerializer(
+            data={"username": "bench_refresh", "password": password},
+            context={"request": None},
+        )
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    def _refresh(self, token):
+        serializer = RotatingTokenRefreshSerializer(data={"refresh": token})
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
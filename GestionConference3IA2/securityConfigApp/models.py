@@ -1,3 +1,24 @@
 from django.db import models
 
-# Create your models here.
+
+# ============================
+# MODELE : token révoqué (liste noire)
+# ============================
+class RevokedToken(models.Model):
+    """
+    Une ligne par refresh token révoqué (clé = jti du token), ou par
+    utilisateur dont tous les tokens émis avant `revoked_at` sont révoqués
+    (clé = "user:<user_id>", après un changement de mot de passe ou une désactivation).
+    Cette table n'est lue qu'au chargement du filtre de Bloom (voir revocation.py)
+    et quand le filtre répond "peut-être révoqué".
+    """
+    key = models.CharField(max_length=255, db_index=True)
+
+    # Date de la révocation
+    revoked_at = models.DateTimeField(auto_now_add=True)
+
+    # Date d'expiration du token : au-delà, la ligne peut être supprimée
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"Révoqué : {self.key}"
@@ -0,0 +1,190 @@
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from .models import RevokedToken
+
+
+# ============================
+# Paramètres (surchargeables dans settings.JWT_REVOCATION)
+# ============================
+DEFAULTS = {
+    "CAPACITY": 100000,      # nombre de révocations prévues dans le filtre
+    "ERROR_RATE": 0.001,     # taux de faux positifs visé
+    "SYNC_INTERVAL": 30,     # secondes entre deux synchronisations avec la base
+}
+
+
+def revocation_setting(name):
+    return getattr(settings, "JWT_REVOCATION", {}).get(name, DEFAULTS[name])
+
+
+def user_revocation_key(user_id):
+    return f"user:{user_id}"
+
+
+def _cache_key(key):
+    return f"jwt:revoked:{key}"
+
+
+# ============================
+# FILTRE DE BLOOM
+# ============================
+class BloomFilter:
+    """
+    Ensemble probabiliste : `key in filtre` peut donner un faux positif,
+    jamais un faux négatif. Un test coûte quelques hachages, sans accès à la base.
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        # Double hachage : h1 + i*h2 donne hash_count positions indépendantes
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+# ============================
+# STOCKAGE DES RÉVOCATIONS : base de données + filtre en mémoire
+# ============================
+class RevocationStore:
+    """
+    Le filtre est chargé depuis RevokedToken puis complété de façon incrémentale
+    (lignes d'id > last_id) au plus une fois par SYNC_INTERVAL secondes.
+    Les révocations faites par les autres processus pendant cet intervalle sont
+    vues grâce au cache partagé entre les processus (settings.CACHES, FileBasedCache) :
+    revoke() y écrit la clé, might_be_revoked() la lit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._last_id = 0
+        self._count = 0
+        self._capacity = 0
+        self._synced_at = 0.0
+
+    def _rebuild(self):
+        RevokedToken.objects.filter(expires_at__lt=timezone.now()).delete()
+        # Au moins deux fois les lignes restantes : au-delà de CAPACITY, le filtre
+        # grandit au lieu d'être reconstruit à chaque synchronisation
+        self._capacity = max(revocation_setting("CAPACITY"), 2 * RevokedToken.objects.count())
+        self._bloom = BloomFilter(self._capacity, revocation_setting("ERROR_RATE"))
+        self._last_id = 0
+        self._count = 0
+        self._load_new_rows()
+
+    def _load_new_rows(self):
+        rows = RevokedToken.objects.filter(id__gt=self._last_id).order_by("id").values_list("id", "key")
+        for row_id, key in rows.iterator():
+            self._bloom.add(key)
+            self._last_id = row_id
+            self._count += 1
+        self._synced_at = time.monotonic()
+
+    def _sync(self):
+        if self._bloom is not None and time.monotonic() - self._synced_at < revocation_setting("SYNC_INTERVAL"):
+            return
+        with self._lock:
+            if self._bloom is None or self._count > self._capacity:
+                # Filtre trop rempli : on le reconstruit sans les lignes expirées
+                self._rebuild()
+            elif time.monotonic() - self._synced_at >= revocation_setting("SYNC_INTERVAL"):
+                self._load_new_rows()
+
+    def might_be_revoked(self, key):
+        self._sync()
+        return key in self._bloom or cache.get(_cache_key(key)) is not None
+
+    def revoke(self, key, expires_at):
+        """
+        Révoque `key` jusqu'à `expires_at` (datetime ou timestamp du claim "exp").
+        """
+        if not isinstance(expires_at, datetime):
+            expires_at = datetime.fromtimestamp(expires_at, tz=dt_timezone.utc)
+        row = RevokedToken.objects.create(key=key, expires_at=expires_at)
+        timeout = max(1, int((expires_at - timezone.now()).total_seconds()))
+        cache.set(_cache_key(key), row.revoked_at.timestamp(), timeout)
+        self._sync()
+        with self._lock:
+            # La ligne sera comptée lors de la prochaine synchronisation
+            self._bloom.add(key)
+
+    def is_token_revoked(self, token):
+        """
+        Vrai si le token (refresh ou access) est révoqué, directement par son jti
+        ou sa famille, ou parce qu'il a été émis avant une révocation de son utilisateur.
+        Dans le cas courant (deux réponses négatives du filtre) aucune requête SQL.
+        """
+        # jti du token, et famille de refresh tokens (déconnexion : voir rotate_refresh)
+        for key in {token.get("jti"), token.get("fam")} - {None}:
+            if self.might_be_revoked(key) and RevokedToken.objects.filter(key=key).exists():
+                return True
+
+        user_id = token.get(settings.SIMPLE_JWT.get("USER_ID_CLAIM", "user_id"))
+        if user_id is None:
+            return False
+        user_key = user_revocation_key(user_id)
+        if not self.might_be_revoked(user_key):
+            return False
+        last = (
+            RevokedToken.objects.filter(key=user_key)
+            .order_by("-revoked_at")
+            .values_list("revoked_at", flat=True)
+            .first()
+        )
+        issued_at = token.get("iat")
+        # "iat" est en secondes entières : un token obtenu dans la même seconde que
+        # la révocation (nouvelle connexion après un changement de mot de passe) reste valide
+        return last is not None and (issued_at is None or issued_at < int(last.timestamp()))
+
+
+revocation_store = RevocationStore()
+
+
+# ============================
+# ROTATION DES REFRESH TOKENS (sans écriture en base)
+# ============================
+def _family_key(family):
+    return f"jwt:family:{family}"
+
+
+def token_family(token):
+    # jti du refresh token obtenu au login, gardé dans le claim "fam" à chaque rotation
+    return token.get("fam") or token["jti"]
+
+
+def rotate_refresh(refresh):
+    """
+    Passe le refresh token à la génération suivante de sa famille (claims
+    "fam" / "gen"). Le cache partagé garde la génération attendue de chaque
+    famille : une entrée par session active, aucune ligne RevokedToken par
+    rotation. Renvoie False si le token a déjà servi (génération dépassée).
+    Entrée disparue du cache (éviction) : le token est accepté.
+    """
+    family, generation = token_family(refresh), refresh.get("gen", 0)
+    key = _family_key(family)
+    expected = cache.get(key)
+    if expected is not None and expected != generation:
+        return False
+    lifetime = settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"]
+    cache.set(key, generation + 1, int(lifetime.total_seconds()))
+    refresh["fam"] = family
+    refresh["gen"] = generation + 1
+    return True
@@ -0,0 +1,90 @@
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenVerifySerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, UntypedToken
+from .revocation import revocation_store, rotate_refresh, token_family
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Ajoute au token les informations utilisées par ClaimsJWTAuthentication,
+    pour que les endpoints en lecture seule n'aient pas besoin de la base.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token["username"] = user.username
+        token["role"] = user.role
+        token["is_staff"] = user.is_staff
+        token["is_superuser"] = user.is_superuser
+        return token
+
+
+def _load_refresh(raw):
+    try:
+        refresh = RefreshToken(raw)
+    except TokenError as e:
+        raise InvalidToken(e.args[0])
+    if revocation_store.is_token_revoked(refresh):
+        raise InvalidToken("Token is revoked")
+    return refresh
+
+
+class RotatingTokenRefreshSerializer(serializers.Serializer):
+    """
+    Échange un refresh token contre un nouvel access token (et un nouveau
+    refresh token si ROTATE_REFRESH_TOKENS). Contrairement au serializer de
+    simplejwt, aucune requête SELECT sur l'utilisateur : la révocation
+    (changement de mot de passe, désactivation, déconnexion) est vérifiée par
+    le filtre de Bloom, la rotation par le cache partagé. Pas d'accès à la base.
+    """
+    refresh = serializers.CharField()
+    access = serializers.CharField(read_only=True)
+
+    def validate(self, attrs):
+        refresh = _load_refresh(attrs["refresh"])
+        data = {}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            # L'ancien refresh token ne pourra plus être réutilisé
+            if not rotate_refresh(refresh):
+                raise InvalidToken("Token has already been used")
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        # Après la rotation : l'access token garde la famille (révoquée à la déconnexion)
+        data["access"] = str(refresh.access_token)
+        return data
+
+
+class RevocationAwareTokenVerifySerializer(TokenVerifySerializer):
+    """
+    Vérifie la signature et l'expiration (comme simplejwt) puis la révocation.
+    """
+
+    def validate(self, attrs):
+        try:
+            token = UntypedToken(attrs["token"])
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
+        if revocation_store.is_token_revoked(token):
+            raise InvalidToken("Token is revoked")
+        return {}
+
+
+class TokenRevokeSerializer(serializers.Serializer):
+    """
+    Déconnexion : révoque la famille du refresh token fourni (toutes ses
+    rotations, et les access tokens qui en sont issus).
+    """
+    refresh = serializers.CharField()
+
+    def validate(self, attrs):
+        refresh = _load_refresh(attrs["refresh"])
+        # La dernière rotation de la famille expire au plus tard dans REFRESH_TOKEN_LIFETIME
+        revocation_store.revoke(token_family(refresh), timezone.now() + api_settings.REFRESH_TOKEN_LIFETIME)
+        return {}
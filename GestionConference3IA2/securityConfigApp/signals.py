@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from .user_cache import invalidate_user
+from .revocation import revocation_store, user_revocation_key
+
+
+# ============================
+# Invalidation du cache d'authentification
+# ============================
+# Toute sauvegarde de l'utilisateur (désactivation, set_password() suivi de save(), ...)
+# change sa version dans le cache.
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+# ============================
+# Révocation des refresh tokens
+# ============================
+# On garde l'état chargé depuis la base pour détecter, sans requête
+# supplémentaire, un changement de mot de passe ou une désactivation.
+@receiver(post_init, sender=settings.AUTH_USER_MODEL)
+def remember_credentials(sender, instance, **kwargs):
+    instance._jwt_snapshot = (instance.password, instance.is_active)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def revoke_tokens_on_credentials_change(sender, instance, created, **kwargs):
+    if created:
+        instance._jwt_snapshot = (instance.password, instance.is_active)
+        return
+    old_password, was_active = getattr(instance, "_jwt_snapshot", (instance.password, instance.is_active))
+    if instance.password != old_password or (was_active and not instance.is_active):
+        # Tous les tokens émis avant maintenant deviennent invalides
+        lifetime = settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"]
+        revocation_store.revoke(user_revocation_key(instance.pk), timezone.now() + lifetime)
+    instance._jwt_snapshot = (instance.password, instance.is_active)
@@ -1,3 +1,178 @@
-from django.test import TestCase
+import subprocess
+import sys
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from UserApp.models import User
+from .authentication import CachedJWTAuthentication, ClaimsJWTAuthentication
+from .models import RevokedToken
+from .revocation import BloomFilter, RevocationStore, user_revocation_key
+from .serializers import ClaimsTokenObtainPairSerializer
+from .user_cache import _local_users
 
-# Create your tests here.
+
+class RevocationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="member", email="member@esprit.tn", password="Conf-Pass-2025", first_name="M", last_name="B",
+        )
+
+    def _refresh(self, refresh):
+        return self.client.post("/security/api/token/refresh/", {"refresh": refresh})
+
+    def test_rotation_issues_new_refresh_and_rejects_reuse(self):
+        old = str(RefreshToken.for_user(self.user))
+        rotated = self._refresh(old)
+        self.assertEqual(rotated.status_code, 200)
+        self.assertNotEqual(rotated.json()["refresh"], old)
+        # L'ancien refresh token a déjà servi : il est refusé
+        self.assertEqual(self._refresh(old).status_code, 401)
+        self.assertEqual(self._refresh(rotated.json()["refresh"]).status_code, 200)
+
+    def test_rotation_writes_nothing_to_the_database(self):
+        refresh = self._refresh(str(RefreshToken.for_user(self.user))).json()["refresh"]
+        with self.assertNumQueries(0):
+            rotated = self._refresh(refresh)
+        self.assertEqual(rotated.status_code, 200)
+        self.assertFalse(RevokedToken.objects.exists())
+        self.assertEqual(self._refresh(refresh).status_code, 401)
+
+    def test_logout_revokes_the_whole_family(self):
+        first = RefreshToken.for_user(self.user)
+        rotated = self._refresh(str(first)).json()
+        self.assertEqual(self.client.post("/security/api/token/revoke/", {"refresh": rotated["refresh"]}).status_code, 205)
+        self.assertEqual(self._refresh(rotated["refresh"]).status_code, 401)
+        verify = self.client.post("/security/api/token/verify/", {"token": rotated["access"]})
+        self.assertEqual(verify.status_code, 401)
+        self.assertEqual(RevokedToken.objects.get().key, first["jti"])
+
+    def test_filter_over_capacity_is_not_rebuilt_at_each_sync(self):
+        expires_at = timezone.now() + timedelta(days=1)
+        RevokedToken.objects.bulk_create([RevokedToken(key=f"jti-{i}", expires_at=expires_at) for i in range(30)])
+        with self.settings(JWT_REVOCATION={"CAPACITY": 10, "ERROR_RATE": 0.001, "SYNC_INTERVAL": 0}):
+            store = RevocationStore()
+            self.assertTrue(store.might_be_revoked("jti-3"))
+            # Synchronisation suivante : seulement les nouvelles lignes (pas de DELETE ni de relecture)
+            with self.assertNumQueries(1):
+                self.assertTrue(store.might_be_revoked("jti-29"))
+
+    def test_revoke_endpoint_invalidates_refresh(self):
+        refresh = str(RefreshToken.for_user(self.user))
+        self.assertEqual(self.client.post("/security/api/token/revoke/", {"refresh": refresh}).status_code, 205)
+        self.assertEqual(self._refresh(refresh).status_code, 401)
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(1000, 0.01)
+        keys = [f"jti-{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+        self.assertTrue(all(key in bloom for key in keys))
+        false_positives = sum(f"autre-{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_unrevoked_token_needs_no_query(self):
+        store = RevocationStore()
+        store.revoke("jti-revoque", timezone.now() + timedelta(days=1))
+        token = RefreshToken.for_user(self.user)
+        with self.assertNumQueries(0):
+            self.assertFalse(store.is_token_revoked(token))
+
+    def test_revocation_seen_by_other_processes(self):
+        store = RevocationStore()
+        self.assertFalse(store.might_be_revoked("jti-autre-processus"))
+        # Révocation écrite par un autre processus, avant la prochaine synchronisation du filtre
+        code = (
+            "from django.core.cache import cache; from securityConfigApp.revocation import _cache_key; "
+            "cache.set(_cache_key('jti-autre-processus'), 1, 60)"
+        )
+        proc = subprocess.run(
+            [sys.executable, "manage.py", "shell", "-v", "0", "-c", code],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=120,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+        self.assertTrue(store.might_be_revoked("jti-autre-processus"))
+
+    def test_password_change_revokes_older_tokens(self):
+        token = RefreshToken.for_user(self.user)
+        token["iat"] -= 2
+        self.user.set_password("New-Pass-2025")
+        self.user.save()
+        store = RevocationStore()
+        self.assertTrue(store.is_token_revoked(token))
+        self.assertFalse(store.is_token_revoked(RefreshToken.for_user(self.user)))
+
+    def test_token_issued_in_revocation_second_is_valid(self):
+        store = RevocationStore()
+        store.revoke(user_revocation_key(self.user.pk), timezone.now() + timedelta(days=1))
+        revoked_at = int(RevokedToken.objects.get().revoked_at.timestamp())
+        token = RefreshToken.for_user(self.user)
+        token["iat"] = revoked_at
+        self.assertFalse(store.is_token_revoked(token))
+        token["iat"] = revoked_at - 1
+        self.assertTrue(store.is_token_revoked(token))
+
+
+class CachedAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        _local_users.clear()
+        self.user = User.objects.create_user(
+            username="member", email="member@esprit.tn", password="Conf-Pass-2025", first_name="M", last_name="B",
+            role="commitee",
+        )
+
+    def _authenticate(self, authentication, token):
+        request = RequestFactory().get("/api/sessions/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return authentication.authenticate(request)[0]
+
+    def test_user_resolved_once_then_from_cache(self):
+        token = AccessToken.for_user(self.user)
+        with self.assertNumQueries(1):
+            self.assertEqual(self._authenticate(CachedJWTAuthentication(), token).pk, self.user.pk)
+        with self.assertNumQueries(0):
+            self._authenticate(CachedJWTAuthentication(), token)
+        # Cache du processus vide (autre worker) : le cache partagé suffit
+        _local_users.clear()
+        with self.assertNumQueries(0):
+            self._authenticate(CachedJWTAuthentication(), token)
+
+    def test_cache_invalidated_on_save(self):
+        token = AccessToken.for_user(self.user)
+        self._authenticate(CachedJWTAuthentication(), token)
+
+        self.user.set_password("New-Pass-2025")
+        self.user.save()
+        user = self._authenticate(CachedJWTAuthentication(), token)
+        self.assertTrue(user.check_password("New-Pass-2025"))
+
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(CachedJWTAuthentication(), token)
+
+    def test_invalidation_seen_by_other_processes(self):
+        token = AccessToken.for_user(self.user)
+        self._authenticate(CachedJWTAuthentication(), token)
+        # Désactivation faite par un autre processus (sans signal dans celui-ci)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        code = f"from securityConfigApp.user_cache import invalidate_user; invalidate_user({self.user.pk!r})"
+        proc = subprocess.run(
+            [sys.executable, "manage.py", "shell", "-v", "0", "-c", code],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=120,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(CachedJWTAuthentication(), token)
+
+    def test_claims_mode_needs_no_query(self):
+        token = ClaimsTokenObtainPairSerializer.get_token(self.user).access_token
+        with self.assertNumQueries(0):
+            user = self._authenticate(ClaimsJWTAuthentication(), token)
+        self.assertTrue(user.is_authenticated)
+        self.assertEqual((user.user_id, user.username, user.role), (self.user.pk, "member", "commitee"))
+        self.assertFalse(user.is_staff)
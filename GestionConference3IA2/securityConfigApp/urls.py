@@ -1,7 +1,9 @@
 from django.urls import path 
-from rest_framework_simplejwt.views import ( 
-TokenObtainPairView, 
-) 
+from GestionConference3IA2.lazy_urls import lazy_view
+# simplejwt n'est importé qu'au premier appel d'une de ces routes
 urlpatterns =[ 
-path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'), 
-]
\ No newline at end of file
+path('api/token/', lazy_view('rest_framework_simplejwt.views.TokenObtainPairView', csrf_exempt=True), name='token_obtain_pair'), 
+path('api/token/refresh/', lazy_view('securityConfigApp.views.RotatingTokenRefreshView', csrf_exempt=True), name='token_refresh'), 
+path('api/token/verify/', lazy_view('securityConfigApp.views.RevocationAwareTokenVerifyView', csrf_exempt=True), name='token_verify'), 
+path('api/token/revoke/', lazy_view('securityConfigApp.views.TokenRevokeView', csrf_exempt=True), name='token_revoke'), 
+]
@@ -0,0 +1,73 @@
+import threading
+import time
+from django.conf import settings
+from django.core.cache import cache
+
+
+# Module sans dépendance à DRF / simplejwt : importé par les signaux au
+# démarrage, alors que authentication.py n'est chargé qu'au premier appel de l'API.
+
+# ============================
+# Paramètres du cache des utilisateurs (surchargeables dans settings.JWT_USER_CACHE)
+# ============================
+DEFAULTS = {
+    "LOCAL_TTL": 5,          # durée de vie (s) dans le cache du processus
+    "LOCAL_MAX_SIZE": 10000,  # nombre max d'utilisateurs gardés en mémoire par processus
+    "SHARED_TTL": 60,        # durée de vie (s) dans le cache partagé (settings.CACHES)
+}
+
+
+def cache_setting(name):
+    return getattr(settings, "JWT_USER_CACHE", {}).get(name, DEFAULTS[name])
+
+
+def version_key(user_id):
+    return f"auth:user_version:{user_id}"
+
+
+def user_key(user_id, version):
+    return f"auth:user:{user_id}:{version}"
+
+
+# ============================
+# Cache local au processus : {user_id: (expiration, version, user)}
+# ============================
+# La version est relue à chaque appel dans le cache partagé : une entrée locale
+# d'une version dépassée (utilisateur modifié par un autre processus) est ignorée.
+_local_users = {}
+_local_lock = threading.Lock()
+
+
+def _local_get(user_id, version):
+    entry = _local_users.get(user_id)
+    if entry is None:
+        return None
+    expires, local_version, user = entry
+    if expires < time.monotonic() or local_version != version:
+        _local_users.pop(user_id, None)
+        return None
+    return user
+
+
+def _local_set(user_id, version, user):
+    with _local_lock:
+        if len(_local_users) >= cache_setting("LOCAL_MAX_SIZE"):
+            # Plus simple qu'un LRU : on repart d'un cache vide quand il est plein
+            _local_users.clear()
+        _local_users[user_id] = (time.monotonic() + cache_setting("LOCAL_TTL"), version, user)
+
+
+def invalidate_user(user_id):
+    """
+    Incrémente la version de l'utilisateur dans le cache partagé : les entrées
+    de l'ancienne version (partagées et locales, dans tous les processus)
+    ne sont plus utilisées dès l'appel suivant.
+    """
+    key = version_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # La clé n'existe pas encore
+        cache.set(key, 1, None)
+    with _local_lock:
+        _local_users.pop(user_id, None)
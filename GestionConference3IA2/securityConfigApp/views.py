@@ -1,3 +1,33 @@
-from django.shortcuts import render
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework_simplejwt.views import TokenRefreshView, TokenVerifyView, TokenViewBase
+from .serializers import (
+    RevocationAwareTokenVerifySerializer,
+    RotatingTokenRefreshSerializer,
+    TokenRevokeSerializer,
+)
 
-# Create your views here.
+
+# ============================
+# POST /security/api/token/refresh/
+# ============================
+class RotatingTokenRefreshView(TokenRefreshView):
+    serializer_class = RotatingTokenRefreshSerializer
+
+
+# ============================
+# POST /security/api/token/verify/
+# ============================
+class RevocationAwareTokenVerifyView(TokenVerifyView):
+    serializer_class = RevocationAwareTokenVerifySerializer
+
+
+# ============================
+# POST /security/api/token/revoke/
+# ============================
+class TokenRevokeView(TokenViewBase):
+    serializer_class = TokenRevokeSerializer
+
+    def post(self, request, *args, **kwargs):
+        super().post(request, *args, **kwargs)
+        return Response(status=status.HTTP_205_RESET_CONTENT)
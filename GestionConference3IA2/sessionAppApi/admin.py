@@ -1,3 +1,28 @@
 from django.contrib import admin
+from .models import Registration
+from .registration import cancel
 
-# Register your models here.
+
+@admin.action(description="Annuler les inscriptions (la liste d'attente avance)")
+def cancel_selected(modeladmin, request, queryset):
+    for registration in queryset.exclude(status=Registration.CANCELLED):
+        cancel(registration)
+
+
+@admin.register(Registration)
+class RegistrationAdmin(admin.ModelAdmin):
+    list_display = ("user", "session", "status", "created_at", "promoted_at")
+    list_filter = ("status",)
+    list_select_related = ("user", "session")
+    raw_id_fields = ("user", "session")
+    actions = [cancel_selected]
+
+    # Ajout / suppression directs : le compteur de places de la session serait faux
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class SessionappapiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'sessionAppApi'
+
+    def ready(self):
+        from . import signals  # noqa: F401
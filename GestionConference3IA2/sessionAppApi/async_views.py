@@ -0,0 +1,103 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from SessionApp.models import Session
+from UserApp.models import User
+from .serializers import SessionSerializer
+from .signals import SESSION_DETAIL_CACHE_KEY, SESSION_LIST_CACHE_KEY
+
+jwt_auth = JWTAuthentication()
+
+
+def _cache_timeout():
+    return getattr(settings, "ASYNC_VIEWS_CACHE_TIMEOUT", 30)
+
+
+# ============================
+# AUTHENTIFICATION JWT asynchrone
+# ============================
+async def authenticate_async(request):
+    """
+    Équivalent asynchrone de JWTAuthentication.authenticate() :
+    la vérification de la signature ne touche pas la base, et la
+    recherche de l'utilisateur se fait avec aget() au lieu d'un thread.
+    Renvoie None si le token est absent, invalide ou l'utilisateur inactif.
+    """
+    return await authenticate_header_async(jwt_auth.get_header(request))
+
+
+async def authenticate_header_async(header):
+    """ Même chose à partir de l'en-tête Authorization brut (bytes), hors requête Django. """
+    token = validated_token(header)
+    if token is None:
+        return None
+    return await active_user_async(token)
+
+
+def validated_token(header):
+    """ Token de l'en-tête Authorization (signature et expiration vérifiées, sans la base), None sinon. """
+    if header is None:
+        return None
+    raw_token = jwt_auth.get_raw_token(header)
+    if raw_token is None:
+        return None
+    try:
+        token = jwt_auth.get_validated_token(raw_token)
+        token[api_settings.USER_ID_CLAIM]
+    except (InvalidToken, TokenError, KeyError):
+        return None
+    return token
+
+
+async def active_user_async(token):
+    try:
+        return await User.objects.aget(**{api_settings.USER_ID_FIELD: token[api_settings.USER_ID_CLAIM], "is_active": True})
+    except User.DoesNotExist:
+        return None
+
+
+def _unauthorized():
+    return JsonResponse(
+        {"detail": "Authentication credentials were not provided or are invalid."},
+        status=401,
+    )
+
+
+# ============================
+# GET /api/async/sessions/
+# ============================
+async def session_list_async(request):
+    """
+    Chemin de lecture asynchrone de SessionViewSet.list().
+    Les écritures restent sur le ViewSet DRF synchrone.
+    """
+    if await authenticate_async(request) is None:
+        return _unauthorized()
+
+    data = await cache.aget(SESSION_LIST_CACHE_KEY)
+    if data is None:
+        data = [SessionSerializer(s).data async for s in Session.objects.all().aiterator()]
+        await cache.aset(SESSION_LIST_CACHE_KEY, data, _cache_timeout())
+    return JsonResponse(data, safe=False)
+
+
+# ============================
+# GET /api/async/sessions/<pk>/
+# ============================
+async def session_detail_async(request, pk):
+    if await authenticate_async(request) is None:
+        return _unauthorized()
+
+    key = SESSION_DETAIL_CACHE_KEY.format(pk=pk)
+    data = await cache.aget(key)
+    if data is None:
+        try:
+            session = await Session.objects.aget(pk=pk)
+        except Session.DoesNotExist:
+            return JsonResponse({"detail": "No Session matches the given query."}, status=404)
+        data = SessionSerializer(session).data
+        await cache.aset(key, data, _cache_timeout())
+    return JsonResponse(data)
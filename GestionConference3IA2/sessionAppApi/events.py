@@ -0,0 +1,221 @@
+"""
+Diffusion en direct des changements de sessions (Server-Sent Events).
+
+Les signaux de Session écrivent dans le journal SessionChange ; dans chaque
+processus ASGI, une seule tâche lit la suite du journal et la distribue aux
+files des clients abonnés à la conférence. Le journal est la source unique :
+l'ordre est celui des id, un client qui se reconnecte reprend après son
+Last-Event-ID, et les changements faits dans un autre processus (autre
+worker, admin en WSGI, commande) arrivent aussi, au plus POLL_INTERVAL plus tard.
+
+Ce module n'importe ni DRF ni simplejwt : il est chargé par les signaux.
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict, deque
+from django.conf import settings
+from django.db import DatabaseError
+from django.core.serializers.json import DjangoJSONEncoder
+from .models import SessionChange
+
+logger = logging.getLogger(__name__)
+
+# ============================
+# Paramètres (surchargeables dans settings.SESSION_EVENTS)
+# ============================
+DEFAULTS = {
+    "HEARTBEAT": 15,          # secondes entre deux commentaires ": ping" (proxys, détection des coupures)
+    "POLL_INTERVAL": 2,       # lecture du journal quand aucun signal local ne réveille la tâche
+    "BUFFER_SIZE": 100,       # événements en attente par client ; au-delà le client est déconnecté
+    "RESUME_LIMIT": 1000,     # événements rejoués au plus lors d'une reprise (sinon "reset")
+    "RETENTION_DAYS": 7,      # durée de conservation du journal (prune_session_changes)
+    "RETRY_MS": 3000,         # délai de reconnexion conseillé au navigateur
+}
+
+FIELDS = (
+    "session_id", "title", "topic", "session_day", "start_time", "end_time",
+    "room", "capacity", "conference_id", "version",
+)
+
+
+def events_setting(name):
+    return getattr(settings, "SESSION_EVENTS", {}).get(name, DEFAULTS[name])
+
+
+def session_payload(session):
+    return json.loads(json.dumps({name: getattr(session, name) for name in FIELDS}, cls=DjangoJSONEncoder))
+
+
+def format_event(change):
+    """ Un SessionChange au format text/event-stream. """
+    data = json.dumps({
+        "action": change.get_action_display(),
+        "session_id": change.session_id,
+        "conference_id": change.conference_id,
+        "session": change.data,
+    }, separators=(",", ":"))
+    return f"id: {change.id}\nevent: session.{change.get_action_display()}\ndata: {data}\n\n"
+
+
+# ============================
+# ABONNÉS ET DIFFUSION
+# ============================
+class Subscriber:
+    """
+    Tampon borné d'un client. Volontairement plus léger qu'une asyncio.Queue
+    (quatre files internes) et sans tâche par attente comme wait_for() :
+    un client inactif n'a qu'une Future et un minuteur.
+    """
+    __slots__ = ("conference_id", "buffer", "waiter", "closed")
+
+    def __init__(self, conference_id):
+        self.conference_id = conference_id
+        self.buffer = deque()
+        self.waiter = None
+        self.closed = False
+
+    def push(self, change):
+        """ Faux si le tampon est plein (client trop lent). """
+        if len(self.buffer) >= events_setting("BUFFER_SIZE"):
+            return False
+        self.buffer.append(change)
+        self._wake()
+        return True
+
+    def close(self):
+        self.closed = True
+        self.buffer.clear()
+        self._wake()
+
+    def _wake(self):
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    async def wait(self, timeout):
+        """ Attend un événement, la fermeture ou la fin du délai (battement de cœur). """
+        if self.buffer or self.closed:
+            return
+        loop = asyncio.get_running_loop()
+        self.waiter = loop.create_future()
+        timer = loop.call_later(timeout, self._wake)
+        try:
+            await self.waiter
+        finally:
+            timer.cancel()
+            self.waiter = None
+
+
+class Broker:
+    """
+    Abonnements en mémoire, par conférence (None : toutes). Une tâche de
+    lecture du journal par boucle d'événements, arrêtée sans abonné.
+    """
+
+    def __init__(self):
+        self.loop = None
+        self.subscribers = defaultdict(set)
+        self.last_id = 0
+        self._wake = None
+        self._task = None
+
+    def __len__(self):
+        return sum(len(subs) for subs in self.subscribers.values())
+
+    async def subscribe(self, conference_id=None):
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            # Nouvelle boucle (tests, rechargement) : les abonnés de l'ancienne sont morts
+            self.loop, self.subscribers, self._wake, self._task = loop, defaultdict(set), asyncio.Event(), None
+        if self._task is None or self._task.done():
+            self.last_id = await latest_change_id()
+            self._task = loop.create_task(self._tail())
+        subscriber = Subscriber(conference_id)
+        self.subscribers[conference_id].add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        subs = self.subscribers.get(subscriber.conference_id)
+        if subs is not None:
+            subs.discard(subscriber)
+            if not subs:
+                del self.subscribers[subscriber.conference_id]
+
+    def wake(self):
+        """ Appelé après le commit d'un changement (depuis n'importe quel thread). """
+        loop, wake = self.loop, self._wake
+        if loop is not None and wake is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wake.set)
+
+    def publish(self, change):
+        for conference_id in (change.conference_id, None):
+            for subscriber in list(self.subscribers.get(conference_id, ())):
+                if not subscriber.push(change):
+                    # Client trop lent : on coupe son flux, il reprendra depuis le journal
+                    self.unsubscribe(subscriber)
+                    subscriber.close()
+
+    async def _tail(self):
+        while self.subscribers:
+            try:
+                await asyncio.wait_for(self._wake.wait(), events_setting("POLL_INTERVAL"))
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                async for change in SessionChange.objects.filter(id__gt=self.last_id).order_by("id"):
+                    self.publish(change)
+                    self.last_id = change.id
+            except DatabaseError:
+                # Base momentanément indisponible (verrou...) : nouvel essai au tour suivant
+                logger.exception("Lecture du journal des sessions impossible")
+
+
+broker = Broker()
+
+
+async def latest_change_id():
+    last = await SessionChange.objects.order_by("-id").values_list("id", flat=True).afirst()
+    return last or 0
+
+
+async def stream(subscriber, last_event_id=None):
+    """
+    Générateur text/event-stream d'un client : reprise depuis le journal si
+    Last-Event-ID est fourni, puis événements en direct et battements de cœur.
+    """
+    yield f"retry: {events_setting('RETRY_MS')}\n\n"
+    sent = 0
+    try:
+        if last_event_id is not None:
+            changes = SessionChange.objects.filter(id__gt=last_event_id).order_by("id")
+            if subscriber.conference_id is not None:
+                changes = changes.filter(conference_id=subscriber.conference_id)
+            limit = events_setting("RESUME_LIMIT")
+            replay = [change async for change in changes[:limit + 1]]
+            oldest = await SessionChange.objects.order_by("id").values_list("id", flat=True).afirst()
+            if len(replay) > limit or (oldest is not None and oldest > last_event_id + 1):
+                # Trop de retard (ou journal purgé) : le client recharge la liste complète
+                sent = await latest_change_id()
+                yield f"id: {sent}\nevent: reset\ndata: {{}}\n\n"
+                replay = []
+            for change in replay:
+                yield format_event(change)
+                sent = change.id
+        heartbeat = events_setting("HEARTBEAT")
+        while True:
+            await subscriber.wait(heartbeat)
+            if subscriber.closed:
+                # Déconnexion, ou tampon plein : le navigateur se reconnecte avec Last-Event-ID
+                return
+            if not subscriber.buffer:
+                yield ": ping\n\n"
+                continue
+            while subscriber.buffer:
+                change = subscriber.buffer.popleft()
+                if change.id > sent:
+                    yield format_event(change)
+                    sent = change.id
+    finally:
+        broker.unsubscribe(subscriber)
@@ -0,0 +1,98 @@
+"""
+Chargement groupé des relations de l'API des conférences (?include=...).
+
+Un BatchLoader reçoit d'abord toutes les clés de la page (prime), puis, au
+premier load(), récupère toutes les valeurs en UNE requête. Le nombre de
+requêtes dépend donc du nombre de relations demandées, pas de la taille
+de la page (pas de N+1 comme avec des serializers imbriqués).
+"""
+
+from collections import defaultdict
+from django.db.models import Count
+from ConferenceApp.models import Submission
+from SessionApp.models import Session
+from UserApp.models import OrganizingCommittee
+
+
+class BatchLoader:
+    """ fetch(clés) -> {clé: valeur} ; `default` pour les clés sans valeur. """
+
+    def __init__(self, fetch, default=None):
+        self.fetch = fetch
+        self.default = default
+        self._pending = set()
+        self._values = {}
+
+    def prime(self, keys):
+        self._pending.update(key for key in keys if key not in self._values)
+
+    def load(self, key):
+        if key not in self._values:
+            self._pending.add(key)
+            keys, self._pending = self._pending, set()
+            found = self.fetch(keys)
+            self._values.update({k: found.get(k, self._default()) for k in keys})
+        return self._values[key]
+
+    def _default(self):
+        return self.default() if callable(self.default) else self.default
+
+
+# ============================
+# RELATIONS D'UNE CONFÉRENCE (une requête par relation)
+# ============================
+SESSION_FIELDS = (
+    "session_id", "title", "topic", "session_day", "start_time", "end_time", "room", "capacity", "seats_taken",
+)
+
+
+def fetch_sessions(conference_ids):
+    sessions = defaultdict(list)
+    for row in (
+        Session.objects.filter(conference_id__in=conference_ids)
+        .order_by("session_day", "start_time", "session_id")
+        .values("conference_id", *SESSION_FIELDS)
+    ):
+        sessions[row.pop("conference_id")].append(row)
+    return sessions
+
+
+def fetch_committee(conference_ids):
+    # Nom et rôle uniquement : pas d'e-mail dans une API publique
+    committee = defaultdict(list)
+    for conference_id, first_name, last_name, role, join_date in (
+        OrganizingCommittee.objects.filter(conference_id__in=conference_ids)
+        .order_by("join_date", "pk")
+        .values_list("conference_id", "user__first_name", "user__last_name", "commitee_role", "join_date")
+    ):
+        committee[conference_id].append(
+            {"name": f"{first_name} {last_name}".strip(), "role": role, "join_date": join_date}
+        )
+    return committee
+
+
+def fetch_stats(conference_ids):
+    stats = defaultdict(_empty_stats)
+    for conference_id, status, count in (
+        Submission.objects.filter(conference_id__in=conference_ids)
+        .order_by().values_list("conference_id", "status").annotate(count=Count("pk"))
+    ):
+        stats[conference_id]["submissions"] += count
+        stats[conference_id]["by_status"][status] = count
+    return stats
+
+
+def _empty_stats():
+    return {"submissions": 0, "by_status": {}}
+
+
+RELATIONS = {
+    "sessions": (fetch_sessions, list),
+    "committee": (fetch_committee, list),
+    "stats": (fetch_stats, _empty_stats),
+}
+
+
+def conference_loaders(includes):
+    """ Un loader par relation demandée, partagé par toute la requête. """
+    return {name: BatchLoader(*RELATIONS[name]) for name in includes}
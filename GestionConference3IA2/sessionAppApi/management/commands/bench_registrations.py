@@ -0,0 +1,117 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time as dtime
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.db.models import Count
+from GestionConference3IA2.benchmark import disk_test_database, summarize
+from ConferenceApp.models import Conference
+from SessionApp.models import Session
+from UserApp.models import User
+from sessionAppApi.models import Registration
+from sessionAppApi.registration import register
+
+
+class Command(BaseCommand):
+    help = (
+        "Vague d'inscriptions concurrentes sur une même session (base SQLite de test "
+        "sur disque, en WAL) : vérifie qu'il n'y a ni surréservation ni doublon et "
+        "mesure le débit seconde par seconde."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bookers", type=int, default=500, help="participants qui réservent")
+        parser.add_argument("--threads", type=int, default=64, help="réservations en parallèle")
+        parser.add_argument("--capacity", type=int, default=100)
+        parser.add_argument("--retries", type=int, default=1,
+                            help="rejeux de chaque POST avec la même clé d'idempotence")
+        parser.add_argument("--json", action="store_true", help="sortie JSON uniquement")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("Ce benchmark vise SQLite (une base de test est créée sur disque).")
+        with disk_test_database("bench_registrations"):
+            report = self._run(options)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report))
+            return
+        self.stdout.write(
+            f"{report['bookers']} participants, {report['threads']} en parallèle, capacité {report['capacity']}"
+        )
+        self.stdout.write(
+            f"confirmées {report['confirmed']}  en attente {report['waitlisted']}  "
+            f"places prises {report['seats_taken']}  doublons {report['duplicates']}  erreurs {report['errors']}"
+        )
+        s = report["latency"]
+        self.stdout.write(f"{s['rps']} réservations/s  p50 {s['p50_ms']} ms  p95 {s['p95_ms']} ms  p99 {s['p99_ms']} ms")
+        self.stdout.write(f"débit par seconde : {report['per_second']}")
+        style = self.style.ERROR if report["overbooked"] else self.style.SUCCESS
+        self.stdout.write(style("surréservation !" if report["overbooked"] else "aucune surréservation"))
+
+    def _run(self, options):
+        conference = Conference.objects.create(
+            name="Bench", theme="IA", location="Tunis", description="bench",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        session = Session.objects.create(
+            title="Keynote", topic="IA", session_day=date(2026, 5, 1), room="Salle 1",
+            start_time=dtime(9), end_time=dtime(10), capacity=options["capacity"], conference=conference,
+        )
+        password = make_password("Bench-Pass-2025")
+        users = User.objects.bulk_create([
+            User(user_id=f"BOOK{i:04X}", username=f"booker_{i}", email=f"booker{i}@esprit.tn",
+                 first_name="Book", last_name="Er", password=password)
+            for i in range(options["bookers"])
+        ])
+
+        latencies, finished, errors = [], [], []
+        lock = threading.Lock()
+
+        def book(user):
+            try:
+                for attempt in range(1 + options["retries"]):
+                    start = time.perf_counter()
+                    register(session.pk, user, idempotency_key=f"bench-{user.user_id}")
+                    end = time.perf_counter()
+                    with lock:
+                        latencies.append(end - start)
+                        finished.append(end)
+            except Exception as exc:  # noqa: BLE001 (compté et rapporté)
+                with lock:
+                    errors.append(repr(exc))
+            finally:
+                # Une connexion par thread : fermée avant la fin du thread
+                connections.close_all()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["threads"]) as pool:
+            list(pool.map(book, users))
+        elapsed = time.perf_counter() - start
+
+        per_second = [0] * (int(elapsed) + 1)
+        for end in finished:
+            per_second[int(end - start)] += 1
+        counts = dict(Registration.objects.values_list("status").annotate(n=Count("pk")))
+        session.refresh_from_db()
+        duplicates = (
+            Registration.objects.values("user").annotate(n=Count("pk")).filter(n__gt=1).count()
+        )
+        return {
+            "bookers": options["bookers"],
+            "threads": options["threads"],
+            "capacity": session.capacity,
+            "confirmed": counts.get(Registration.CONFIRMED, 0),
+            "waitlisted": counts.get(Registration.WAITLISTED, 0),
+            "seats_taken": session.seats_taken,
+            "duplicates": duplicates,
+            "errors": len(errors),
+            "first_error": errors[0] if errors else None,
+            "overbooked": session.seats_taken > session.capacity
+            or counts.get(Registration.CONFIRMED, 0) != session.seats_taken,
+            "latency": summarize(latencies, elapsed, len(errors)),
+            "per_second": per_second,
+        }
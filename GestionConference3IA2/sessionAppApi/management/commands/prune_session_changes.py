@@ -0,0 +1,20 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from sessionAppApi.events import events_setting
+from sessionAppApi.models import SessionChange
+
+
+class Command(BaseCommand):
+    help = (
+        "Supprime du journal des sessions (flux SSE) les changements plus anciens que "
+        "SESSION_EVENTS['RETENTION_DAYS']. Un client qui reprend au-delà reçoit un événement reset."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None, help="durée de conservation (jours)")
+
+    def handle(self, *args, **options):
+        days = options["days"] if options["days"] is not None else events_setting("RETENTION_DAYS")
+        deleted, _ = SessionChange.objects.filter(timestamp__lt=timezone.now() - timedelta(days=days)).delete()
+        self.stdout.write(f"{deleted} changements supprimés (plus de {days} jours)")
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-19 15:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sessionAppApi', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionChange',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('conference_id', models.IntegerField()),
+                ('session_id', models.IntegerField()),
+                ('action', models.PositiveSmallIntegerField(choices=[(1, 'created'), (2, 'updated'), (3, 'deleted')])),
+                ('data', models.JSONField(null=True)),
+                ('timestamp', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['conference_id', 'id'], name='session_change_conf_idx'), models.Index(fields=['timestamp'], name='session_change_time_idx')],
+            },
+        ),
+    ]
@@ -1,3 +1,81 @@
 from django.db import models
 
-# Create your models here.
+
+# ============================
+# INSCRIPTION D'UN PARTICIPANT À UNE SESSION
+# ============================
+class Registration(models.Model):
+    CONFIRMED = "confirmed"
+    WAITLISTED = "waitlisted"
+    CANCELLED = "cancelled"
+    STATUS = [
+        (CONFIRMED, "confirmed"),
+        (WAITLISTED, "waitlisted"),
+        (CANCELLED, "cancelled"),
+    ]
+
+    # Sans contrainte en base : les sessions archivées (archiveApp) gardent leurs
+    # inscriptions, qui retrouvent leur session à la restauration (même identifiant)
+    session = models.ForeignKey(
+        "SessionApp.Session", on_delete=models.CASCADE, db_constraint=False, related_name="registrations",
+    )
+    user = models.ForeignKey("UserApp.User", on_delete=models.CASCADE, related_name="registrations")
+    status = models.CharField(max_length=20, choices=STATUS)
+
+    # En-tête Idempotency-Key du client : un POST rejoué renvoie la même inscription
+    idempotency_key = models.CharField(max_length=64, unique=True, null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    promoted_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            # Une seule inscription active par participant et par session
+            models.UniqueConstraint(
+                fields=["session", "user"], condition=~models.Q(status="cancelled"),
+                name="registration_active_unique",
+            ),
+        ]
+        indexes = [
+            # Liste d'attente d'une session, dans l'ordre d'arrivée
+            models.Index(fields=["session", "status", "id"], name="registration_waitlist_idx"),
+            models.Index(fields=["user", "status"], name="registration_user_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} -> session {self.session_id} ({self.status})"
+
+
+# ============================
+# JOURNAL DES CHANGEMENTS DE SESSIONS (flux SSE)
+# ============================
+class SessionChange(models.Model):
+    """
+    Une ligne par création / modification / suppression de session, en ajout
+    seul. L'id sert d'identifiant d'événement SSE : un client qui se
+    reconnecte avec Last-Event-ID reçoit les lignes suivantes.
+    """
+    CREATED, UPDATED, DELETED = 1, 2, 3
+    ACTIONS = [
+        (CREATED, "created"),
+        (UPDATED, "updated"),
+        (DELETED, "deleted"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    # Simples entiers : le journal survit à la suppression de la session
+    conference_id = models.IntegerField()
+    session_id = models.IntegerField()
+    action = models.PositiveSmallIntegerField(choices=ACTIONS)
+    data = models.JSONField(null=True)
+    timestamp = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Reprise d'un flux par conférence à partir de Last-Event-ID
+            models.Index(fields=["conference_id", "id"], name="session_change_conf_idx"),
+            models.Index(fields=["timestamp"], name="session_change_time_idx"),
+        ]
+
+    def __str__(self):
+        return f"#{self.id} session {self.session_id} {self.get_action_display()}"
@@ -0,0 +1,49 @@
+from rest_framework import permissions
+from UserApp.permissions import get_committee_permissions
+
+
+def _target_conference(request):
+    """
+    Conférence visée par le corps de la requête : None si le champ est absent,
+    False s'il n'est pas un identifiant entier (requête refusée).
+    """
+    conference = request.data.get("conference")
+    if conference in (None, ""):
+        return None
+    try:
+        return int(conference)
+    except (TypeError, ValueError):
+        return False
+
+
+class IsConferenceEditorOrReadOnly(permissions.BasePermission):
+    """
+    Lecture pour tout utilisateur authentifié ; écriture réservée au
+    président / co-président du comité de la conférence de la session.
+    Un PUT/PATCH qui déplace la session doit aussi avoir les droits sur la
+    conférence d'arrivée. Les droits sont chargés une seule fois par requête.
+    """
+
+    def has_permission(self, request, view):
+        # Pour les autres méthodes d'écriture, l'objet est vérifié dans has_object_permission
+        if request.method != "POST":
+            return True
+        conference = _target_conference(request)
+        if conference is None:
+            # Champ manquant : le serializer le signale (400)
+            return True
+        return conference is not False and get_committee_permissions(request).can_edit_conference(conference)
+
+    def has_object_permission(self, request, view, obj):
+        if request.method in permissions.SAFE_METHODS:
+            return True
+        perms = get_committee_permissions(request)
+        if not perms.can_edit_conference(obj.conference_id):
+            return False
+        if request.method in ("PUT", "PATCH"):
+            conference = _target_conference(request)
+            if conference is False:
+                return False
+            if conference is not None and conference != obj.conference_id:
+                return perms.can_edit_conference(conference)
+        return True
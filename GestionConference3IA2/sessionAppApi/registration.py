@@ -0,0 +1,111 @@
+"""
+Inscriptions aux sessions sous forte contention : à l'ouverture, des milliers
+de participants visent les mêmes sessions en quelques secondes.
+
+Les places ne sont jamais lues puis réécrites (read-modify-write) : chaque
+réservation est un UPDATE conditionnel
+    UPDATE session SET seats_taken = seats_taken + 1
+    WHERE session_id = %s AND seats_taken < capacity
+qui réussit ou ne touche aucune ligne. La contrainte session_not_overbooked
+reste le dernier garde-fou côté base.
+"""
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from SessionApp.models import Session
+from .models import Registration
+
+
+class RegistrationConflict(Exception):
+    """ Clé d'idempotence déjà utilisée pour une autre inscription. """
+
+
+def register(session_id, user, idempotency_key=None):
+    """
+    Inscrit `user` à la session : place confirmée s'il en reste, sinon liste
+    d'attente. Renvoie (inscription, créée). Un rejeu (même clé) ou une
+    inscription déjà active renvoie l'inscription existante, sans prendre de place.
+    """
+    try:
+        with transaction.atomic():
+            took_seat = Session.objects.filter(pk=session_id, seats_taken__lt=F("capacity")).update(
+                seats_taken=F("seats_taken") + 1
+            )
+            if not took_seat and not Session.objects.filter(pk=session_id).exists():
+                raise Session.DoesNotExist
+            registration = Registration.objects.create(
+                session_id=session_id, user=user, idempotency_key=idempotency_key,
+                status=Registration.CONFIRMED if took_seat else Registration.WAITLISTED,
+            )
+    except IntegrityError:
+        # La place éventuellement prise a été rendue avec le rollback
+        existing = _existing(session_id, user, idempotency_key)
+        if existing is None:
+            raise RegistrationConflict(idempotency_key)
+        return existing, False
+    return registration, True
+
+
+def _existing(session_id, user, idempotency_key):
+    registrations = Registration.objects.filter(session_id=session_id, user=user)
+    if idempotency_key:
+        replay = registrations.filter(idempotency_key=idempotency_key).first()
+        if replay is not None:
+            return replay
+    return registrations.exclude(status=Registration.CANCELLED).first()
+
+
+def cancel(registration):
+    """ Annule l'inscription ; une place libérée passe au premier de la liste d'attente. """
+    with transaction.atomic():
+        freed = Registration.objects.filter(pk=registration.pk, status=Registration.CONFIRMED).update(
+            status=Registration.CANCELLED
+        )
+        if freed:
+            Session.objects.filter(pk=registration.session_id).update(seats_taken=F("seats_taken") - 1)
+            promote_waitlist([registration.session_id])
+        else:
+            Registration.objects.filter(pk=registration.pk, status=Registration.WAITLISTED).update(
+                status=Registration.CANCELLED
+            )
+    registration.status = Registration.CANCELLED
+
+
+def promote_waitlist(session_ids=None):
+    """
+    Confirme, session par session, autant d'inscrits en attente qu'il y a de
+    places libres : un UPDATE pour les inscriptions, un pour le compteur.
+    Renvoie le nombre d'inscriptions confirmées.
+    """
+    sessions = Session.objects.filter(seats_taken__lt=F("capacity"))
+    if session_ids is not None:
+        sessions = sessions.filter(pk__in=session_ids)
+    promoted = 0
+    for session_id, free in sessions.annotate(free=F("capacity") - F("seats_taken")).values_list("pk", "free"):
+        with transaction.atomic():
+            waiting = list(
+                Registration.objects.filter(session_id=session_id, status=Registration.WAITLISTED)
+                .order_by("pk").values_list("pk", flat=True)[:free]
+            )
+            if not waiting:
+                continue
+            count = Registration.objects.filter(pk__in=waiting, status=Registration.WAITLISTED).update(
+                status=Registration.CONFIRMED, promoted_at=timezone.now()
+            )
+            # Places prises entre-temps par des réservations directes : on abandonne ce lot
+            if not Session.objects.filter(pk=session_id, seats_taken__lte=F("capacity") - count).update(
+                seats_taken=F("seats_taken") + count
+            ):
+                transaction.set_rollback(True)
+                continue
+            promoted += count
+    return promoted
+
+
+def waitlist_position(registration):
+    if registration.status != Registration.WAITLISTED:
+        return None
+    return Registration.objects.filter(
+        session_id=registration.session_id, status=Registration.WAITLISTED, pk__lte=registration.pk
+    ).count()
@@ -1,6 +1,74 @@
 from rest_framework import serializers
+from ConferenceApp.models import Conference
 from SessionApp.models import Session
+from .models import Registration
 class SessionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Session
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+        # Compteur tenu par les inscriptions (sessionAppApi.registration)
+        read_only_fields = ('seats_taken',)
+
+    def validate_capacity(self, value):
+        if self.instance is not None and value < self.instance.seats_taken:
+            raise serializers.ValidationError(f"{self.instance.seats_taken} places sont déjà réservées.")
+        return value
+
+
+class RegistrationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Registration
+        fields = ('id', 'session', 'status', 'created_at', 'promoted_at')
+        read_only_fields = fields
+
+
+# ============================
+# API des conférences (lecture seule) : ?fields= et ?include=
+# ============================
+class ConferenceListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        # Toutes les clés de la page d'abord : chaque relation est lue en une requête
+        items = list(data)
+        for loader in self.context.get("loaders", {}).values():
+            loader.prime(item.pk for item in items)
+        return super().to_representation(items)
+
+
+class ConferenceSerializer(serializers.ModelSerializer):
+    sessions = serializers.SerializerMethodField()
+    committee = serializers.SerializerMethodField()
+    stats = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Conference
+        fields = (
+            'conference_id', 'name', 'theme', 'location', 'description', 'start_date', 'end_date',
+            'sessions', 'committee', 'stats',
+        )
+        list_serializer_class = ConferenceListSerializer
+
+    RELATIONS = ('sessions', 'committee', 'stats')
+
+    def __init__(self, *args, fields=None, include=(), **kwargs):
+        """ fields : champs du modèle gardés (tous si None) ; include : relations ajoutées. """
+        super().__init__(*args, **kwargs)
+        keep = set(include) | set(fields if fields is not None else self.model_fields())
+        keep.add('conference_id')
+        for name in set(self.fields) - keep:
+            self.fields.pop(name)
+
+    @classmethod
+    def model_fields(cls):
+        return [name for name in cls.Meta.fields if name not in cls.RELATIONS]
+
+    def _load(self, relation, conference):
+        return self.context["loaders"][relation].load(conference.pk)
+
+    def get_sessions(self, conference):
+        return self._load('sessions', conference)
+
+    def get_committee(self, conference):
+        return self._load('committee', conference)
+
+    def get_stats(self, conference):
+        return self._load('stats', conference)
@@ -0,0 +1,56 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from SessionApp.models import Session
+from .events import broker, session_payload
+from .models import SessionChange
+from .registration import promote_waitlist
+
+
+# Clés de cache des vues asynchrones (async_views.py). Définies ici pour que
+# les signaux, chargés au démarrage, n'importent pas DRF / simplejwt.
+SESSION_LIST_CACHE_KEY = "api:sessions:liste"
+SESSION_DETAIL_CACHE_KEY = "api:sessions:detail:{pk}"
+
+
+# ============================
+# Invalidation du cache des vues asynchrones
+# ============================
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+def invalidate_session_cache(sender, instance, **kwargs):
+    cache.delete_many([
+        SESSION_LIST_CACHE_KEY,
+        SESSION_DETAIL_CACHE_KEY.format(pk=instance.pk),
+    ])
+
+
+# ============================
+# Capacité augmentée (admin, API) : la liste d'attente avance aussitôt
+# ============================
+@receiver(post_save, sender=Session)
+def promote_after_capacity_change(sender, instance, created, **kwargs):
+    if not created:
+        promote_waitlist([instance.pk])
+
+
+# ============================
+# Journal des changements (flux SSE /api/stream/sessions/)
+# ============================
+@receiver(post_save, sender=Session)
+def log_session_saved(sender, instance, created, **kwargs):
+    SessionChange.objects.create(
+        conference_id=instance.conference_id, session_id=instance.pk,
+        action=SessionChange.CREATED if created else SessionChange.UPDATED, data=session_payload(instance),
+    )
+    # Diffusion immédiate dans ce processus ; les autres lisent le journal périodiquement
+    transaction.on_commit(broker.wake)
+
+
+@receiver(post_delete, sender=Session)
+def log_session_deleted(sender, instance, **kwargs):
+    SessionChange.objects.create(
+        conference_id=instance.conference_id, session_id=instance.pk, action=SessionChange.DELETED,
+    )
+    transaction.on_commit(broker.wake)
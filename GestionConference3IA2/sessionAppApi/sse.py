@@ -0,0 +1,111 @@
+"""
+Point d'entrée ASGI du flux SSE /api/stream/sessions/.
+
+Le routage se fait dans GestionConference3IA2/asgi.py, avant le handler de
+Django : une connexion qui reste ouverte des heures ne garde ni thread
+(ThreadSensitiveContext par requête), ni connexion à la base, ni passage
+par les middlewares synchrones. Un client inactif ne coûte qu'une
+coroutine, une tâche qui attend la déconnexion, un tampon borné et un
+minuteur de battement de cœur.
+"""
+
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from securityConfigApp.revocation import revocation_store
+from .async_views import active_user_async, validated_token
+from .events import broker, stream
+
+
+async def _send_json(send, status, payload):
+    await send({
+        "type": "http.response.start", "status": status,
+        "headers": [(b"content-type", b"application/json")],
+    })
+    await send({"type": "http.response.body", "body": json.dumps(payload).encode()})
+
+
+# Tokens déjà vérifiés (utilisateur actif), par jti : après un redéploiement,
+# des milliers de navigateurs se reconnectent en même temps avec le même token.
+# Une entrée ne dure pas plus que le token, et la révocation est revérifiée à
+# chaque connexion (filtre de Bloom : pas de requête SQL dans le cas courant).
+_verified = {}
+VERIFIED_TTL = 60
+
+
+async def _authenticated(authorization):
+    token = validated_token(authorization)
+    if token is None or "jti" not in token:
+        return False
+    if await sync_to_async(revocation_store.is_token_revoked)(token):
+        _verified.pop(token["jti"], None)
+        return False
+    now = time.time()
+    if _verified.get(token["jti"], 0) > now:
+        return True
+    if await active_user_async(token) is None:
+        return False
+    if len(_verified) > 10000:
+        _verified.clear()
+    _verified[token["jti"]] = min(now + VERIFIED_TTL, token["exp"])
+    return True
+
+
+async def session_events_app(scope, receive, send):
+    """
+    GET /api/stream/sessions/?conference=<id>
+    Authentification JWT par l'en-tête Authorization, ou par le paramètre
+    access_token (EventSource ne peut pas envoyer d'en-tête). Reprise par
+    l'en-tête Last-Event-ID (envoyé par le navigateur à la reconnexion).
+    """
+    headers = dict(scope["headers"])
+    query = {key: values[-1] for key, values in parse_qs(scope.get("query_string", b"").decode()).items()}
+    authorization = headers.get(b"authorization")
+    if authorization is None and "access_token" in query:
+        authorization = f"Bearer {query['access_token']}".encode()
+    if not await _authenticated(authorization):
+        await _send_json(send, 401, {"detail": "Authentication credentials were not provided or are invalid."})
+        return
+
+    conference_id = query.get("conference")
+    last_event_id = headers.get(b"last-event-id", b"").decode() or query.get("last_event_id")
+    if conference_id is not None and not conference_id.isdigit() \
+            or last_event_id is not None and not last_event_id.isdigit():
+        await _send_json(send, 400, {"detail": "conference et Last-Event-ID doivent être des entiers."})
+        return
+
+    subscriber = await broker.subscribe(int(conference_id) if conference_id else None)
+    events = stream(subscriber, int(last_event_id) if last_event_id else None)
+    await send({
+        "type": "http.response.start", "status": 200,
+        "headers": [
+            (b"content-type", b"text/event-stream; charset=utf-8"),
+            (b"cache-control", b"no-cache"),
+            # nginx : pas de mise en tampon de la réponse
+            (b"x-accel-buffering", b"no"),
+        ],
+    })
+
+    async def watch_disconnect():
+        while (await receive())["type"] != "http.disconnect":
+            pass
+        subscriber.close()
+
+    # Une seule tâche en plus de la connexion : elle ferme le flux à la déconnexion
+    reader = asyncio.ensure_future(watch_disconnect())
+    try:
+        async for chunk in events:
+            await send({"type": "http.response.body", "body": chunk.encode(), "more_body": True})
+        if not reader.done():
+            # Tampon plein : fin normale de la réponse
+            await send({"type": "http.response.body", "body": b""})
+    finally:
+        reader.cancel()
+        await events.aclose()
+
+def session_events_unavailable(request):
+    # Même URL sous runserver / WSGI : le flux n'est servi que par l'application ASGI
+    return JsonResponse({"detail": "Flux disponible uniquement via le serveur ASGI (asgi.py)."}, status=501)
@@ -1,3 +1,384 @@
-from django.test import TestCase
+import asyncio
+import json
+import subprocess
+import sys
+import tracemalloc
+from datetime import date, time
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from ConferenceApp.models import Conference, Submission
+from SessionApp.models import Session
+from UserApp.models import OrganizingCommittee, User
+from GestionConference3IA2.asgi import application
+from . import sse
+from .events import broker
+from .models import Registration
+from .registration import cancel, register
 
-# Create your tests here.
+
+class RegistrationTests(TestCase):
+    def setUp(self):
+        conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        self.session = Session.objects.create(
+            title="Keynote", topic="IA", session_day=date(2026, 5, 1), room="Salle 1",
+            start_time=time(9), end_time=time(10), capacity=2, conference=conference,
+        )
+        self.users = [
+            User.objects.create_user(
+                username=f"user{i}", email=f"user{i}@esprit.tn", password="Conf-Pass-2025",
+                first_name="U", last_name=str(i),
+            )
+            for i in range(4)
+        ]
+
+    def _seats(self):
+        self.session.refresh_from_db()
+        return self.session.seats_taken
+
+    def test_capacity_then_waitlist(self):
+        statuses = [register(self.session.pk, user)[0].status for user in self.users]
+        self.assertEqual(statuses, ["confirmed", "confirmed", "waitlisted", "waitlisted"])
+        self.assertEqual(self._seats(), 2)
+
+    def test_replay_does_not_take_a_second_seat(self):
+        first, created = register(self.session.pk, self.users[0], "key-1")
+        again, created_again = register(self.session.pk, self.users[0], "key-1")
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(first.pk, again.pk)
+        self.assertEqual(self._seats(), 1)
+
+    def test_cancel_promotes_waitlist_in_order(self):
+        registrations = [register(self.session.pk, user)[0] for user in self.users]
+        cancel(registrations[0])
+        self.assertEqual(Registration.objects.get(pk=registrations[2].pk).status, "confirmed")
+        self.assertEqual(Registration.objects.get(pk=registrations[3].pk).status, "waitlisted")
+        self.assertEqual(self._seats(), 2)
+
+    def test_capacity_increase_promotes_in_batch(self):
+        for user in self.users:
+            register(self.session.pk, user)
+        self.session.capacity = 10
+        self.session.save()
+        self.assertEqual(Registration.objects.filter(status="confirmed").count(), 4)
+        self.assertEqual(self._seats(), 4)
+
+    def test_api_register_is_idempotent(self):
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.users[0])}"}
+        url = f"/api/sessions/{self.session.pk}/register/"
+        response = self.client.post(url, HTTP_IDEMPOTENCY_KEY="abc", **auth)
+        self.assertEqual(response.status_code, 201)
+        replay = self.client.post(url, HTTP_IDEMPOTENCY_KEY="abc", **auth)
+        self.assertEqual(replay.status_code, 200)
+        self.assertEqual(replay.json()["id"], response.json()["id"])
+        self.assertEqual(self.client.delete(url, **auth).status_code, 204)
+        self.assertEqual(self._seats(), 0)
+
+    def test_registration_list_uses_token_claims(self):
+        for user in self.users[:2]:
+            register(self.session.pk, user)
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.users[1])}"}
+        # Seule la liste des inscriptions est lue : pas de recherche de l'utilisateur
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/registrations/", **auth)
+        self.assertEqual([row["status"] for row in response.json()], ["confirmed"])
+        self.assertEqual(self.client.get("/api/registrations/").status_code, 401)
+
+    def test_if_match_rejects_stale_update(self):
+        OrganizingCommittee.objects.create(
+            user=self.users[0], conference=self.session.conference, commitee_role="chair",
+            join_date=date(2026, 1, 1),
+        )
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.users[0])}"}
+        url = f"/api/sessions/{self.session.pk}/"
+        tag = self.client.get(url, **auth)["ETag"]
+        ok = self.client.patch(url, {"room": "Salle 2"}, content_type="application/json", HTTP_IF_MATCH=tag, **auth)
+        self.assertEqual(ok.status_code, 200)
+        self.assertNotEqual(ok["ETag"], tag)
+        stale = self.client.patch(url, {"room": "Salle 3"}, content_type="application/json", HTTP_IF_MATCH=tag, **auth)
+        self.assertEqual(stale.status_code, 412)
+        self.assertEqual(stale.json()["current"]["room"], "Salle 2")
+        self.assertEqual(stale["ETag"], ok["ETag"])
+
+
+class SessionPermissionTests(TestCase):
+    def setUp(self):
+        self.own, self.other = [
+            Conference.objects.create(
+                name=name, theme="IA", location="Tunis", description="desc",
+                start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+            )
+            for name in ("Conf", "Autre")
+        ]
+        self.session = Session.objects.create(
+            title="Keynote", topic="IA", session_day=date(2026, 5, 1), room="Salle 1",
+            start_time=time(9), end_time=time(10), capacity=2, conference=self.own,
+        )
+        chair = User.objects.create_user(
+            username="chair", email="chair@esprit.tn", password="Conf-Pass-2025", first_name="C", last_name="P",
+        )
+        OrganizingCommittee.objects.create(
+            user=chair, conference=self.own, commitee_role="chair", join_date=date(2026, 1, 1),
+        )
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(chair)}"}
+        self.url = f"/api/sessions/{self.session.pk}/"
+
+    def test_cannot_move_session_to_foreign_conference(self):
+        for method in ("put", "patch"):
+            data = {
+                "title": "Keynote", "topic": "IA", "session_day": "2026-05-01", "room": "Salle 1",
+                "start_time": "09:00", "end_time": "10:00", "capacity": 2, "conference": self.other.pk,
+            }
+            response = getattr(self.client, method)(self.url, data, content_type="application/json", **self.auth)
+            self.assertEqual(response.status_code, 403)
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.conference_id, self.own.pk)
+        same = self.client.patch(self.url, {"conference": self.own.pk}, content_type="application/json", **self.auth)
+        self.assertEqual(same.status_code, 200)
+
+    def test_non_integer_conference_is_refused(self):
+        data = {"conference": "abc"}
+        self.assertEqual(self.client.post("/api/sessions/", data, **self.auth).status_code, 403)
+        patch = self.client.patch(self.url, data, content_type="application/json", **self.auth)
+        self.assertEqual(patch.status_code, 403)
+
+
+class AsyncSessionViewsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        self.sessions = [
+            Session.objects.create(
+                title=f"Session {k}", topic="IA", session_day=date(2026, 5, 1), room=f"Salle {k}",
+                start_time=time(9 + k), end_time=time(10 + k), conference=conference,
+            )
+            for k in range(2)
+        ]
+        user = User.objects.create_user(
+            username="reader", email="reader@esprit.tn", password="Conf-Pass-2025", first_name="R", last_name="D",
+        )
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+
+    def test_same_output_as_sync_viewset(self):
+        pk = self.sessions[0].pk
+        self.assertEqual(
+            self.client.get("/api/async/sessions/", **self.auth).json(),
+            self.client.get("/api/sessions/", **self.auth).json(),
+        )
+        self.assertEqual(
+            self.client.get(f"/api/async/sessions/{pk}/", **self.auth).json(),
+            self.client.get(f"/api/sessions/{pk}/", **self.auth).json(),
+        )
+        self.assertEqual(self.client.get("/api/async/sessions/999/", **self.auth).status_code, 404)
+        self.assertEqual(self.client.get("/api/async/sessions/").status_code, 401)
+
+    def test_cache_invalidated_on_save_and_delete(self):
+        session = self.sessions[0]
+        url = f"/api/async/sessions/{session.pk}/"
+        self.client.get("/api/async/sessions/", **self.auth)
+        self.client.get(url, **self.auth)
+        # Servi par le cache : seule la recherche de l'utilisateur touche la base
+        with self.assertNumQueries(1):
+            self.client.get(url, **self.auth)
+
+        session.room = "Amphi"
+        session.save()
+        self.assertEqual(self.client.get(url, **self.auth).json()["room"], "Amphi")
+        rooms = [row["room"] for row in self.client.get("/api/async/sessions/", **self.auth).json()]
+        self.assertIn("Amphi", rooms)
+
+        session.delete()
+        self.assertEqual(self.client.get(url, **self.auth).status_code, 404)
+        self.assertEqual(len(self.client.get("/api/async/sessions/", **self.auth).json()), 1)
+
+
+class ConcurrentBookingTests(SimpleTestCase):
+    def test_no_overbooking_under_contention(self):
+        # Processus séparé : il faut une vraie base sur disque (WAL) et plusieurs connexions
+        proc = subprocess.run(
+            [sys.executable, "manage.py", "bench_registrations", "--bookers", "300", "--threads", "64",
+             "--capacity", "100", "--json"],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=300,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+        report = json.loads(proc.stdout.strip().splitlines()[-1])
+        self.assertFalse(report["overbooked"])
+        self.assertEqual(report["errors"], 0, report["first_error"])
+        self.assertEqual(report["duplicates"], 0)
+        self.assertEqual((report["confirmed"], report["waitlisted"]), (100, 200))
+
+
+class ConferenceApiTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(
+            username="author", email="author@esprit.tn", password="Conf-Pass-2025", first_name="A", last_name="B",
+        )
+
+    def _create_conferences(self, count):
+        for i in range(count):
+            conference = Conference.objects.create(
+                name=f"Conf {i}", theme="IA", location="Tunis", description="desc",
+                start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+            )
+            for k in range(2):
+                Session.objects.create(
+                    title=f"Session {k}", topic="IA", session_day=date(2026, 5, 1), room=f"Salle {k}",
+                    start_time=time(9 + k), end_time=time(10 + k), conference=conference,
+                )
+                Submission.objects.create(
+                    title=f"Article {k}", abstract="Résumé", keywords="IA", paper="papers/a.pdf",
+                    user=self.author, conference=conference,
+                )
+            OrganizingCommittee.objects.create(
+                user=self.author, conference=conference, commitee_role="chair", join_date=date(2026, 1, 1),
+            )
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        url = "/api/conferences/?include=sessions,committee,stats&page_size=100"
+        for count in (2, 40):
+            self._create_conferences(count)
+            # COUNT de la pagination, la page, puis une requête par relation incluse
+            with self.assertNumQueries(5):
+                response = self.client.get(url)
+            self.assertEqual(len(response.json()["results"]), Conference.objects.count())
+        first = response.json()["results"][0]
+        self.assertEqual([s["title"] for s in first["sessions"]], ["Session 0", "Session 1"])
+        self.assertEqual(first["committee"], [{"name": "A B", "role": "chair", "join_date": "2026-01-01"}])
+        self.assertEqual(first["stats"], {"submissions": 2, "by_status": {"submitted": 2}})
+
+    def test_sparse_fields(self):
+        self._create_conferences(1)
+        conference = Conference.objects.get()
+        with self.assertNumQueries(2):
+            data = self.client.get(f"/api/conferences/{conference.pk}/?fields=name&include=stats").json()
+        self.assertEqual(set(data), {"conference_id", "name", "stats"})
+        self.assertNotIn("sessions", self.client.get("/api/conferences/").json()["results"][0])
+        response = self.client.get("/api/conferences/?fields=name,email")
+        self.assertEqual(response.status_code, 400)
+
+
+class SessionEventsTests(TestCase):
+    def setUp(self):
+        self.conference = Conference.objects.create(
+            name="Conf", theme="IA", location="Tunis", description="desc",
+            start_date=date(2026, 5, 1), end_date=date(2026, 5, 3),
+        )
+        self.user = User.objects.create_user(
+            username="viewer", email="viewer@esprit.tn", password="Conf-Pass-2025", first_name="V", last_name="W",
+        )
+        self.token = str(AccessToken.for_user(self.user))
+
+    def _connect(self, closed, query="", last_event_id=None, messages=None):
+        """ Client ASGI minimal : la requête, puis http.disconnect quand `closed` est levé. """
+        headers = [(b"authorization", f"Bearer {self.token}".encode())]
+        if last_event_id is not None:
+            headers.append((b"last-event-id", str(last_event_id).encode()))
+        scope = {
+            "type": "http", "method": "GET", "path": "/api/stream/sessions/",
+            "query_string": query.encode(), "headers": headers,
+        }
+        requested = []
+
+        async def receive():
+            if not requested:
+                requested.append(True)
+                return {"type": "http.request", "body": b""}
+            await closed.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if messages is not None and message["type"] == "http.response.body":
+                messages.append(message["body"].decode())
+
+        return asyncio.ensure_future(application(scope, receive, send))
+
+    async def _wait_subscribers(self, count):
+        for _ in range(600):
+            if len(broker) >= count:
+                return
+            await asyncio.sleep(0.05)
+        self.fail(f"{len(broker)} abonnés sur {count}")
+
+    async def _rejected(self):
+        closed, messages = asyncio.Event(), []
+        client = self._connect(closed, messages=messages)
+        closed.set()
+        await client
+        return any("Authentication credentials" in message for message in messages)
+
+    def _create_session(self, title):
+        return Session.objects.create(
+            title=title, topic="IA", session_day=date(2026, 5, 1), room="Salle 1",
+            start_time=time(9), end_time=time(10), conference=self.conference,
+        )
+
+    async def test_stream_pushes_changes_and_resumes(self):
+        closed, messages = asyncio.Event(), []
+        client = self._connect(closed, f"conference={self.conference.pk}", messages=messages)
+        await self._wait_subscribers(1)
+        session = await sync_to_async(self._create_session)("Keynote")
+        broker.wake()  # pas de on_commit dans un TestCase
+        for _ in range(100):
+            if len(messages) > 1:
+                break
+            await asyncio.sleep(0.05)
+        self.assertTrue(messages[0].startswith("retry:"))
+        self.assertIn("event: session.created", messages[1])
+        self.assertIn('"title":"Keynote"', messages[1])
+        closed.set()
+        await client
+        self.assertEqual(len(broker), 0)
+
+        # Reconnexion avec Last-Event-ID : la salle changée entre-temps est rejouée
+        last_id = int(messages[1].split("\n")[0].removeprefix("id: "))
+        session.room = "Salle 2"
+        await sync_to_async(session.save)()
+        closed, messages = asyncio.Event(), []
+        client = self._connect(closed, f"conference={self.conference.pk}", last_id, messages)
+        await self._wait_subscribers(1)
+        closed.set()
+        await client
+        self.assertIn("event: session.updated", messages[1])
+        self.assertIn('"room":"Salle 2"', messages[1])
+
+    async def test_holds_5000_idle_subscribers(self):
+        closed = asyncio.Event()
+        # Premier client : token vérifié une fois, tâche de lecture du journal démarrée
+        clients = [self._connect(closed)]
+        await self._wait_subscribers(1)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            clients += [self._connect(closed) for _ in range(4999)]
+            await self._wait_subscribers(5000)
+            used = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        closed.set()
+        await asyncio.gather(*clients)
+        # Environ 6 Ko par client inactif (coroutine, tâche de déconnexion, tampon, minuteur)
+        self.assertLess(used / 5000, 16 * 1024)
+        self.assertEqual(len(broker), 0)
+
+    async def test_cached_token_is_rechecked_for_revocation(self):
+        # Token émis avant la désactivation (iat en secondes entières)
+        token = AccessToken.for_user(self.user)
+        token["iat"] -= 10
+        self.token = str(token)
+        sse._verified.clear()
+        self.assertFalse(await self._rejected())
+        self.assertLessEqual(sse._verified[token["jti"]], token["exp"])
+
+        self.user.is_active = False
+        await sync_to_async(self.user.save)()
+        self.assertTrue(await self._rejected())
+        self.assertNotIn(token["jti"], sse._verified)
@@ -1,9 +1,45 @@
-from rest_framework.routers import DefaultRouter
-from .views import SessionViewSet
-from django.urls import path, include
-router = DefaultRouter()
-router.register('sessions', SessionViewSet)
+from django.urls import path
+from GestionConference3IA2.lazy_urls import lazy_view
+
+# Mêmes routes (et mêmes noms) que DefaultRouter().register('sessions', SessionViewSet),
+# mais DRF n'est importé qu'au premier appel de l'API.
 urlpatterns = [
-    path('', include(router.urls)),
+    path('', lazy_view('rest_framework.routers.APIRootView', csrf_exempt=True,
+                       api_root_dict={'sessions': 'session-list', 'registrations': 'registration-list',
+                                      'conferences': 'conference-list'}),
+         name='api-root'),
+    path('sessions/', lazy_view('sessionAppApi.views.SessionViewSet', csrf_exempt=True,
+                                actions={'get': 'list', 'post': 'create'},
+                                basename='session', detail=False), name='session-list'),
+    path('sessions/<int:pk>/', lazy_view('sessionAppApi.views.SessionViewSet', csrf_exempt=True,
+                                         actions={'get': 'retrieve', 'put': 'update',
+                                                  'patch': 'partial_update', 'delete': 'destroy'},
+                                         basename='session', detail=True),
+         name='session-detail'),
+    # Inscriptions aux sessions (places limitées, liste d'attente)
+    path('sessions/<int:pk>/register/', lazy_view('sessionAppApi.views.SessionRegistrationView', csrf_exempt=True),
+         name='session-register'),
+    path('registrations/', lazy_view('sessionAppApi.views.RegistrationViewSet', csrf_exempt=True,
+                                     actions={'get': 'list'}, basename='registration', detail=False),
+         name='registration-list'),
+    path('registrations/<int:pk>/', lazy_view('sessionAppApi.views.RegistrationViewSet', csrf_exempt=True,
+                                              actions={'get': 'retrieve'}, basename='registration', detail=True),
+         name='registration-detail'),
+    # API publique des conférences (lecture seule, ?fields= / ?include=)
+    path('conferences/', lazy_view('sessionAppApi.views.ConferenceViewSet', csrf_exempt=True,
+                                   actions={'get': 'list'}, basename='conference', detail=False),
+         name='conference-list'),
+    path('conferences/<int:pk>/', lazy_view('sessionAppApi.views.ConferenceViewSet', csrf_exempt=True,
+                                            actions={'get': 'retrieve'}, basename='conference', detail=True),
+         name='conference-detail'),
+    # Chemins de lecture asynchrones (ASGI), à côté du ViewSet synchrone
+    path('async/sessions/', lazy_view('sessionAppApi.async_views.session_list_async', is_async=True),
+         name='session_list_async'),
+    path('async/sessions/<int:pk>/', lazy_view('sessionAppApi.async_views.session_detail_async', is_async=True),
+         name='session_detail_async'),
+    # Flux Server-Sent Events des changements de sessions : servi par asgi.py,
+    # cette route ne répond que hors ASGI (runserver, WSGI)
+    path('stream/sessions/', lazy_view('sessionAppApi.sse.session_events_unavailable'),
+         name='session_events'),
 
-]
\ No newline at end of file
+]
@@ -1,8 +1,172 @@
 from django.shortcuts import render
-from rest_framework import viewsets
+from rest_framework import status, viewsets
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from ConferenceApp.models import Conference
+from GestionConference3IA2.concurrency import ConflictError, etag, parse_etag
 from SessionApp.models import Session
-from .serializers import SessionSerializer
+from securityConfigApp.authentication import ClaimsJWTAuthentication
+from .loaders import conference_loaders
+from .models import Registration
+from .permissions import IsConferenceEditorOrReadOnly
+from .registration import RegistrationConflict, cancel, register, waitlist_position
+from .serializers import ConferenceSerializer, RegistrationSerializer, SessionSerializer
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "La session a été modifiée depuis votre lecture : relisez-la (GET) puis réessayez."
+    default_code = "precondition_failed"
+
+
 # Create your views here.
 class SessionViewSet(viewsets.ModelViewSet):
+    """
+    Contrôle de concurrence optimiste : GET renvoie un ETag ("<pk>-<version>") ;
+    un PUT/PATCH avec If-Match n'est appliqué que si la session n'a pas changé
+    depuis (sinon 412 avec la version actuelle, à fusionner côté client).
+    """
     queryset=Session.objects.all()
-    serializer_class=SessionSerializer
\ No newline at end of file
+    serializer_class=SessionSerializer
+    permission_classes=[IsAuthenticated, IsConferenceEditorOrReadOnly]
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        return Response(self.get_serializer(instance).data, headers={"ETag": etag(instance)})
+
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop("partial", False)
+        instance = self.get_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        if_match = request.headers.get("If-Match", "*")
+        if if_match.strip() != "*":
+            expected = parse_etag(if_match, instance)
+            if expected is None:
+                raise PreconditionFailed("If-Match ne correspond pas à cette session.")
+            # Comparée à la version en base par le compare-and-swap du save()
+            instance.version = expected
+        try:
+            serializer.save()
+        except ConflictError as conflict:
+            return self._conflict(conflict.current())
+        return Response(serializer.data, headers={"ETag": etag(instance)})
+
+    def _conflict(self, current):
+        if current is None:
+            return Response({"detail": "No Session matches the given query."}, status=status.HTTP_404_NOT_FOUND)
+        response = Response(
+            {"detail": PreconditionFailed.default_detail, "current": SessionSerializer(current).data},
+            status=status.HTTP_412_PRECONDITION_FAILED,
+        )
+        response["ETag"] = etag(current)
+        return response
+
+
+# ============================
+# POST / DELETE /api/sessions/<pk>/register/
+# ============================
+class SessionRegistrationView(APIView):
+    """
+    POST : réserve une place (ou entre en liste d'attente). L'en-tête
+    Idempotency-Key permet au client de rejouer la requête sans risque.
+    DELETE : annule l'inscription du participant connecté.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        key = request.headers.get("Idempotency-Key") or None
+        if key and len(key) > Registration._meta.get_field("idempotency_key").max_length:
+            return Response({"detail": "Idempotency-Key trop long."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            registration, created = register(pk, request.user, key)
+        except Session.DoesNotExist:
+            return Response({"detail": "No Session matches the given query."}, status=status.HTTP_404_NOT_FOUND)
+        except RegistrationConflict:
+            return Response(
+                {"detail": "Idempotency-Key déjà utilisée pour une autre inscription."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        data = RegistrationSerializer(registration).data
+        data["waitlist_position"] = waitlist_position(registration)
+        return Response(data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
+    def delete(self, request, pk):
+        registration = (
+            Registration.objects.filter(session_id=pk, user=request.user)
+            .exclude(status=Registration.CANCELLED).first()
+        )
+        if registration is None:
+            return Response({"detail": "Aucune inscription active."}, status=status.HTTP_404_NOT_FOUND)
+        cancel(registration)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# ============================
+# GET /api/registrations/ : inscriptions du participant connecté
+# ============================
+class RegistrationViewSet(viewsets.ReadOnlyModelViewSet):
+    serializer_class = RegistrationSerializer
+    permission_classes = [IsAuthenticated]
+    # Lecture seule : l'utilisateur vient des claims du token, sans requête ni cache
+    authentication_classes = [ClaimsJWTAuthentication]
+
+    def get_queryset(self):
+        # Jointure interne : les inscriptions des sessions archivées n'apparaissent pas
+        return (
+            Registration.objects.filter(user_id=self.request.user.user_id)
+            .select_related("session").order_by("-pk")
+        )
+
+
+# ============================
+# GET /api/conferences/ : API publique en lecture seule pour les partenaires
+# ============================
+class ConferencePagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class ConferenceViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    ?fields=name,start_date : champs du modèle renvoyés (tous par défaut) ;
+    ?include=sessions,committee,stats : relations ajoutées, chacune lue en
+    une seule requête pour toute la page (voir loaders.py).
+    """
+    serializer_class = ConferenceSerializer
+    permission_classes = [AllowAny]
+    pagination_class = ConferencePagination
+
+    def _csv_param(self, name, allowed):
+        raw = self.request.query_params.get(name)
+        if raw is None:
+            return None
+        values = [value.strip() for value in raw.split(",") if value.strip()]
+        unknown = sorted(set(values) - set(allowed))
+        if unknown:
+            raise ValidationError({name: f"Inconnu(s) : {', '.join(unknown)}. Possibles : {', '.join(allowed)}."})
+        return values
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.sparse_fields = self._csv_param("fields", ConferenceSerializer.model_fields())
+        self.includes = self._csv_param("include", ConferenceSerializer.RELATIONS) or []
+
+    def get_queryset(self):
+        queryset = Conference.objects.order_by("conference_id")
+        if self.sparse_fields is not None:
+            # Seules les colonnes demandées sont lues
+            queryset = queryset.only("conference_id", *self.sparse_fields)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.sparse_fields)
+        kwargs.setdefault("include", self.includes)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["loaders"] = conference_loaders(getattr(self, "includes", []))
+        return context